@@ -0,0 +1,61 @@
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+import time
+
+# --- 설정 ---
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+DEFAULT_TIMEOUT = 30        # 페이지 준비 최대 대기 시간 (초)
+POLL_INTERVAL = 0.25        # 조건 확인 간격 (초)
+
+
+def create_driver():
+    """헤드리스 Chrome 1개 생성 (크롤러 공용)"""
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument(f"user-agent={USER_AGENT}")
+    return webdriver.Chrome(options=options)
+
+
+# ======================
+# 대기 조건
+# ======================
+def document_ready(driver):
+    return driver.execute_script("return document.readyState") == "complete"
+
+
+def js_array_ready(var_name):
+    """전역 변수 var_name 이 비어있지 않은 배열이 될 때까지"""
+    script = (
+        f"try {{ return Array.isArray({var_name}) && {var_name}.length > 0; }}"
+        " catch (e) { return false; }"
+    )
+    return lambda driver: driver.execute_script(script)
+
+
+def element_present(css_selector):
+    return EC.presence_of_element_located((By.CSS_SELECTOR, css_selector))
+
+
+def open_page(driver, url, condition, timeout=DEFAULT_TIMEOUT):
+    """
+    url 을 열고 condition 이 참이 될 때까지 대기 (고정 sleep 대신)
+    - 반환: 조건 충족 여부 (시간 초과면 False, 이후 처리는 호출한 쪽에서 판단)
+    """
+    start = time.perf_counter()
+    driver.get(url)
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(
+            lambda d: document_ready(d) and condition(d)
+        )
+        print(f"⏱️ 페이지 준비 완료: {time.perf_counter() - start:.1f}초")
+        return True
+    except TimeoutException:
+        print(f"⚠️ {timeout}초 안에 페이지가 준비되지 않음 → 현재 상태로 진행")
+        return False
@@ -0,0 +1,50 @@
+from browser import create_driver
+from extract_unit_data import crawl_unit_data, crawl_unit_data_fast
+from extract_weapons_table import crawl_weapons_table
+import time
+import traceback
+
+
+def run_step(results, name, crawl, *args):
+    print("\n" + "=" * 60)
+    step_start = time.perf_counter()
+    try:
+        results[name] = crawl(*args) is not None
+    except Exception as e:
+        print(f"❌ 오류 발생 ({name}): {e}")
+        traceback.print_exc()
+        results[name] = False
+    print(f"⏱️ {name}: {time.perf_counter() - step_start:.1f}초")
+    return results[name]
+
+
+def main():
+    """
+    unit_data (브라우저 없이 HTTP 우선) + 무기 테이블을 차례로 추출, 브라우저는 1개만 사용
+    - 한쪽이 실패해도 나머지는 계속 진행 (기존 스크립트처럼 이전 데이터로 파이프라인 계속)
+    """
+    start = time.perf_counter()
+    results = {}
+
+    # unit_data: 페이지 소스의 리터럴을 바로 파싱, 실패하면 아래에서 Selenium으로
+    unit_data_ok = run_step(results, "unit_data", crawl_unit_data_fast)
+
+    browser_start = time.perf_counter()
+    driver = create_driver()
+    print(f"\n🌐 브라우저 시작: {time.perf_counter() - browser_start:.1f}초")
+    try:
+        if not unit_data_ok:
+            run_step(results, "unit_data", crawl_unit_data, driver)
+        run_step(results, "weapons", crawl_weapons_table, driver)
+    finally:
+        driver.quit()
+        print("\n✅ 브라우저 종료")
+
+    print(f"\n⏱️ 크롤링 전체: {time.perf_counter() - start:.1f}초")
+    failed = [name for name, ok in results.items() if not ok]
+    if failed:
+        print(f"⚠️ 추출 실패: {', '.join(failed)} (기존 파일 유지)")
+
+
+if __name__ == "__main__":
+    main()
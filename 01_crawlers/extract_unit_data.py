@@ -1,31 +1,112 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-import time
+from browser import USER_AGENT, create_driver, js_array_ready, open_page
+from js_literal import extract_js_var
+import argparse
 import json
 import os
+import requests
+import time
 
 # --- 설정 ---
 TARGET_URL = "https://appmedia.jp/ggene_eternal/78590855"
 OUTPUT_DIR = "02_raw_data"
+HTTP_TIMEOUT = (10, 30)     # (연결, 응답) 초
+
+
+def is_unit_data(value):
+    """unit_data 로 볼 수 있는 값인지 (유닛 dict 목록)"""
+    return (
+        isinstance(value, list)
+        and len(value) > 0
+        and all(isinstance(unit, dict) and "url" in unit and "name" in unit for unit in value)
+    )
+
+
+def save_unit_data(unit_data, data_source):
+    """unit_data.json / unit_data.js 저장"""
+    if not os.path.exists(OUTPUT_DIR):
+        os.makedirs(OUTPUT_DIR)
+    
+    # JSON 파일로 저장
+    output_file = f"{OUTPUT_DIR}/unit_data.json"
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(unit_data, f, ensure_ascii=False, indent=2)
+    
+    # JavaScript 파일로도 저장
+    js_output_file = f"{OUTPUT_DIR}/unit_data.js"
+    with open(js_output_file, 'w', encoding='utf-8') as f:
+        f.write("var unit_data = ")
+        json.dump(unit_data, f, ensure_ascii=False, indent=2)
+        f.write(";")
+    
+    print(f"\n🎉 성공!")
+    print(f"   데이터 소스: {data_source}")
+    print(f"   총 {len(unit_data)}개 유닛 데이터 추출")
+    print(f"   JSON 파일: {output_file}")
+    print(f"   JS 파일: {js_output_file}")
+    
+    # 샘플 데이터 출력
+    print(f"\n📄 샘플 데이터 (첫 번째 항목):")
+    print(json.dumps(unit_data[0], ensure_ascii=False, indent=2))
+
+
+# ======================
+# 브라우저 없이 추출 (HTTP 1회 + 페이지 소스의 unit_data 리터럴 파싱)
+# ======================
+def fetch_page_source(url):
+    response = requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=HTTP_TIMEOUT)
+    response.raise_for_status()
+    # charset 이 없으면 requests 기본값(ISO-8859-1) 대신 UTF-8
+    if "charset" not in response.headers.get("Content-Type", "").lower():
+        response.encoding = "utf-8"
+    return response.text
+
+
+def crawl_unit_data_fast(html_file=None):
+    """
+    브라우저 없이 unit_data 추출 + 저장
+    - html_file: 저장된 페이지로 오프라인 추출 (없으면 TARGET_URL 요청)
+    - 반환: unit_data (실패 시 None → Selenium으로 대체)
+    """
+    start = time.perf_counter()
+    source = html_file or TARGET_URL
+    print(f"[{source}] unit_data 추출 시작 (브라우저 없이)...")
+    try:
+        if html_file:
+            with open(html_file, 'r', encoding='utf-8') as f:
+                page_source = f.read()
+        else:
+            page_source = fetch_page_source(TARGET_URL)
+    except (OSError, requests.RequestException) as e:
+        print(f"⚠️ 페이지를 가져오지 못함: {e}")
+        return None
+    
+    unit_data = extract_js_var(page_source, "unit_data", validate=is_unit_data)
+    if unit_data is None:
+        print("⚠️ 페이지 소스에서 unit_data 리터럴을 찾지/파싱하지 못함")
+        return None
+    
+    print(f"⏱️ {time.perf_counter() - start:.1f}초")
+    save_unit_data(unit_data, f"page source literal ({source})")
+    return unit_data
 
-options = Options()
-options.add_argument("--headless")
-options.add_argument("--no-sandbox")
-options.add_argument("--disable-dev-shm-usage")
-options.add_argument("--window-size=1920,1080")
-options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
 
-driver = webdriver.Chrome(options=options)
+# ======================
+# Selenium 추출
+# ======================
 
-print(f"[{TARGET_URL}] unit_data 추출 시작...")
+def crawl_unit_data(driver):
+    """
+    열려 있는 브라우저로 unit_data 추출 + 저장
+    - 반환: unit_data (실패 시 None)
+    """
+    print(f"[{TARGET_URL}] unit_data 추출 시작...")
+    unit_data = None
+    data_source = None
 
-try:
-    driver.get(TARGET_URL)
     print("⏳ 페이지 로딩 중...")
     
-    # 페이지가 완전히 로드될 때까지 대기
-    time.sleep(10)  # JavaScript 실행 시간 충분히 대기
+    # unit_data 배열이 준비될 때까지 대기 (고정 sleep 대신)
+    open_page(driver, TARGET_URL, js_array_ready("unit_data"))
     
     # 방법 1: window 객체에서 unit_data 변수 찾기
     print("\n📊 방법 1: window.unit_data 체크...")
@@ -131,30 +212,7 @@ try:
     
     # 결과 저장
     if unit_data and len(unit_data) > 0:
-        if not os.path.exists(OUTPUT_DIR):
-            os.makedirs(OUTPUT_DIR)
-        
-        # JSON 파일로 저장
-        output_file = f"{OUTPUT_DIR}/unit_data.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(unit_data, f, ensure_ascii=False, indent=2)
-        
-        # JavaScript 파일로도 저장
-        js_output_file = f"{OUTPUT_DIR}/unit_data.js"
-        with open(js_output_file, 'w', encoding='utf-8') as f:
-            f.write("var unit_data = ")
-            json.dump(unit_data, f, ensure_ascii=False, indent=2)
-            f.write(";")
-        
-        print(f"\n🎉 성공!")
-        print(f"   데이터 소스: {data_source}")
-        print(f"   총 {len(unit_data)}개 유닛 데이터 추출")
-        print(f"   JSON 파일: {output_file}")
-        print(f"   JS 파일: {js_output_file}")
-        
-        # 샘플 데이터 출력
-        print(f"\n📄 샘플 데이터 (첫 번째 항목):")
-        print(json.dumps(unit_data[0], ensure_ascii=False, indent=2))
+        save_unit_data(unit_data, data_source)
         
     else:
         print("\n❌ unit_data를 찾을 수 없습니다!")
@@ -173,11 +231,35 @@ try:
                     print(content[:500])
         print("="*80)
 
-except Exception as e:
-    print(f"❌ 오류 발생: {e}")
-    import traceback
-    traceback.print_exc()
+    return unit_data if unit_data else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AppMedia 유닛 목록 페이지 → unit_data.json")
+    parser.add_argument("--browser", action="store_true", help="HTTP 추출을 건너뛰고 바로 Selenium 사용")
+    parser.add_argument("--html", help="저장된 페이지 HTML에서 오프라인 추출 (Selenium 대체 없음)")
+    args = parser.parse_args(argv)
+
+    if args.html:
+        if crawl_unit_data_fast(args.html) is None:
+            print("\n❌ unit_data를 찾을 수 없습니다!")
+        return
+
+    if not args.browser and crawl_unit_data_fast() is not None:
+        return
+
+    print("\n🌐 Selenium으로 다시 시도...")
+    driver = create_driver()
+    try:
+        crawl_unit_data(driver)
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        driver.quit()
+        print("\n✅ 브라우저 종료")
+
 
-finally:
-    driver.quit()
-    print("\n✅ 브라우저 종료")
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,4 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from browser import create_driver, element_present, open_page
 from bs4 import BeautifulSoup
 import time
 import os
@@ -11,23 +7,17 @@ import os
 TARGET_URL = "https://appmedia.jp/ggene_eternal/78850862"
 OUTPUT_DIR = "02_raw_data"
 
-options = Options()
-options.add_argument("--headless")
-options.add_argument("--no-sandbox")
-options.add_argument("--disable-dev-shm-usage")
-options.add_argument("--window-size=1920,1080")
-options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
 
-driver = webdriver.Chrome(options=options)
-
-print(f"[{TARGET_URL}] 무기 테이블 추출 시작...")
-
-try:
-    driver.get(TARGET_URL)
+def crawl_weapons_table(driver):
+    """
+    열려 있는 브라우저로 무기 테이블 추출 + 저장
+    - 반환: 찾은 테이블 (없으면 None)
+    """
+    print(f"[{TARGET_URL}] 무기 테이블 추출 시작...")
     print("⏳ 페이지 로딩 대기 중...")
     
-    # 페이지 로딩 대기
-    time.sleep(5)
+    # 무장 테이블이 나타날 때까지 대기 (고정 sleep 대신)
+    open_page(driver, TARGET_URL, element_present("table.unit_list_table"))
     
     # BeautifulSoup으로 파싱
     soup = BeautifulSoup(driver.page_source, 'html.parser')
@@ -186,11 +176,21 @@ try:
             f.write(driver.page_source)
         print(f"\n🔍 디버그: 전체 페이지 소스 저장 → {debug_file}")
 
-except Exception as e:
-    print(f"❌ 오류 발생: {e}")
-    import traceback
-    traceback.print_exc()
+    return weapon_table
+
+
+def main():
+    driver = create_driver()
+    try:
+        crawl_weapons_table(driver)
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        driver.quit()
+        print("\n✅ 브라우저 종료")
+
 
-finally:
-    driver.quit()
-    print("\n✅ 브라우저 종료")
+if __name__ == "__main__":
+    main()
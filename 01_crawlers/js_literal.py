@@ -0,0 +1,175 @@
+import json
+import re
+
+
+def _skip_string(source, i):
+    """source[i]가 따옴표일 때, 닫는 따옴표 다음 위치 반환"""
+    quote = source[i]
+    i += 1
+    while i < len(source):
+        ch = source[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == quote:
+            return i + 1
+        i += 1
+    raise ValueError("닫히지 않은 문자열")
+
+
+def _skip_comment(source, i):
+    """source[i:]가 // 또는 /* 주석이면 주석 다음 위치, 아니면 i 그대로"""
+    if source.startswith("//", i):
+        end = source.find("\n", i)
+        return len(source) if end == -1 else end
+    if source.startswith("/*", i):
+        end = source.find("*/", i + 2)
+        if end == -1:
+            raise ValueError("닫히지 않은 주석")
+        return end + 2
+    return i
+
+
+_SCAN_TOKEN = re.compile(
+    r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|`(?:[^`\\]|\\.)*`|//[^\n]*|/\*.*?\*/|[\[\]{}]',
+    re.S
+)
+
+
+def iter_var_literals(source, var_name):
+    """
+    페이지 소스에서 `var/let/const var_name = [...]` (또는 {...}) 리터럴 부분을 잘라서 차례로 반환
+    - 문자열 안의 괄호 / 주석은 건너뛰며 짝을 맞춤
+    """
+    pattern = re.compile(r"(?:\bvar|\blet|\bconst|\bwindow\.)\s*" + re.escape(var_name) + r"\s*=\s*(?=[\[{])")
+    for match in pattern.finditer(source):
+        start = match.end()
+        depth = 0
+        # 문자열 / 주석은 통째로 건너뛰고 괄호만 셈
+        for token in _SCAN_TOKEN.finditer(source, start):
+            ch = token.group(0)
+            if ch in ("[", "{"):
+                depth += 1
+            elif ch in ("]", "}"):
+                depth -= 1
+                if depth == 0:
+                    yield source[start:token.end()]
+                    break
+
+
+_JSON_ESCAPES = set('"\\/bfnrtu')
+_JS_STRING_PART = re.compile(r'\\(x[0-9a-fA-F]{2}|u\{[0-9a-fA-F]+\}|\r\n|.)|(["\n\r\t])', re.S)
+_BARE_ESCAPES = {'"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+
+
+def _json_string(body):
+    """
+    JS 문자열 본문(따옴표 제외) → JSON 문자열 본문
+    - JSON에 없는 이스케이프 정리: \\' \\` 등 → 문자 그대로, \\xHH / \\u{...} / \\v / \\0 → \\u, 줄 잇기(\\ + 줄바꿈) 제거
+    - 이스케이프 안 된 큰따옴표 / 줄바꿈 / 탭 → 이스케이프
+    """
+    def replace(m):
+        seq = m.group(1)
+        if seq is None:
+            return _BARE_ESCAPES[m.group(2)]
+        if seq in "\r\n\u2028\u2029":
+            return ""
+        if seq[0] == "x" and len(seq) == 3:
+            return "\\u00" + seq[1:]
+        if seq.startswith("u{"):
+            return json.dumps(chr(int(seq[2:-1], 16)))[1:-1]
+        if seq == "v":
+            return "\\u000b"
+        if seq == "0":
+            return "\\u0000"
+        if seq in _JSON_ESCAPES:
+            return m.group(0)
+        return json.dumps(seq)[1:-1]
+
+    return _JS_STRING_PART.sub(replace, body)
+
+
+_IDENT = re.compile(r"(?:[^\W\d]|\$)[\w$]*")    # 유니코드 식별자 포함 (アビ込みステータス: 등)
+_JS_CONSTANTS = {"true": "true", "false": "false", "null": "null", "undefined": "null"}
+
+
+def js_to_json(literal):
+    """
+    JSON이 아닌 JS 객체 리터럴을 JSON 문자열로 변환
+    - 작은따옴표 / 백틱 문자열 → 큰따옴표, 따옴표 없는 키 → 따옴표, 끝 쉼표 / 주석 제거, undefined → null
+    - 문자열 이스케이프는 따옴표 종류와 관계없이 _json_string 으로 정리 ("Zeta\\'s" 도 JS에서는 유효)
+    """
+    out = []
+    i = 0
+    n = len(literal)
+    while i < n:
+        ch = literal[i]
+
+        if ch in "\"'`":
+            end = _skip_string(literal, i)
+            out.append('"' + _json_string(literal[i + 1:end - 1]) + '"')
+            i = end
+            continue
+
+        skipped = _skip_comment(literal, i)
+        if skipped != i:
+            i = skipped
+            continue
+
+        if ch == ",":
+            # 끝 쉼표: 다음 의미 있는 문자가 ] 또는 } 이면 버림
+            j = i + 1
+            while j < n:
+                if literal[j].isspace():
+                    j += 1
+                    continue
+                skipped = _skip_comment(literal, j)
+                if skipped == j:
+                    break
+                j = skipped
+            if j < n and literal[j] in "]}":
+                i += 1
+                continue
+            out.append(ch)
+            i += 1
+            continue
+
+        match = _IDENT.match(literal, i)
+        if match and (i == 0 or not (literal[i - 1].isalnum() or literal[i - 1] in "_$.")):
+            word = match.group(0)
+            j = match.end()
+            while j < n and literal[j].isspace():
+                j += 1
+            if j < n and literal[j] == ":":
+                out.append(json.dumps(word))
+            else:
+                out.append(_JS_CONSTANTS.get(word, word))
+            i = match.end()
+            continue
+
+        out.append(ch)
+        i += 1
+    return "".join(out)
+
+
+def parse_js_literal(literal):
+    """리터럴 파싱: JSON으로 먼저 시도하고 실패하면 JS 문법 정리 후 다시 시도"""
+    try:
+        return json.loads(literal)
+    except ValueError:
+        return json.loads(js_to_json(literal))
+
+
+def extract_js_var(source, var_name, validate=None):
+    """
+    페이지 소스 → var_name 값 (찾지 못하거나 파싱 실패 시 None)
+    - 같은 이름이 여러 번 나오면 (문자열 속 예시 코드 등) 파싱되고 validate를 통과하는 첫 번째 값
+    """
+    for literal in iter_var_literals(source, var_name):
+        try:
+            value = parse_js_literal(literal)
+        except ValueError:
+            continue
+        if validate is None or validate(value):
+            return value
+    return None
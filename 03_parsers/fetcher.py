@@ -0,0 +1,157 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# 크롤러(01_crawlers)와 동일한 User-Agent
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# 재시도 대상 상태 코드
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+# ======================
+# 호스트별 레이트 리미터
+# ======================
+class HostRateLimiter:
+    """
+    호스트(netloc)별로 요청 간 최소 간격을 보장하는 레이트 리미터
+    - rate_per_sec: 호스트당 초당 최대 요청 수 (0 이하면 제한 없음)
+    - 여러 스레드에서 동시에 호출해도 안전
+    """
+
+    def __init__(self, rate_per_sec):
+        self.interval = 1.0 / rate_per_sec if rate_per_sec and rate_per_sec > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = {}
+
+    def wait(self, url):
+        if not self.interval:
+            return
+        host = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+# ======================
+# 커넥션 풀 + 재시도 HTTP 클라이언트
+# ======================
+class FetchError(Exception):
+    """재시도를 모두 소진해도 요청이 실패한 경우"""
+
+
+class HttpClient:
+    """
+    keep-alive 커넥션 풀을 공유하는 HTTP 클라이언트
+    - 429/5xx, 연결 오류 시 지수 백오프 + 지터로 재시도 (Retry-After 헤더 우선)
+    - 재시도를 모두 소진하면 FetchError (빈 데이터로 조용히 넘어가지 않도록)
+    - stats: 실행 중 요청/재시도/실패 횟수와 받은 바이트 수
+    """
+
+    def __init__(self, pool_size=8, connect_timeout=10, read_timeout=30,
+                 max_retries=4, backoff=1.0, max_backoff=30.0):
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "retries": 0, "failures": 0, "bytes": 0}
+
+    def _count(self, key, n=1):
+        with self._lock:
+            self.stats[key] += n
+
+    def _retry_delay(self, attempt, res):
+        # Retry-After (초 또는 HTTP 날짜) 가 있으면 그대로 따름
+        retry_after = res.headers.get("Retry-After") if res is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                try:
+                    wait = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                    return min(max(wait, 0), self.max_backoff)
+                except (TypeError, ValueError):
+                    pass
+        # full jitter: 0 ~ backoff * 2^attempt
+        return random.uniform(0, min(self.backoff * (2 ** attempt), self.max_backoff))
+
+    def get(self, url, headers=None):
+        res = None
+        error = None
+        for attempt in range(self.max_retries + 1):
+            self._count("requests")
+            try:
+                res = self.session.get(url, headers=headers, timeout=self.timeout)
+                error = None
+            except requests.RequestException as e:
+                res = None
+                error = e
+            else:
+                self._count("bytes", len(res.content))
+                if res.status_code not in RETRY_STATUS:
+                    return res
+
+            if attempt < self.max_retries:
+                self._count("retries")
+                time.sleep(self._retry_delay(attempt, res))
+
+        self._count("failures")
+        reason = error if error is not None else f"HTTP {res.status_code}"
+        raise FetchError(f"{url} 요청 실패 ({self.max_retries}회 재시도 후): {reason}")
+
+    def summary(self):
+        s = self.stats
+        return (f"요청 {s['requests']}회 / 재시도 {s['retries']}회 / 실패 {s['failures']}회 / "
+                f"수신 {s['bytes'] / 1024 / 1024:.1f} MB")
+
+    def close(self):
+        self.session.close()
+
+
+# ======================
+# URL 재작성 (로컬 테스트 서버용)
+# ======================
+def rewrite_base_url(url, base_url):
+    """
+    url의 scheme/host 부분을 base_url로 교체
+    예) https://appmedia.jp/ggene_eternal/1 + http://127.0.0.1:8000
+        → http://127.0.0.1:8000/ggene_eternal/1
+    """
+    if not base_url:
+        return url
+    src = urlsplit(url)
+    dst = urlsplit(base_url)
+    path = dst.path.rstrip("/") + src.path
+    return urlunsplit((dst.scheme, dst.netloc, path, src.query, src.fragment))
+
+
+# ======================
+# 순서 보존 동시 실행
+# ======================
+def map_concurrent(func, items, max_workers):
+    """
+    items 각각에 func를 스레드 풀에서 실행하고, 입력 순서 그대로 결과 리스트 반환
+    - max_workers: 동시에 실행되는(= 동시에 요청 중인) 최대 작업 수
+    """
+    if max_workers <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, items))
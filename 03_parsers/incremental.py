@@ -0,0 +1,85 @@
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+# ======================
+# 경로 설정
+# ======================
+PARSERS_DIR = Path(__file__).parent
+
+# 파서 코드가 바뀌면 이전 결과를 재사용하지 않도록 지문에 포함할 파일들
+PARSER_SOURCES = [PARSERS_DIR / "unit_parser.py", PARSERS_DIR / "main.py"] + sorted((PARSERS_DIR / "parsers").glob("*.py"))
+
+
+def text_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def row_hash(row):
+    """unit_data.json 행 1개의 내용 해시 (키 순서와 무관)"""
+    return text_hash(json.dumps(row, ensure_ascii=False, sort_keys=True))
+
+
+def parser_fingerprint():
+    """파서 소스 코드 전체의 해시"""
+    h = hashlib.sha256()
+    for path in PARSER_SOURCES:
+        if path.exists():
+            h.update(path.name.encode("utf-8"))
+            h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def unit_key(url, rarity, unit_type, obtain_method):
+    return "|".join([url or "", rarity or "", unit_type or "", obtain_method or ""])
+
+
+class UnitManifest:
+    """
+    증분 파싱용 매니페스트
+    - (url, レアリティ, タイプ, 入手タイプ) → [{page: 페이지 해시, row: unit_data 행 해시, index: units.json 위치}]
+      (같은 키의 행이 여러 개일 수 있으므로 리스트)
+    - 이전 units.json 레코드와 짝지어, 두 해시가 모두 같으면 파싱 없이 레코드 재사용
+    - 파서 코드 지문이 다르면 전체 무효화
+    """
+
+    def __init__(self, manifest_path, units_path, enabled=True):
+        self.manifest_path = Path(manifest_path)
+        self.fingerprint = parser_fingerprint()
+        self.previous = {}
+        self.records = []
+        self.entries = {}
+        self.reused = 0
+        self._lock = threading.Lock()
+
+        if not enabled or not self.manifest_path.exists() or not Path(units_path).exists():
+            return
+
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("parser") != self.fingerprint:
+            print("   🔄 파서 코드 변경 감지 → 전체 재파싱")
+            return
+
+        with open(units_path, "r", encoding="utf-8") as f:
+            self.records = json.load(f)
+        self.previous = manifest.get("units", {})
+
+    def lookup(self, key, row_digest, page_digest):
+        """두 해시가 모두 같은 이전 레코드 반환, 없으면 None"""
+        for entry in self.previous.get(key, []):
+            if entry["row"] == row_digest and entry["page"] == page_digest and entry["index"] < len(self.records):
+                with self._lock:
+                    self.reused += 1
+                return self.records[entry["index"]]
+        return None
+
+    def add(self, key, row_digest, page_digest, index):
+        """이번 실행 결과 기록 (index: 새 units.json에서의 위치)"""
+        self.entries.setdefault(key, []).append({"row": row_digest, "page": page_digest, "index": index})
+
+    def save(self):
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.manifest_path, "w", encoding="utf-8") as f:
+            json.dump({"parser": self.fingerprint, "units": self.entries}, f, ensure_ascii=False, indent=2)
@@ -1,6 +1,9 @@
+import argparse
 import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
 # 프로젝트 루트 기준 경로 설정
@@ -8,91 +11,246 @@ PROJECT_ROOT = Path(__file__).parent.parent
 RAW_DATA_DIR = PROJECT_ROOT / "02_raw_data"
 PROCESSED_DATA_DIR = PROJECT_ROOT / "04_processed_data"
 
+UNIT_DATA_JSON = RAW_DATA_DIR / "unit_data.json"
+UNITS_JSON = PROCESSED_DATA_DIR / "units.json"
+UNITS_MANIFEST = PROCESSED_DATA_DIR / "units_manifest.json"
+
 # unit_parser 임포트
-from unit_parser import parse_unit
+from unit_parser import benchmark_block_extraction, benchmark_block_parsing, empty_unit, fetch_unit_page, parse_unit_html, parse_unit_page
+from fetcher import HostRateLimiter, HttpClient, map_concurrent, rewrite_base_url
+from page_cache import PageCache, DEFAULT_CACHE_DIR, DEFAULT_TTL_DAYS, DEFAULT_MAX_MB
+from incremental import UnitManifest, row_hash, text_hash, unit_key
+
+# 동시 요청 기본값
+DEFAULT_WORKERS = 8        # 동시에 요청 중인 최대 페이지 수
+DEFAULT_RATE = 4.0         # 호스트당 초당 최대 요청 수
+DEFAULT_JOBS = 1           # HTML 파싱 프로세스 수 (1이면 요청 스레드에서 바로 파싱, 동시 요청 수와는 무관)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="unit_data.json → units.json 유닛 상세 파싱")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"동시 요청 최대 개수 (기본 {DEFAULT_WORKERS}, 1이면 순차 실행)")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE,
+                        help=f"호스트당 초당 최대 요청 수 (기본 {DEFAULT_RATE}, 0이면 제한 없음)")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS,
+                        help=f"페이지 HTML 파싱 프로세스 수 (기본 {DEFAULT_JOBS}, 2 이상이면 프로세스 풀로 분산, "
+                             "동시 요청 수는 --workers 로만 정해짐)")
+    parser.add_argument("--base-url", default=None,
+                        help="유닛 URL의 호스트 부분을 교체 (예: 로컬 테스트 서버 http://127.0.0.1:8000)")
+
+    # 증분 파싱
+    parser.add_argument("--full", action="store_true",
+                        help="증분 파싱을 끄고 모든 유닛을 다시 파싱")
+
+    # HTTP 세션 (커넥션 풀 / 재시도)
+    parser.add_argument("--connect-timeout", type=float, default=10,
+                        help="연결 타임아웃 초 (기본 10)")
+    parser.add_argument("--read-timeout", type=float, default=30,
+                        help="응답 타임아웃 초 (기본 30)")
+    parser.add_argument("--retries", type=int, default=4,
+                        help="429/5xx/연결 오류 시 최대 재시도 횟수 (기본 4)")
+    parser.add_argument("--backoff", type=float, default=1.0,
+                        help="재시도 백오프 기준 초 (기본 1.0, 지수 증가 + 지터)")
+
+    # 페이지 캐시
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR),
+                        help="유닛 페이지 캐시 폴더 (기본 02_raw_data/page_cache)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="페이지 캐시를 사용하지 않고 매번 새로 요청")
+    parser.add_argument("--offline", action="store_true",
+                        help="네트워크 없이 캐시된 페이지만으로 파싱")
+    parser.add_argument("--cache-max-age", type=float, default=0,
+                        help="캐시 후 이 시간(초) 이내면 재검증 없이 사용 (기본 0: 항상 조건부 재검증)")
+    parser.add_argument("--cache-ttl-days", type=float, default=DEFAULT_TTL_DAYS,
+                        help=f"마지막 사용 후 이 기간(일)이 지난 캐시 삭제 (기본 {DEFAULT_TTL_DAYS})")
+    parser.add_argument("--cache-max-mb", type=float, default=DEFAULT_MAX_MB,
+                        help=f"캐시 용량 상한 MB (기본 {DEFAULT_MAX_MB})")
+
+    # 페이지 파싱
+    parser.add_argument("--full-page-parse", action="store_true",
+                        help="맞는 블록만 잘라 파싱하지 않고 페이지 전체를 BeautifulSoup 으로 파싱 (기존 방식)")
+
+    # 벤치마크
+    parser.add_argument("--benchmark", action="store_true",
+                        help="캐시된 유닛 페이지로 블록 추출 / 파싱 시간 비교 후 종료")
+    parser.add_argument("--benchmark-limit", type=int, default=200,
+                        help="벤치마크에 사용할 최대 페이지 수 (기본 200)")
+    return parser.parse_args(argv)
+
+def build_record(unit, parsed):
+    """unit_data.json 원본 행 + 파싱 결과 → units.json 레코드"""
+    unit_name = unit["name"]
+    # SSP 데이터 부족 표시
+    if parsed["ssp"] and parsed["ssp"].get("custom_core") is None:
+        unit_name += " (데이터부족)"
+
+    return {
+        "unit_name": unit_name,
+        "rarity": unit["レアリティ"],
+        "obtain_method": unit["入手タイプ"],
+        "type": unit["タイプ"],
+        "weapons": parsed["weapons"],
+        "ssp": parsed["ssp"],
+        "movement": parsed["movement"],
+        "terrain": parsed["terrain"],
+        "abilities": parsed["abilities"],
+        "mechanism": parsed["mechanism"],
+        "map_weapon": parsed["map_weapon"],
+        # 원본 필드 추가
+        "icon": unit.get("icon"),
+        "url": unit.get("url"),
+        "タグ": unit.get("タグ"),
+        "作品": unit.get("作品"),
+        "ステータス": unit.get("ステータス"),
+        "アビ込みステータス": unit.get("アビ込みステータス")
+    }
 
-def main():
+def process_unit(unit, limiter, session, manifest, base_url=None, cache=None, targeted=True, pool=None):
     """
-    메인 실행 함수
-    - 입력: 02_raw_data/unit_data.json (AppMedia 크롤링 결과)
-    - 출력: 04_processed_data/units.json (파싱 완료 데이터)
+    유닛 1개 요청 + 파싱 (스레드 풀 작업 단위)
+    - 페이지와 unit_data 행이 모두 이전 실행과 같으면 파싱 없이 이전 레코드 재사용
+    - pool(ProcessPoolExecutor)이 주어지면 HTML 파싱은 프로세스 풀에 넘기기만 하고 기다리지 않음
+      (요청 스레드는 바로 다음 페이지 요청, 결과는 finish_parse 로 받음)
+    - 반환: (레코드 또는 None, 오류 메시지 또는 None, 매니페스트 항목 또는 None, 파싱 대기 (page, future) 또는 None)
     """
-    
-    # 입력 파일 경로
-    input_file = RAW_DATA_DIR / "unit_data.json"
-    
-    # 입력 파일 존재 확인
-    if not input_file.exists():
-        print(f"❌ 입력 파일을 찾을 수 없습니다: {input_file}")
-        print(f"\n먼저 크롤러를 실행하세요:")
-        print(f"  python 01_crawlers/extract_unit_data.py")
-        sys.exit(1)
-    
-    # unit_data.json 읽기
-    print(f"📖 입력 파일 로드: {input_file}")
-    with open(input_file, "r", encoding="utf-8") as f:
-        units = json.load(f)
-    
-    print(f"✅ 총 {len(units)}개 유닛 데이터 로드됨\n")
-    
-    # 파싱 시작
-    results = []
-    success_count = 0
-    error_count = 0
-    
-    for idx, unit in enumerate(units, start=1):
-        try:
-            print(f"[{idx}/{len(units)}] {unit['name']} 처리 중...")
-            
-            parsed = parse_unit(
-                unit["url"],
+    try:
+        url = rewrite_base_url(unit["url"], base_url)
+        print(f"[INFO] {unit['name']} ({unit['レアリティ']}/{unit['入手タイプ']}/{unit['タイプ']}) 파싱 시작...")
+
+        # 오프라인 모드에서는 요청이 없으므로 대기하지 않음
+        if cache is None or not cache.offline:
+            limiter.wait(url)
+        html = fetch_unit_page(url, unit["name"], cache, session)
+        if html is None:
+            return build_record(unit, empty_unit(unit["地形適正"])), None, None, None
+
+        key = unit_key(unit["url"], unit["レアリティ"], unit["タイプ"], unit["入手タイプ"])
+        row_digest = row_hash(unit)
+        page_digest = text_hash(html)
+        entry = (key, row_digest, page_digest)
+
+        record = manifest.lookup(key, row_digest, page_digest)
+        if record is None:
+            page = (
+                html,
                 unit["name"],
                 unit["レアリティ"],
                 unit["タイプ"],
                 unit["入手タイプ"],
-                unit["地形適正"]
+                unit["地形適正"],
+                targeted
             )
-            
-            unit_name = unit["name"]
-            # SSP 데이터 부족 표시
-            if parsed["ssp"] and parsed["ssp"].get("custom_core") is None:
-                unit_name += " (데이터부족)"
-            
-            results.append({
-                "unit_name": unit_name,
-                "rarity": unit["レアリティ"],
-                "obtain_method": unit["入手タイプ"],
-                "type": unit["タイプ"],
-                "weapons": parsed["weapons"],
-                "ssp": parsed["ssp"],
-                "movement": parsed["movement"],
-                "terrain": parsed["terrain"],
-                "abilities": parsed["abilities"],
-                "mechanism": parsed["mechanism"],
-                "map_weapon": parsed["map_weapon"],
-                # 원본 필드 추가
-                "icon": unit.get("icon"),
-                "url": unit.get("url"),
-                "タグ": unit.get("タグ"),
-                "作品": unit.get("作品"),
-                "ステータス": unit.get("ステータス"),
-                "アビ込みステータス": unit.get("アビ込みステータス")
-            })
-            
+            if pool is not None:
+                try:
+                    future = pool.submit(parse_unit_page, *page)
+                except BrokenProcessPool:
+                    future = None
+                return None, None, entry, (page, future)
+            record = build_record(unit, parse_unit_html(*page))
+
+        return record, None, entry, None
+
+    except Exception as e:
+        return None, str(e), None, None
+
+def finish_parse(unit, page, future):
+    """
+    프로세스 풀에 넘긴 파싱 결과 → (레코드 또는 None, 오류 메시지 또는 None, 프로세스 풀 깨짐 여부)
+    - 워커가 비정상 종료(segfault, OOM kill 등)하면 풀 전체가 BrokenProcessPool 이 되므로,
+      그 뒤 결과를 못 받은 페이지는 이 프로세스에서 다시 파싱 (유닛이 조용히 빠지지 않도록)
+    """
+    broken = False
+    parsed = error = None
+    if future is not None:
+        try:
+            parsed, error = future.result()
+        except BrokenProcessPool:
+            future = None
+    if future is None:
+        broken = True
+        parsed, error = parse_unit_page(*page)
+
+    if error is not None:
+        return None, error, broken
+    return build_record(unit, parsed), None, broken
+
+def parse_units(units, args):
+    """
+    unit_data 행 목록 → units.json 레코드 목록 (파일 저장은 save_units)
+    - 유닛 페이지는 스레드 풀로 동시에 요청하되, 출력 순서는 입력 순서와 동일
+    - 반환: (레코드 목록, 매니페스트)
+    """
+    print(f"⚡ 동시 요청: 최대 {args.workers}개, 호스트당 초당 {args.rate}회\n")
+    limiter = HostRateLimiter(args.rate)
+
+    if args.offline and args.no_cache:
+        print("❌ --offline 은 --no-cache 와 함께 사용할 수 없습니다")
+        sys.exit(1)
+
+    cache = None
+    if not args.no_cache:
+        cache = PageCache(
+            args.cache_dir,
+            max_age=args.cache_max_age,
+            ttl_days=args.cache_ttl_days,
+            max_mb=args.cache_max_mb,
+            offline=args.offline
+        )
+        mode = "오프라인(캐시 전용)" if args.offline else "조건부 재검증"
+        print(f"💾 페이지 캐시: {args.cache_dir} [{mode}]\n")
+
+    session = HttpClient(
+        pool_size=max(args.workers, 1),
+        connect_timeout=args.connect_timeout,
+        read_timeout=args.read_timeout,
+        max_retries=args.retries,
+        backoff=args.backoff
+    )
+
+    manifest = UnitManifest(UNITS_MANIFEST, UNITS_JSON, enabled=not args.full)
+
+    # 요청은 스레드 풀(--workers), 파싱은 (--jobs 2 이상이면) 프로세스 풀
+    # 요청 스레드는 파싱을 기다리지 않으므로 동시 요청 수는 항상 --workers 이하
+    pool = None
+    if args.jobs > 1:
+        pool = ProcessPoolExecutor(max_workers=args.jobs)
+        print(f"🧮 파싱 프로세스: {args.jobs}개\n")
+
+    try:
+        outcomes = map_concurrent(
+            lambda unit: process_unit(unit, limiter, session, manifest, args.base_url, cache,
+                                      targeted=not args.full_page_parse, pool=pool),
+            units,
+            args.workers
+        )
+        session.close()
+
+        results = []
+        success_count = 0
+        error_count = 0
+        fallback_count = 0
+
+        for idx, (unit, (record, error, entry, pending)) in enumerate(zip(units, outcomes), start=1):
+            if pending is not None:
+                record, error, broken = finish_parse(unit, *pending)
+                fallback_count += broken
+            if error is not None:
+                print(f"[{idx}/{len(units)}] {unit.get('name')} ❌ 오류 발생: {error}")
+                error_count += 1
+                continue
+            if entry is not None:
+                manifest.add(*entry, len(results))
+            results.append(record)
             success_count += 1
-            
-        except Exception as e:
-            print(f"  ❌ 오류 발생: {e}")
-            error_count += 1
-            continue
-    
-    # 출력 디렉토리 생성
-    PROCESSED_DATA_DIR.mkdir(parents=True, exist_ok=True)
-    
-    # 결과 저장
-    output_file = PROCESSED_DATA_DIR / "units.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    if cache is not None:
+        cache.save()
+
+    if fallback_count:
+        print(f"\n⚠️ 파싱 프로세스가 비정상 종료되어 {fallback_count}개 페이지를 메인 프로세스에서 다시 파싱했습니다")
     
     # 요약 출력
     print("\n" + "="*60)
@@ -100,8 +258,77 @@ def main():
     print("="*60)
     print(f"✅ 성공: {success_count}개")
     print(f"❌ 실패: {error_count}개")
-    print(f"📁 출력 파일: {output_file}")
+    print(f"♻️ 재사용(변경 없음): {manifest.reused}개")
+    print(f"🌐 {session.summary()}")
+    if cache is not None:
+        print(f"💾 {cache.summary()}")
     print("="*60)
 
+    return results, manifest
+
+def save_units(results, manifest):
+    """units.json + 매니페스트 저장 (매니페스트의 index가 units.json 위치를 가리키므로 항상 함께 저장)"""
+    PROCESSED_DATA_DIR.mkdir(parents=True, exist_ok=True)
+    with open(UNITS_JSON, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    manifest.save()
+    print(f"📁 출력 파일: {UNITS_JSON}")
+
+def load_unit_data():
+    """02_raw_data/unit_data.json 로드 (없으면 종료)"""
+    # 입력 파일 존재 확인
+    if not UNIT_DATA_JSON.exists():
+        print(f"❌ 입력 파일을 찾을 수 없습니다: {UNIT_DATA_JSON}")
+        print(f"\n먼저 크롤러를 실행하세요:")
+        print(f"  python 01_crawlers/extract_unit_data.py")
+        sys.exit(1)
+    
+    # unit_data.json 읽기
+    print(f"📖 입력 파일 로드: {UNIT_DATA_JSON}")
+    with open(UNIT_DATA_JSON, "r", encoding="utf-8") as f:
+        units = json.load(f)
+    
+    print(f"✅ 총 {len(units)}개 유닛 데이터 로드됨\n")
+    return units
+
+def run_benchmark(units, args):
+    """페이지 캐시에 있는 유닛 페이지만으로 (네트워크 없이) 블록 파싱 벤치마크"""
+    cache = PageCache(args.cache_dir, offline=True)
+    pages = []
+    for unit in units:
+        if len(pages) >= args.benchmark_limit:
+            break
+        html = cache.get(rewrite_base_url(unit["url"], args.base_url), None)
+        if html is not None:
+            pages.append((html, unit["レアリティ"], unit["タイプ"], unit["入手タイプ"], unit["地形適正"]))
+
+    if not pages:
+        print(f"❌ 캐시된 페이지가 없습니다: {args.cache_dir}")
+        sys.exit(1)
+    benchmark_block_extraction(pages)
+    print()
+    benchmark_block_parsing(pages)
+
+def main(argv=None):
+    """
+    메인 실행 함수
+    - 입력: 02_raw_data/unit_data.json (AppMedia 크롤링 결과)
+    - 출력: 04_processed_data/units.json (파싱 완료 데이터)
+            04_processed_data/units_manifest.json (증분 파싱용 해시 목록)
+    """
+    args = parse_args(argv)
+    units = load_unit_data()
+    if args.benchmark:
+        run_benchmark(units, args)
+        return
+    results, manifest = parse_units(units, args)
+    save_units(results, manifest)
+
+    # 빠진 유닛이 있으면 다음 단계가 잘린 units.json 으로 이어지지 않도록 실패로 종료
+    dropped = len(units) - len(results)
+    if dropped:
+        print(f"❌ {dropped}개 유닛이 오류로 units.json 에서 빠졌습니다")
+        sys.exit(1)
+
 if __name__ == "__main__":
     main()
@@ -1,9 +1,17 @@
+import argparse
+import difflib
 import json
+import random
+import sys
+import time
 from bs4 import BeautifulSoup
 import hashlib
 import os
+from collections import defaultdict
 from pathlib import Path
 
+from names import normalize_name
+
 def make_hash_id(key_parts, length=8):
     raw = "_".join(key_parts)
     return "U" + hashlib.sha1(raw.encode("utf-8")).hexdigest()[:length]
@@ -13,116 +21,365 @@ PROJECT_ROOT = Path(__file__).parent.parent
 RAW_DATA_DIR = PROJECT_ROOT / "02_raw_data"
 PROCESSED_DATA_DIR = PROJECT_ROOT / "04_processed_data"
 
-# JSON 로드 (units.json)
-input_json = PROCESSED_DATA_DIR / "units.json"
-with open(input_json, "r", encoding="utf-8") as f:
-    units = json.load(f)
-
-# HTML 로드 (weapons_raw.html)
-input_html = RAW_DATA_DIR / "weapons_raw.html"
-with open(input_html, "r", encoding="utf-8") as f:
-    soup = BeautifulSoup(f, "html.parser")
-
-rows = []
-for tr in soup.select("tbody.unit_tbody tr"):
-    img_tag = tr.find("img")
-    src = img_tag["src"].strip() if img_tag else ""
-    src_file = os.path.basename(src) if src else ""
-
-    # 무장 div 여러 개 가져오기
-    weapon_divs = tr.find_all("div", {"class": "weapon_effect_wrapper"})
-    rarity = weapon_divs[0].get("data-rarity1", "").strip() if weapon_divs else ""
-    unit_type = weapon_divs[0].get("data-type", "").strip() if weapon_divs else ""
-    obtain = weapon_divs[0].get("data-name_type", "").strip() if weapon_divs else ""
-
-    a_tag = tr.find("a")
-    html_name = a_tag.get_text(strip=True) if a_tag else ""
-
-    rows.append({
-        "tr": tr,
-        "weapon_divs": weapon_divs,
-        "src_file": src_file,
-        "rarity": rarity,
-        "type": unit_type,
-        "obtain": obtain,
-        "html_name": html_name
-    })
-
-json_failures = []
-html_failures = []
-
-# 1️⃣ 아이콘 기준 자동 매칭
-for i, unit in enumerate(units):
-    name = unit.get("name", "").strip() or unit.get("unit_name", "").strip()
-    icon = unit.get("icon", "").strip()
-    icon_file = os.path.basename(icon) if icon else ""
-    rarity = unit.get("rarity", "").strip()
-    unit_type = unit.get("type", "").strip()
-    obtain = unit.get("obtain_method", "").strip()
-
-    if icon_file:
-        match = next(
-            (r for r in rows if r["src_file"] == icon_file),
-            None
-        )
-        if match:
+# 후보가 여러 개일 때 자동 선택 결과 / 애매한 경우 기록 (수동 관리)
+RESOLUTION_FILE = Path(__file__).parent / "match_resolutions.json"
+
+# 출력 파일
+UNITS_WITH_IDS_JSON = PROCESSED_DATA_DIR / "units_with_ids.json"
+WEAPONS_WITH_IDS_HTML = PROCESSED_DATA_DIR / "weapons_with_ids.html"
+
+# 자동 선택 기준
+SCORE_WEIGHTS = {"rarity": 0.3, "type": 0.2, "obtain": 0.2, "icon": 0.3}
+DEFAULT_THRESHOLD = 0.7     # 최고 점수가 이 값 이상이고
+DEFAULT_MARGIN = 0.1        # 2위와 이만큼 이상 차이 나면 자동 선택
+
+# ======================
+# HTML 행 로드
+# ======================
+def load_weapon_rows(soup):
+    """weapons_raw.html의 유닛 행 → 매칭용 dict 리스트"""
+    rows = []
+    for tr in soup.select("tbody.unit_tbody tr"):
+        img_tag = tr.find("img")
+        src = img_tag["src"].strip() if img_tag else ""
+        src_file = os.path.basename(src) if src else ""
+
+        # 무장 div 여러 개 가져오기
+        weapon_divs = tr.find_all("div", {"class": "weapon_effect_wrapper"})
+        rarity = weapon_divs[0].get("data-rarity1", "").strip() if weapon_divs else ""
+        unit_type = weapon_divs[0].get("data-type", "").strip() if weapon_divs else ""
+        obtain = weapon_divs[0].get("data-name_type", "").strip() if weapon_divs else ""
+
+        a_tag = tr.find("a")
+        html_name = a_tag.get_text(strip=True) if a_tag else ""
+
+        rows.append({
+            "tr": tr,
+            "weapon_divs": weapon_divs,
+            "src_file": src_file,
+            "rarity": rarity,
+            "type": unit_type,
+            "obtain": obtain,
+            "html_name": html_name
+        })
+    return rows
+
+# ======================
+# 인덱스
+# ======================
+def build_index(rows, key_func):
+    """key_func(row) → 행 리스트 (HTML 순서 유지, 빈 키 제외)"""
+    index = defaultdict(list)
+    for row in rows:
+        key = key_func(row)
+        if key:
+            index[key].append(row)
+    return index
+
+def assign_unit_id(unit, row):
+    """HTML 행 정보로 ID를 만들어 유닛과 무장 div에 부여"""
+    unit_id = make_hash_id([row["src_file"], row["rarity"], row["type"], row["obtain"]])
+    unit["id"] = unit_id
+    for div in row["weapon_divs"]:
+        div["data-unit-id"] = unit_id
+    return unit_id
+
+def choose_candidate(j, candidates):
+    """후보가 여러 개일 때 사용자에게 선택 받기 (선택 안 하면 None)"""
+    print(f"\nJSON({j['index']+1}) {j['name']} icon={j['icon_file']} rarity={j['rarity']} type={j['type']} obtain={j['obtain']}")
+    for k, row in enumerate(candidates, start=1):
+        print(f"  {k}. HTML name={row['html_name']} rarity={row['rarity']} type={row['type']} obtain={row['obtain']} icon={row['src_file']}")
+    choice = input("→ 매칭할 번호 입력: ")
+    if choice.isdigit():
+        return candidates[int(choice)-1]
+    return None
+
+# ======================
+# 비대화형 (배치) 선택
+# ======================
+def score_candidate(j, row):
+    """JSON 유닛 j와 HTML 행의 일치 점수 (0~1)"""
+    score = 0.0
+    if j["rarity"] and j["rarity"] == row["rarity"]:
+        score += SCORE_WEIGHTS["rarity"]
+    if j["type"] and j["type"] == row["type"]:
+        score += SCORE_WEIGHTS["type"]
+    if j["obtain"] and j["obtain"] == row["obtain"]:
+        score += SCORE_WEIGHTS["obtain"]
+    if j["icon_file"] and row["src_file"]:
+        ratio = difflib.SequenceMatcher(None, j["icon_file"], row["src_file"]).ratio()
+        score += SCORE_WEIGHTS["icon"] * ratio
+    return score
+
+def unit_signature(j):
+    return "|".join([j["name"], j["icon_file"], j["rarity"], j["type"], j["obtain"]])
+
+def row_signature(row):
+    return {
+        "html_name": row["html_name"],
+        "src_file": row["src_file"],
+        "rarity": row["rarity"],
+        "type": row["type"],
+        "obtain": row["obtain"]
+    }
+
+class BatchResolver:
+    """
+    후보가 여러 개일 때 stdin 없이 선택
+    1. match_resolutions.json의 resolved에 기록된 선택이 있으면 그대로 사용
+    2. 점수(레어도/타입/입수방법/아이콘 유사도)가 기준 이상이면 자동 선택
+    3. 나머지는 pending에 후보와 함께 기록 → choice(번호)를 채우면 다음 실행 때 resolved로 이동
+    """
+
+    def __init__(self, path=RESOLUTION_FILE, threshold=DEFAULT_THRESHOLD, margin=DEFAULT_MARGIN):
+        self.path = Path(path)
+        self.threshold = threshold
+        self.margin = margin
+        self.resolved = {}
+        self.pending = []
+        self.stats = {"resolved": 0, "scored": 0, "pending": 0}
+
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.resolved = data.get("resolved", {})
+            # 이전 실행의 pending 중 choice가 채워진 것은 resolved로 이동
+            for item in data.get("pending", []):
+                choice = item.get("choice")
+                if isinstance(choice, int) and 1 <= choice <= len(item["candidates"]):
+                    cand = item["candidates"][choice - 1]
+                    self.resolved[item["key"]] = {k: v for k, v in cand.items() if k != "score"}
+
+    def __call__(self, j, candidates):
+        key = unit_signature(j)
+
+        chosen = self.resolved.get(key)
+        if chosen is not None:
+            for row in candidates:
+                if row_signature(row) == chosen:
+                    self.stats["resolved"] += 1
+                    return row
+
+        scored = sorted(((score_candidate(j, row), k) for k, row in enumerate(candidates)), reverse=True)
+        best_score, best = scored[0]
+        runner_up = scored[1][0] if len(scored) > 1 else 0.0
+        if best_score >= self.threshold and best_score - runner_up >= self.margin:
+            self.stats["scored"] += 1
+            return candidates[best]
+
+        self.stats["pending"] += 1
+        self.pending.append({
+            "key": key,
+            "json": {k: j[k] for k in ("name", "icon_file", "rarity", "type", "obtain")},
+            "candidates": [dict(row_signature(row), score=round(score_candidate(j, row), 3)) for row in candidates],
+            "choice": None
+        })
+        print(f"[보류] JSON({j['index']+1}) {j['name']} → 후보 {len(candidates)}개, {self.path.name}에 기록")
+        return None
+
+    def save(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"resolved": self.resolved, "pending": self.pending}, f, ensure_ascii=False, indent=2)
+
+    def summary(self):
+        s = self.stats
+        return f"기록된 선택 {s['resolved']}개 / 점수 자동 선택 {s['scored']}개 / 보류 {s['pending']}개"
+
+# ======================
+# 매칭
+# ======================
+def match_units(units, rows, choose=choose_candidate, verbose=True):
+    """
+    units(units.json)에 id 부여 + rows의 무장 div에 data-unit-id 부여
+    - 1단계: 아이콘 파일명 인덱스로 매칭
+    - 2단계: 실패한 유닛은 HTML 이름 → 정규화 이름 인덱스로 매칭
+    모든 조회가 dict 인덱스라 유닛/행 수에 선형
+    """
+    by_icon = build_index(rows, lambda r: r["src_file"])
+
+    json_failures = []
+
+    # 1️⃣ 아이콘 기준 자동 매칭
+    for i, unit in enumerate(units):
+        name = unit.get("name", "").strip() or unit.get("unit_name", "").strip()
+        icon = unit.get("icon", "").strip()
+        icon_file = os.path.basename(icon) if icon else ""
+        rarity = unit.get("rarity", "").strip()
+        unit_type = unit.get("type", "").strip()
+        obtain = unit.get("obtain_method", "").strip()
+
+        if icon_file and icon_file in by_icon:
+            match = by_icon[icon_file][0]
             unit_id = make_hash_id([icon_file, rarity, unit_type, obtain])
             unit["id"] = unit_id
             for div in match["weapon_divs"]:
                 div["data-unit-id"] = unit_id   # <-- 무장 div에 data-unit-id 부여
             continue
 
-    # 실패한 경우 기록
-    json_failures.append({
-        "index": i,
-        "name": name,
-        "icon_file": icon_file,
-        "rarity": rarity,
-        "type": unit_type,
-        "obtain": obtain
-    })
-
-# HTML 실패 목록 (data-unit-id 없는 무장 div)
-html_failures = [r for r in rows if not any(div.get("data-unit-id") for div in r["weapon_divs"])]
-
-# 2️⃣ 이름 자동 매칭
-for j in json_failures:
-    candidates = [h for h in html_failures if h["html_name"] == j["name"]]
-    if len(candidates) == 1:
-        # 이름 동일 → 자동 매칭
-        sel = candidates[0]
-        unit_id = make_hash_id([sel["src_file"], sel["rarity"], sel["type"], sel["obtain"]])
-        units[j["index"]]["id"] = unit_id
-        for div in sel["weapon_divs"]:
-            div["data-unit-id"] = unit_id
-        print(f"[자동매칭] JSON({j['index']+1}) {j['name']} → ID={unit_id}")
-    elif len(candidates) > 1:
-        # 후보 여러 개 → 수동 선택
-        print(f"\nJSON({j['index']+1}) {j['name']} icon={j['icon_file']} rarity={j['rarity']} type={j['type']} obtain={j['obtain']}")
-        for k, row in enumerate(candidates, start=1):
-            print(f"  {k}. HTML name={row['html_name']} rarity={row['rarity']} type={row['type']} obtain={row['obtain']} icon={row['src_file']}")
-        choice = input("→ 매칭할 번호 입력: ")
-        if choice.isdigit():
-            sel = candidates[int(choice)-1]
-            unit_id = make_hash_id([sel["src_file"], sel["rarity"], sel["type"], sel["obtain"]])
-            units[j["index"]]["id"] = unit_id
-            for div in sel["weapon_divs"]:
-                div["data-unit-id"] = unit_id
-            print(f"[수동매칭] JSON({j['index']+1}) {j['name']} → ID={unit_id}")
-
-# 출력 디렉토리 생성
-PROCESSED_DATA_DIR.mkdir(parents=True, exist_ok=True)
-
-# 결과 저장
-output_json = PROCESSED_DATA_DIR / "units_with_ids.json"
-output_html = PROCESSED_DATA_DIR / "weapons_with_ids.html"
-
-with open(output_json, "w", encoding="utf-8") as f:
-    json.dump(units, f, indent=4, ensure_ascii=False)
-
-with open(output_html, "w", encoding="utf-8") as f:
-    f.write(str(soup))
-
-print(f"\n✅ 완료!")
-print(f"   출력: {output_json}")
-print(f"   출력: {output_html}")
+        # 실패한 경우 기록
+        json_failures.append({
+            "index": i,
+            "name": name,
+            "icon_file": icon_file,
+            "rarity": rarity,
+            "type": unit_type,
+            "obtain": obtain
+        })
+
+    # HTML 실패 목록 (data-unit-id 없는 무장 div)
+    html_failures = [r for r in rows if not any(div.get("data-unit-id") for div in r["weapon_divs"])]
+    by_name = build_index(html_failures, lambda r: r["html_name"])
+    by_normalized = build_index(html_failures, lambda r: normalize_name(r["html_name"]))
+
+    # 2️⃣ 이름 자동 매칭 (정확히 같은 이름 → 정규화 이름 순)
+    for j in json_failures:
+        candidates = by_name.get(j["name"]) or by_normalized.get(normalize_name(j["name"])) or []
+        if len(candidates) == 1:
+            # 이름 동일 → 자동 매칭
+            unit_id = assign_unit_id(units[j["index"]], candidates[0])
+            if verbose:
+                print(f"[자동매칭] JSON({j['index']+1}) {j['name']} → ID={unit_id}")
+        elif len(candidates) > 1:
+            # 후보 여러 개 → 수동 선택
+            sel = choose(j, candidates)
+            if sel is not None:
+                unit_id = assign_unit_id(units[j["index"]], sel)
+                if verbose:
+                    print(f"[수동매칭] JSON({j['index']+1}) {j['name']} → ID={unit_id}")
+
+    return json_failures
+
+# ======================
+# 벤치마크
+# ======================
+def _match_units_linear(units, rows):
+    """기존 방식 (행 전체 선형 탐색) — 벤치마크 비교용"""
+    json_failures = []
+    for i, unit in enumerate(units):
+        name = unit.get("unit_name", "").strip()
+        icon_file = os.path.basename(unit.get("icon", "").strip())
+        if icon_file:
+            match = next((r for r in rows if r["src_file"] == icon_file), None)
+            if match:
+                unit_id = make_hash_id([icon_file, unit["rarity"], unit["type"], unit["obtain_method"]])
+                unit["id"] = unit_id
+                for div in match["weapon_divs"]:
+                    div["data-unit-id"] = unit_id
+                continue
+        json_failures.append({"index": i, "name": name})
+
+    html_failures = [r for r in rows if not any(div.get("data-unit-id") for div in r["weapon_divs"])]
+    for j in json_failures:
+        candidates = [h for h in html_failures if h["html_name"] == j["name"]]
+        if candidates:
+            assign_unit_id(units[j["index"]], candidates[0])
+
+def _synthetic_dataset(scale, base_size=929, miss_rate=0.05):
+    """scale배 크기의 가상 유닛/행 데이터 (일부는 아이콘 불일치 → 이름 매칭)"""
+    rng = random.Random(0)
+    units, rows = [], []
+    for i in range(base_size * scale):
+        icon = f"{i:07d}_icon.webp"
+        name = f"ユニット{i}"
+        units.append({"unit_name": name, "icon": f"/wp-content/uploads/{icon}",
+                      "rarity": "UR", "type": "耐久", "obtain_method": "ガシャ"})
+        src_file = f"x_{icon}" if rng.random() < miss_rate else icon
+        rows.append({"weapon_divs": [{}, {}, {}, {}], "src_file": src_file,
+                     "rarity": "UR", "type": "耐久", "obtain": "ガシャ", "html_name": name})
+    rng.shuffle(rows)
+    return units, rows
+
+def run_benchmark(scales=(1, 10, 100), linear_max_scale=10):
+    print("⏱️ 매칭 벤치마크 (가상 데이터, 기준 929개 유닛)")
+    print(f"{'배율':>6} {'유닛 수':>9} {'인덱스(초)':>12} {'선형(초)':>12}")
+    for scale in scales:
+        units, rows = _synthetic_dataset(scale)
+        start = time.perf_counter()
+        match_units(units, rows, choose=lambda j, c: None, verbose=False)
+        indexed = time.perf_counter() - start
+
+        linear = "생략"
+        if scale <= linear_max_scale:
+            units, rows = _synthetic_dataset(scale)
+            start = time.perf_counter()
+            _match_units_linear(units, rows)
+            linear = f"{time.perf_counter() - start:.3f}"
+        print(f"{scale:>5}x {len(units):>9} {indexed:>12.3f} {linear:>12}")
+
+# ======================
+# 메인 실행
+# ======================
+def match_weapon_ids(units, soup, interactive=False, threshold=DEFAULT_THRESHOLD, margin=DEFAULT_MARGIN):
+    """
+    units.json 레코드 + weapons_raw.html soup에 ID 부여 (둘 다 그 자리에서 수정)
+    - 파이프라인에서 파일을 거치지 않고 바로 호출할 수 있도록 분리
+    """
+    rows = load_weapon_rows(soup)
+
+    # 파이프라인/CI에서 stdin 대기로 멈추지 않도록 기본은 배치 선택
+    resolver = None
+    if interactive and sys.stdin.isatty():
+        choose = choose_candidate
+    else:
+        resolver = BatchResolver(threshold=threshold, margin=margin)
+        choose = resolver
+
+    match_units(units, rows, choose=choose)
+
+    if resolver is not None:
+        resolver.save()
+        print(f"\n🧮 후보 선택: {resolver.summary()}")
+        if resolver.pending:
+            print(f"   ⚠️ 보류된 {len(resolver.pending)}개는 {RESOLUTION_FILE}의 choice에 번호를 적으면 다음 실행 때 반영됩니다")
+    return units, soup
+
+def load_weapons_soup(input_html=RAW_DATA_DIR / "weapons_raw.html"):
+    with open(input_html, "r", encoding="utf-8") as f:
+        return BeautifulSoup(f, "html.parser")
+
+def save_matched(units, html):
+    """units_with_ids.json / weapons_with_ids.html (str(soup)) 저장"""
+    # 출력 디렉토리 생성
+    PROCESSED_DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+    with open(UNITS_WITH_IDS_JSON, "w", encoding="utf-8") as f:
+        json.dump(units, f, indent=4, ensure_ascii=False)
+
+    with open(WEAPONS_WITH_IDS_HTML, "w", encoding="utf-8") as f:
+        f.write(html)
+
+    print(f"   출력: {UNITS_WITH_IDS_JSON}")
+    print(f"   출력: {WEAPONS_WITH_IDS_HTML}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="units.json ↔ weapons_raw.html 유닛 ID 매칭")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="가상 데이터로 1x/10x/100x 매칭 시간 측정 후 종료")
+    parser.add_argument("--interactive", action="store_true",
+                        help="후보가 여러 개일 때 직접 번호 입력 (터미널에서만, 기본은 자동/보류 기록)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"자동 선택 최소 점수 0~1 (기본 {DEFAULT_THRESHOLD})")
+    parser.add_argument("--margin", type=float, default=DEFAULT_MARGIN,
+                        help=f"자동 선택 시 2위와의 최소 점수 차 (기본 {DEFAULT_MARGIN})")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        run_benchmark()
+        return
+
+    # JSON 로드 (units.json)
+    input_json = PROCESSED_DATA_DIR / "units.json"
+    with open(input_json, "r", encoding="utf-8") as f:
+        units = json.load(f)
+
+    # HTML 로드 (weapons_raw.html)
+    soup = load_weapons_soup()
+
+    match_weapon_ids(units, soup, args.interactive, args.threshold, args.margin)
+
+    # 결과 저장
+    print(f"\n✅ 완료!")
+    save_matched(units, str(soup))
+
+if __name__ == "__main__":
+    main()
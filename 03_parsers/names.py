@@ -0,0 +1,32 @@
+import math
+import re
+
+# 괄호와 내용물 / 괄호 기호 / 공백 / 가운뎃점
+_BRACKETED = re.compile(r'[\(（].*?[\)）]')
+_BRACKETS = re.compile(r'[【】\[\]]')
+_SPACES = re.compile(r'\s+')
+_DOTS = re.compile(r'[・･]')
+
+
+def normalize_name(name):
+    """
+    이름 정규화 (매칭용)
+    - 괄호 제거: (EX), 【SSP】 등
+    - 공백 제거
+    - 특수문자 제거
+    - 번역(translate_to_korean) / ID 매칭(match_weapon_ids) / 검색 인덱스(build_search_index) 공용,
+      pandas 없이 쓸 수 있도록 별도 모듈
+    """
+    if not name or (isinstance(name, float) and math.isnan(name)):
+        return ""
+    
+    name = str(name)
+    # 괄호와 내용물 제거
+    name = _BRACKETED.sub('', name)
+    name = _BRACKETS.sub('', name)
+    # 공백 제거
+    name = _SPACES.sub('', name)
+    # 특수문자 제거
+    name = _DOTS.sub('', name)
+    
+    return name.strip()
@@ -0,0 +1,184 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+# ======================
+# 기본 설정
+# ======================
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_CACHE_DIR = PROJECT_ROOT / "02_raw_data" / "page_cache"
+
+DEFAULT_TTL_DAYS = 30       # 마지막 사용 후 이 기간이 지나면 삭제
+DEFAULT_MAX_MB = 512        # 캐시 전체 용량 상한 (초과 시 오래 안 쓴 것부터 삭제)
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+class PageCache:
+    """
+    유닛 상세 페이지 디스크 캐시
+    - 본문은 내용 해시(sha256) 이름으로 bodies/ 아래에 저장 (같은 내용은 한 번만 저장)
+    - index.json: URL → {body, etag, last_modified, fetched_at, accessed_at, size}
+    - 재요청 시 If-None-Match / If-Modified-Since 조건부 요청 → 304면 캐시 본문 재사용
+    - offline=True: 네트워크 없이 캐시에 있는 페이지만 사용
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_age=0, ttl_days=DEFAULT_TTL_DAYS,
+                 max_mb=DEFAULT_MAX_MB, offline=False):
+        self.cache_dir = Path(cache_dir)
+        self.bodies_dir = self.cache_dir / "bodies"
+        self.index_path = self.cache_dir / "index.json"
+        self.max_age = max_age
+        self.ttl = ttl_days * 86400 if ttl_days else None
+        self.max_bytes = int(max_mb * 1024 * 1024) if max_mb else None
+        self.offline = offline
+        self.stats = {"hit": 0, "revalidated": 0, "downloaded": 0, "miss": 0}
+
+        self._lock = threading.Lock()
+        self.bodies_dir.mkdir(parents=True, exist_ok=True)
+        if self.index_path.exists():
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                self.index = json.load(f)
+        else:
+            self.index = {}
+
+    # ----------------------
+    # 조회 / 저장
+    # ----------------------
+    def _read_body(self, entry):
+        path = self.bodies_dir / f"{entry['body']}.html"
+        if not path.exists():
+            return None
+        return path.read_text(encoding="utf-8")
+
+    def _store(self, url, text, etag, last_modified):
+        data = text.encode("utf-8")
+        digest = _sha256(data)
+        path = self.bodies_dir / f"{digest}.html"
+        if not path.exists():
+            tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+
+        now = time.time()
+        with self._lock:
+            self.index[url] = {
+                "body": digest,
+                "etag": etag,
+                "last_modified": last_modified,
+                "fetched_at": now,
+                "accessed_at": now,
+                "size": len(data)
+            }
+
+    def _touch(self, url, fetched=False):
+        with self._lock:
+            entry = self.index.get(url)
+            if entry:
+                entry["accessed_at"] = time.time()
+                if fetched:
+                    entry["fetched_at"] = entry["accessed_at"]
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def get(self, url, http_get):
+        """
+        캐시를 거쳐 url 본문 반환
+        - http_get(url, headers=...) → requests.Response 호환 객체
+        - 실패(비 200/304, 오프라인 캐시 미스): None
+        """
+        with self._lock:
+            entry = dict(self.index[url]) if url in self.index else None
+
+        body = self._read_body(entry) if entry else None
+        if body is None:
+            entry = None
+
+        # 오프라인 모드: 캐시에 있는 것만 사용
+        if self.offline:
+            if entry is None:
+                self._count("miss")
+                print(f"[CACHE] 오프라인 캐시 미스: {url}")
+                return None
+            self._touch(url)
+            self._count("hit")
+            return body
+
+        # max_age 이내면 재검증 없이 사용
+        if entry and self.max_age and time.time() - entry["fetched_at"] < self.max_age:
+            self._touch(url)
+            self._count("hit")
+            return body
+
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        res = http_get(url, headers=headers)
+        if res.status_code == 304 and entry:
+            self._touch(url, fetched=True)
+            self._count("revalidated")
+            return body
+        if res.status_code != 200:
+            print(f"[ERROR] 페이지 요청 실패: {res.status_code} ({url})")
+            return None
+
+        self._store(url, res.text, res.headers.get("ETag"), res.headers.get("Last-Modified"))
+        self._count("downloaded")
+        return res.text
+
+    # ----------------------
+    # 정리 / 저장
+    # ----------------------
+    def prune(self):
+        """TTL 초과 항목 삭제 후, 용량 상한을 넘으면 오래 안 쓴 항목부터 삭제"""
+        now = time.time()
+        with self._lock:
+            if self.ttl:
+                for url in [u for u, e in self.index.items() if now - e["accessed_at"] > self.ttl]:
+                    del self.index[url]
+
+            if self.max_bytes:
+                # 같은 본문을 공유하는 URL은 한 번만 계산
+                sizes = {e["body"]: e["size"] for e in self.index.values()}
+                total = sum(sizes.values())
+                for url, entry in sorted(self.index.items(), key=lambda item: item[1]["accessed_at"]):
+                    if total <= self.max_bytes:
+                        break
+                    del self.index[url]
+                    if not any(e["body"] == entry["body"] for e in self.index.values()):
+                        total -= sizes.pop(entry["body"], 0)
+
+            referenced = {e["body"] for e in self.index.values()}
+
+        removed = 0
+        for path in self.bodies_dir.glob("*.html"):
+            if path.stem not in referenced:
+                path.unlink()
+                removed += 1
+        return removed
+
+    def save(self):
+        """index.json 저장 (정리 포함)"""
+        if not self.offline:
+            self.prune()
+        with self._lock:
+            tmp = self.index_path.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.index, f, ensure_ascii=False, indent=2)
+            os.replace(tmp, self.index_path)
+
+    def summary(self):
+        s = self.stats
+        return (f"캐시 적중 {s['hit']}개 / 재검증(304) {s['revalidated']}개 / "
+                f"다운로드 {s['downloaded']}개 / 미스 {s['miss']}개")
@@ -1,5 +1,11 @@
+import argparse
+import io
 import json
+import subprocess
+import sys
+import time
 from bs4 import BeautifulSoup
+from lxml import etree
 from pathlib import Path
 import re
 
@@ -24,71 +30,49 @@ def safe_int(val):
 def clean_text(txt):
     return re.sub(r"\s+", " ", txt).strip()
 
-# ======================
-# HTML 로드
-# ======================
-html = Path(HTML_PATH).read_text(encoding="utf-8")
-soup = BeautifulSoup(html, "html.parser")
-
-weapons = []
+def build_weapon(attrs, name, power_text, range_text, elements, effect_text, effect_raw):
+    """
+    무장 1개 레코드 생성 (BeautifulSoup / 스트리밍 파서 공용)
+    - attrs: .weapon_effect_wrapper div의 속성 dict
+    - effect_text: 효과 텍스트를 " "로 이어 붙인 것, effect_raw: 그대로 이어 붙인 것 (None이면 효과 없음)
+    """
+    unit_id = attrs.get("data-unit-id") or attrs.get("id") or ""
 
-# ======================
-# 무장 파싱
-# ======================
-for div in soup.select(".weapon_effect_wrapper"):
-    unit_id = div.get("data-unit-id") or div.get("id") or ""
-    
     # 무장명
-    name_span = div.select_one(".weapon_name span")
-    name = clean_text(name_span.text.replace("【", "").replace("】", "")) if name_span else ""
-    
+    name = clean_text(name.replace("【", "").replace("】", "")) if name is not None else ""
+
     # POWER
-    pow_span = div.select_one(".weapon_pow span")
-    power = safe_int(pow_span.text.replace(",", "")) if pow_span else 0
-    
+    power = safe_int(power_text.replace(",", "")) if power_text is not None else 0
+
     # RANGE
-    range_min = safe_int(div.get("data-range_min"))
-    range_max = safe_int(div.get("data-range_max"))
-    range_text = ""
-    range_span = div.select_one(".weapon_range span")
-    if range_span:
-        range_text = clean_text(range_span.text)
-    
-    # 속성 (ビーム / 物理 / 射撃 / 格闘 / 覚醒 등)
-    elements = []
-    for e in div.select(".weapon_elem"):
-        t = e.get("data-type")
-        if t:
-            elements.append(t)
-    
+    range_min = safe_int(attrs.get("data-range_min"))
+    range_max = safe_int(attrs.get("data-range_max"))
+    range_text = clean_text(range_text) if range_text is not None else ""
+
     # MAP
-    is_map = div.get("data-weapon_category") == "MAP兵器"
-    map_type = div.get("data-map_weapon_type") or ""
-    
+    is_map = attrs.get("data-weapon_category") == "MAP兵器"
+    map_type = attrs.get("data-map_weapon_type") or ""
+
     # SSP
-    ssp_type = div.get("data-ssp_weapon") or "通常"
+    ssp_type = attrs.get("data-ssp_weapon") or "通常"
     is_ssp = ssp_type != "通常"
-    
+
     # 효과 태그
     effect_tags = []
-    if div.get("data-effect_tag"):
+    if attrs.get("data-effect_tag"):
         effect_tags = [
             t.strip()
-            for t in div["data-effect_tag"].split(",")
+            for t in attrs["data-effect_tag"].split(",")
             if t.strip()
         ]
-    
-    # 효과 텍스트 (HTML 제거 버전)
-    effect_div = div.select_one(".weapon_effect")
-    effect_text = clean_text(effect_div.get_text(" ")) if effect_div else ""
-    
+
     # % 수치 최대값
     percents = []
-    if effect_div:
-        percents = [int(p) for p in re.findall(r"(\d+)%", effect_div.text)]
+    if effect_raw is not None:
+        percents = [int(p) for p in re.findall(r"(\d+)%", effect_raw)]
     max_effect_percent = max(percents) if percents else 0
-    
-    weapon = {
+
+    return {
         "unit_id": unit_id,
         "name": name,
         "power": power,
@@ -103,15 +87,184 @@ for div in soup.select(".weapon_effect_wrapper"):
         "ssp": ssp_type,
         "is_ssp": is_ssp,
         "effect_tags": effect_tags,
-        "effect_text": effect_text,
+        "effect_text": clean_text(effect_text) if effect_text is not None else "",
         "max_effect_percent": max_effect_percent
     }
-    weapons.append(weapon)
+
+# ======================
+# BeautifulSoup 파싱 (전체 트리)
+# ======================
+def parse_weapon_div(div):
+    name_span = div.select_one(".weapon_name span")
+    pow_span = div.select_one(".weapon_pow span")
+    range_span = div.select_one(".weapon_range span")
+
+    # 속성 (ビーム / 物理 / 射撃 / 格闘 / 覚醒 등)
+    elements = []
+    for e in div.select(".weapon_elem"):
+        t = e.get("data-type")
+        if t:
+            elements.append(t)
+
+    # 효과 텍스트 (HTML 제거 버전)
+    effect_div = div.select_one(".weapon_effect")
+
+    attrs = {k: " ".join(v) if isinstance(v, list) else v for k, v in div.attrs.items()}
+    return build_weapon(
+        attrs,
+        name_span.text if name_span else None,
+        pow_span.text if pow_span else None,
+        range_span.text if range_span else None,
+        elements,
+        effect_div.get_text(" ") if effect_div else None,
+        effect_div.text if effect_div else None
+    )
+
+def parse_weapons_soup(html_path=HTML_PATH):
+    html = Path(html_path).read_text(encoding="utf-8")
+    soup = BeautifulSoup(html, "html.parser")
+    return [parse_weapon_div(div) for div in soup.select(".weapon_effect_wrapper")]
+
+# ======================
+# 스트리밍 파싱 (lxml iterparse)
+# ======================
+def _has_class(el, cls):
+    return cls in (el.get("class") or "").split()
+
+def _select_one(root, cls, tag="*"):
+    """root 하위에서 class=cls 요소 안에 있는 첫 번째 tag (CSS '.cls tag' 와 동일한 순서)"""
+    for el in root.iter(tag):
+        if el is root:
+            continue
+        parent = el.getparent()
+        while parent is not None and parent is not root:
+            if _has_class(parent, cls):
+                return el
+            parent = parent.getparent()
+    return None
+
+def _inside_wrapper(el):
+    parent = el.getparent()
+    while parent is not None:
+        if _has_class(parent, "weapon_effect_wrapper"):
+            return True
+        parent = parent.getparent()
+    return False
+
+def _first_with_class(root, cls):
+    for el in root.iter():
+        if el is not root and isinstance(el.tag, str) and _has_class(el, cls):
+            return el
+    return None
+
+def _text(el, sep=""):
+    return sep.join(el.itertext()) if el is not None else None
+
+def parse_weapon_element(el):
+    elements = []
+    for e in el.iter():
+        if e is not el and isinstance(e.tag, str) and _has_class(e, "weapon_elem"):
+            t = e.get("data-type")
+            if t:
+                elements.append(t)
+
+    effect_el = _first_with_class(el, "weapon_effect")
+    return build_weapon(
+        dict(el.attrib),
+        _text(_select_one(el, "weapon_name", "span")),
+        _text(_select_one(el, "weapon_pow", "span")),
+        _text(_select_one(el, "weapon_range", "span")),
+        elements,
+        _text(effect_el, " "),
+        _text(effect_el)
+    )
+
+def iter_weapons_streaming(html_path=HTML_PATH):
+    """
+    weapons_with_ids.html을 이벤트 단위로 읽으며 무장 레코드를 하나씩 생성
+    - 처리한 .weapon_effect_wrapper / tr 요소는 바로 비워서 트리가 커지지 않게 함
+    - html_path 대신 바이너리 파일 객체도 가능
+    """
+    source = html_path if hasattr(html_path, "read") else str(html_path)
+    context = etree.iterparse(source, events=("end",), tag=("div", "tr"), html=True, encoding="utf-8")
+    for _, el in context:
+        if el.tag == "div":
+            if not _has_class(el, "weapon_effect_wrapper"):
+                continue
+            yield parse_weapon_element(el)
+        elif _inside_wrapper(el) or any(_has_class(d, "weapon_effect_wrapper") for d in el.iter("div")):
+            # 무장 div 안의 행이거나, 아직 처리 안 된 무장 div가 남아있는 행은 유지
+            continue
+
+        el.clear(keep_tail=True)
+        while el.getprevious() is not None:
+            del el.getparent()[0]
+    del context
+
+def weapons_from_html(html):
+    """메모리에 있는 weapons_with_ids.html 문자열 → 무장 목록 (파이프라인 한 프로세스 실행용)"""
+    return list(iter_weapons_streaming(io.BytesIO(html.encode("utf-8"))))
+
+# ======================
+# 벤치마크
+# ======================
+def _measure(mode, html_path):
+    """자식 프로세스에서 한 가지 방식만 실행해 시간 / 최대 메모리 측정"""
+    import resource
+
+    start = time.perf_counter()
+    if mode == "soup":
+        count = len(parse_weapons_soup(html_path))
+    else:
+        count = sum(1 for _ in iter_weapons_streaming(html_path))
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"mode": mode, "count": count, "seconds": elapsed, "peak_mb": peak_kb / 1024}))
+
+def run_benchmark(html_path):
+    print(f"⏱️ 무장 파싱 벤치마크: {html_path}")
+    for mode in ("soup", "stream"):
+        out = subprocess.run(
+            [sys.executable, __file__, "--measure", mode, "--input", str(html_path)],
+            capture_output=True, text=True, check=True
+        ).stdout
+        r = json.loads(out.strip().splitlines()[-1])
+        print(f"   {r['mode']:>6}: {r['count']}개, {r['seconds']:.2f}초, 최대 RSS {r['peak_mb']:.0f} MB")
 
 # ======================
 # JSON 저장
 # ======================
-with open(OUTPUT_JSON, "w", encoding="utf-8") as f:
-    json.dump(weapons, f, ensure_ascii=False, indent=2)
+def save_weapons(weapons):
+    with open(OUTPUT_JSON, "w", encoding="utf-8") as f:
+        json.dump(weapons, f, ensure_ascii=False, indent=2)
+
+    print(f"✅ 무장 {len(weapons)}개 추출 완료 → {OUTPUT_JSON}")
+
+# ======================
+# 메인 실행
+# ======================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="weapons_with_ids.html → weapons.json")
+    parser.add_argument("--mode", choices=["stream", "soup"], default="stream",
+                        help="stream: lxml 스트리밍 파싱 (기본) / soup: BeautifulSoup 전체 트리")
+    parser.add_argument("--input", default=str(HTML_PATH), help="입력 HTML (기본 weapons_with_ids.html)")
+    parser.add_argument("--benchmark", action="store_true", help="두 방식의 시간/최대 메모리 비교 후 종료")
+    parser.add_argument("--measure", choices=["stream", "soup"], help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.measure:
+        _measure(args.measure, args.input)
+        return
+    if args.benchmark:
+        run_benchmark(args.input)
+        return
+
+    if args.mode == "soup":
+        weapons = parse_weapons_soup(args.input)
+    else:
+        weapons = list(iter_weapons_streaming(args.input))
+
+    save_weapons(weapons)
 
-print(f"✅ 무장 {len(weapons)}개 추출 완료 → {OUTPUT_JSON}")
+if __name__ == "__main__":
+    main()
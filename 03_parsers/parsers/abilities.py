@@ -1,12 +1,16 @@
+from parsers.block_index import BlockIndex
+
+
 def parse_abilities(target_block, has_ssp):
+    index = BlockIndex.of(target_block)
     abilities = {"before_ssp": [], "after_ssp": []}
 
     def collect(container):
         result = []
         if not container:
             return result
-        for table in container.find_all("table"):
-            header = table.find("th")
+        for table in index.tables_within(container):
+            header = index.first_th(table)
             if header and "アビリティ" in header.get_text():
                 rows = table.find_all("tr")[1:]
                 for row in rows:
@@ -19,13 +23,13 @@ def parse_abilities(target_block, has_ssp):
 
     if has_ssp:
         # select_one → select 로 바꿔서 두 블록 모두 가져오기
-        before_blocks = target_block.select("div.ssp_weapon_table[data-ssp='0']")
-        after_blocks  = target_block.select("div.ssp_weapon_table[data-ssp='1']")
+        before_blocks = index.ssp_blocks.get("0", [])
+        after_blocks  = index.ssp_blocks.get("1", [])
         for b in before_blocks:
             abilities["before_ssp"].extend(collect(b))
         for a in after_blocks:
             abilities["after_ssp"].extend(collect(a))
     else:
-        abilities["before_ssp"] = collect(target_block)
+        abilities["before_ssp"] = collect(index.block)
 
     return abilities
\ No newline at end of file
@@ -0,0 +1,76 @@
+import re
+from html import unescape
+from bs4 import BeautifulSoup, SoupStrainer
+
+BLOCK_CLASS = "same_unit_table"
+
+# 주석 / script / style 은 통째로 건너뛰고 div 시작·끝 태그만 셈
+_TOKEN = re.compile(
+    r"<!--.*?-->"
+    r"|<(script|style)\b[^>]*>.*?</\1\s*>"
+    r"|<(/?)div\b((?:[^>\"']|\"[^\"]*\"|'[^']*')*)>",
+    re.I | re.S
+)
+_ATTR = re.compile(r"""([^\s=/>"']+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+)))?""")
+
+
+def target_matches(target, rarity, unit_type, obtain_method):
+    """data-target 값이 레어도 / 타입 / 입수방법을 모두 포함하는지"""
+    return rarity in target and unit_type in target and obtain_method in target
+
+
+def _parse_attrs(text):
+    attrs = {}
+    for m in _ATTR.finditer(text):
+        value = m.group(2) if m.group(2) is not None else m.group(3) if m.group(3) is not None else m.group(4) or ""
+        attrs[m.group(1).lower()] = unescape(value)
+    return attrs
+
+
+def _find_close(tokens):
+    """이미 연 div 1개에 대응하는 </div> 끝 위치 (끝까지 닫히지 않으면 None)"""
+    depth = 1
+    for token in tokens:
+        if token.group(2) is None:
+            continue
+        if token.group(2):
+            depth -= 1
+            if depth == 0:
+                return token.end()
+        elif not token.group(3).rstrip().endswith("/"):
+            depth += 1
+    return None
+
+
+def _strained_block(html, rarity, unit_type, obtain_method):
+    """SoupStrainer 로 div.same_unit_table 만 트리로 만들어 찾기 (스캔 실패 시 대체 경로)"""
+    soup = BeautifulSoup(html, "html.parser", parse_only=SoupStrainer("div", class_=BLOCK_CLASS))
+    for div in soup.select(f"div.{BLOCK_CLASS}"):
+        if target_matches(div.get("data-target", ""), rarity, unit_type, obtain_method):
+            return div
+    return None
+
+
+def extract_target_block(html, rarity, unit_type, obtain_method):
+    """
+    페이지 HTML → 조건이 맞는 div.same_unit_table 태그 (없으면 None)
+    - 페이지 전체(광고 / 메뉴 / 댓글)를 트리로 만들지 않고, 정규식으로 div 태그만 훑어서
+      맞는 블록의 HTML 조각만 BeautifulSoup 으로 파싱
+    - 블록이 닫히지 않는 등 스캔으로 범위를 정할 수 없으면 SoupStrainer 로 대체
+    - 결과는 BeautifulSoup(html).select("div.same_unit_table") 로 찾은 블록과 동일
+    """
+    tokens = _TOKEN.finditer(html)
+    for token in tokens:
+        if token.group(2) != "" or token.group(3).rstrip().endswith("/"):
+            continue
+        attrs = _parse_attrs(token.group(3))
+        if BLOCK_CLASS not in attrs.get("class", "").split():
+            continue
+        if not target_matches(attrs.get("data-target", ""), rarity, unit_type, obtain_method):
+            continue
+
+        end = _find_close(tokens)
+        if end is None:
+            return _strained_block(html, rarity, unit_type, obtain_method)
+        return BeautifulSoup(html[token.start():end], "html.parser").div
+    return None
\ No newline at end of file
@@ -0,0 +1,125 @@
+from bs4.element import Tag
+
+
+class BlockIndex:
+    """
+    유닛 블록(div.same_unit_table)을 한 번만 순회해서 파서들이 쓰는 요소를 미리 분류
+    - tables / rows: 블록 안의 모든 table / tr (문서 순서)
+    - weapon_containers: div.weapon_container
+    - ssp_blocks: div.ssp_weapon_table 를 data-ssp 값별로
+    - custom_core_table: 첫 번째 table.custom_core_table
+    - 각 table의 첫 th / 첫 th[colspan=2] (어빌리티 / 機構 표 판별용)
+    """
+
+    def __init__(self, block):
+        self.block = block
+        self.tables = []
+        self.rows = []
+        self.weapon_containers = []
+        self.ssp_blocks = {}
+        self.custom_core_table = None
+        self._first_th = {}
+        self._first_colspan_th = {}
+        self._tables_in = {id(block): self.tables}
+        self._weapons_in = {id(block): self.weapon_containers}
+        self._walk(block, [], [])
+
+    @classmethod
+    def of(cls, block):
+        """이미 BlockIndex면 그대로, 태그면 새로 생성"""
+        return block if isinstance(block, (BlockIndex, ScanIndex)) else cls(block)
+
+    def _walk(self, node, open_tables, containers):
+        for child in node.children:
+            if not isinstance(child, Tag):
+                continue
+            name = child.name
+            child_tables = open_tables
+            child_containers = containers
+
+            if name == "table":
+                self.tables.append(child)
+                for container in containers:
+                    self._tables_in[id(container)].append(child)
+                if self.custom_core_table is None and "custom_core_table" in child.get("class", []):
+                    self.custom_core_table = child
+                child_tables = open_tables + [child]
+            elif name == "tr":
+                self.rows.append(child)
+            elif name == "th":
+                colspan2 = child.get("colspan") == "2"
+                for table in open_tables:
+                    self._first_th.setdefault(id(table), child)
+                    if colspan2:
+                        self._first_colspan_th.setdefault(id(table), child)
+            elif name == "div":
+                classes = child.get("class", [])
+                if "weapon_container" in classes:
+                    self.weapon_containers.append(child)
+                    for container in containers:
+                        self._weapons_in[id(container)].append(child)
+                if "ssp_weapon_table" in classes and child.has_attr("data-ssp"):
+                    self.ssp_blocks.setdefault(child["data-ssp"], []).append(child)
+                    self._tables_in[id(child)] = []
+                    self._weapons_in[id(child)] = []
+                    child_containers = containers + [child]
+
+            self._walk(child, child_tables, child_containers)
+
+    def ssp_block(self, ssp):
+        """data-ssp 값이 같은 첫 번째 블록 (없으면 None)"""
+        blocks = self.ssp_blocks.get(ssp)
+        return blocks[0] if blocks else None
+
+    def tables_within(self, container=None):
+        """container(블록 자신 또는 SSP 블록) 안의 table 목록"""
+        return self._tables_in[id(container if container is not None else self.block)]
+
+    def weapons_within(self, container=None):
+        """container(블록 자신 또는 SSP 블록) 안의 div.weapon_container 목록"""
+        return self._weapons_in[id(container if container is not None else self.block)]
+
+    def first_th(self, table, colspan2=False):
+        """table.find("th") / table.find("th", colspan="2") 와 동일"""
+        return (self._first_colspan_th if colspan2 else self._first_th).get(id(table))
+
+
+class ScanIndex:
+    """
+    BlockIndex와 같은 인터페이스를 호출할 때마다 find_all / select 로 응답 (기존 방식)
+    - 벤치마크 비교용
+    """
+
+    def __init__(self, block):
+        self.block = block
+
+    @property
+    def tables(self):
+        return self.block.find_all("table")
+
+    @property
+    def rows(self):
+        return self.block.find_all("tr")
+
+    @property
+    def custom_core_table(self):
+        return self.block.select_one("table.custom_core_table")
+
+    def ssp_block(self, ssp):
+        return self.block.select_one(f"div.ssp_weapon_table[data-ssp='{ssp}']")
+
+    @property
+    def ssp_blocks(self):
+        blocks = {}
+        for div in self.block.select("div.ssp_weapon_table[data-ssp]"):
+            blocks.setdefault(div["data-ssp"], []).append(div)
+        return blocks
+
+    def tables_within(self, container=None):
+        return (container if container is not None else self.block).find_all("table")
+
+    def weapons_within(self, container=None):
+        return (container if container is not None else self.block).select("div.weapon_container")
+
+    def first_th(self, table, colspan2=False):
+        return table.find("th", colspan="2") if colspan2 else table.find("th")
@@ -1,7 +1,11 @@
+from parsers.block_index import BlockIndex
+
+
 def parse_mechanism(target_block):
+    index = BlockIndex.of(target_block)
     mechanisms = []
-    for table in target_block.find_all("table"):
-        header = table.find("th", colspan="2")
+    for table in index.tables:
+        header = index.first_th(table, colspan2=True)
         if header and "機構" in header.get_text():
             for row in table.find_all("tr")[1:]:
                 cols = row.find_all("td")
@@ -1,7 +1,11 @@
+from parsers.block_index import BlockIndex
+
+
 def parse_movement(target_block, custom_core):
+    index = BlockIndex.of(target_block)
     before_move = None
     after_move = None
-    for row in target_block.find_all("tr"):
+    for row in index.rows:
         cells = row.find_all("td")
         if len(cells) >= 2:
             label = cells[0].get_text(strip=True)
@@ -1,8 +1,17 @@
-def extract_weapons(container):
+from parsers.block_index import BlockIndex
+
+
+def extract_weapons(container, index=None):
+    """
+    container(유닛 블록 또는 SSP 블록) 안의 무장 목록
+    - index: 유닛 블록의 BlockIndex (없으면 container만 새로 색인)
+    """
     weapons = []
     if not container:
         return weapons
-    for w in container.select("div.weapon_container"):
+    if index is None:
+        index = BlockIndex(container)
+    for w in index.weapons_within(container):
         name = w.select_one("div.w_name").get_text(strip=True)
         attrs = [elem.get_text(strip=True) for elem in w.select("div.w_element div.weapon_elem")]
 
@@ -0,0 +1,92 @@
+from collections import deque
+
+
+class TermReplacer:
+    """
+    여러 용어를 한 번에 치환하는 Aho-Corasick 기반 치환기
+    - 한 번 만들어 두고 모든 유닛/무기 텍스트에 재사용
+    - 결과는 기존 방식(긴 용어부터 str.replace를 차례로 적용)과 동일
+      · 긴 용어 우선, 길이가 같으면 사전 순서(먼저 들어온 것) 우선
+      · 이미 치환된 부분과 겹치는 짧은 용어는 치환하지 않음
+    """
+
+    def __init__(self, terms):
+        # 우선순위: 길이 내림차순, 같은 길이면 입력 순서 (기존 sorted(..., reverse=True)와 동일한 안정 정렬)
+        ordered = sorted(
+            ((ja, ko) for ja, ko in terms.items() if ja),
+            key=lambda x: len(x[0]),
+            reverse=True
+        )
+        self.patterns = [ja for ja, _ in ordered]
+        self.replacements = [ko for _, ko in ordered]
+
+        # trie
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        for rank, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(rank)
+
+        # 실패 링크 (BFS)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def find_all(self, text):
+        """텍스트에 나타나는 모든 (겹침 포함) 용어 위치 → [(rank, start, end)]"""
+        matches = []
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for rank in out[state]:
+                matches.append((rank, i + 1 - len(self.patterns[rank]), i + 1))
+        return matches
+
+    def replace(self, text):
+        matches = self.find_all(text)
+        if not matches:
+            return text
+
+        # 우선순위 높은 용어부터, 같은 용어는 왼쪽부터 겹치지 않게 선택
+        matches.sort()
+        taken = bytearray(len(text))
+        chosen = []
+        for rank, start, end in matches:
+            if any(taken[start:end]):
+                continue
+            taken[start:end] = b"\x01" * (end - start)
+            chosen.append((start, end, rank))
+
+        chosen.sort()
+        parts = []
+        pos = 0
+        for start, end, rank in chosen:
+            parts.append(text[pos:start])
+            parts.append(self.replacements[rank])
+            pos = end
+        parts.append(text[pos:])
+        return "".join(parts)
@@ -1,8 +1,14 @@
+import argparse
+import hashlib
 import json
 import pandas as pd
+import pickle
 import re
 from pathlib import Path
 
+from names import normalize_name
+from term_replacer import TermReplacer
+
 # ======================
 # 경로 설정
 # ======================
@@ -22,6 +28,18 @@ AUTO_TRANSLATION = TRANSLATION_DIR / "auto_translation.json"
 MANUAL_TRANSLATION = TRANSLATION_DIR / "manual_translation.json"
 ERROR_CORRECTION = TRANSLATION_DIR / "error_correction.json"
 
+# auto_translation.json을 만든 엑셀 해시 / 빌더 버전 기록 (변경 감지용)
+AUTO_TRANSLATION_META = TRANSLATION_DIR / "auto_translation.meta.json"
+AUTO_TRANSLATION_BUILDER_VERSION = 1    # build_auto_translation 결과가 바뀌면 올림
+
+# 컴파일된 사전 캐시 (정규화 맵 + 치환기, 자동 생성)
+COMPILED_DICTS = TRANSLATION_DIR / "compiled_dicts.pkl"
+COMPILED_DICTS_VERSION = 1    # 컴파일 형식이 바뀌면 올림
+TERM_REPLACER_SOURCE = Path(__file__).parent / "term_replacer.py"
+NAMES_SOURCE = Path(__file__).parent / "names.py"
+# 정규화 맵은 names.normalize_name + 이 파일의 build_normalized_map 으로 만들므로 둘 다 캐시 키에 포함
+COMPILED_DICTS_SOURCES = (Path(__file__), NAMES_SOURCE, TERM_REPLACER_SOURCE)
+
 # 출력 파일
 OUTPUT_UNITS_KR = PROCESSED_DATA_DIR / "units_kr.json"
 OUTPUT_WEAPONS_KR = PROCESSED_DATA_DIR / "weapons_kr.json"
@@ -31,27 +49,6 @@ UNTRANSLATED_WEAPONS = TRANSLATION_DIR / "untranslated_weapons.json"
 # ======================
 # 유틸 함수
 # ======================
-def normalize_name(name):
-    """
-    이름 정규화 (매칭용)
-    - 괄호 제거: (EX), 【SSP】 등
-    - 공백 제거
-    - 특수문자 제거
-    """
-    if not name or pd.isna(name):
-        return ""
-    
-    name = str(name)
-    # 괄호와 내용물 제거
-    name = re.sub(r'[\(（].*?[\)）]', '', name)
-    name = re.sub(r'[【】\[\]]', '', name)
-    # 공백 제거
-    name = re.sub(r'\s+', '', name)
-    # 특수문자 제거
-    name = re.sub(r'[・･]', '', name)
-    
-    return name.strip()
-
 def safe_str(val):
     """NaN 처리"""
     if pd.isna(val):
@@ -61,186 +58,257 @@ def safe_str(val):
 # ======================
 # 엑셀 파일 변경 감지
 # ======================
-def check_excel_modified():
+def file_sha256(path):
+    """파일 내용 해시 (없으면 None)"""
+    if not path.exists():
+        return None
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def auto_translation_meta():
+    """현재 엑셀 2개 + 빌더 버전으로 만든 메타 정보"""
+    return {
+        "builder_version": AUTO_TRANSLATION_BUILDER_VERSION,
+        "sources": {
+            EXCEL_KO.name: file_sha256(EXCEL_KO),
+            EXCEL_JA.name: file_sha256(EXCEL_JA)
+        }
+    }
+
+def save_auto_translation_meta(meta):
+    """auto_translation.json을 만든 입력 정보 + 결과 해시 저장"""
+    meta = dict(meta, output=file_sha256(AUTO_TRANSLATION))
+    with open(AUTO_TRANSLATION_META, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+
+def check_excel_modified(meta=None):
     """
     엑셀 파일이 변경되었는지 확인
-    auto_translation.json과 비교
+    - 수정 시간이 아니라 내용 해시로 비교 (git checkout 후에도 불필요한 재생성 없음)
+    - 엑셀 해시 / 빌더 버전 / auto_translation.json 해시가 meta 파일과 모두 같으면 False
     """
     if not AUTO_TRANSLATION.exists():
         return True  # auto_translation.json 없으면 새로 생성
     
-    # auto_translation.json 수정 시간
-    auto_mtime = AUTO_TRANSLATION.stat().st_mtime
+    # 엑셀이 없으면 다시 만들 수 없으므로 기존 파일 사용
+    if not EXCEL_KO.exists() or not EXCEL_JA.exists():
+        return False
     
-    # 엑셀 파일 수정 시간
-    excel_ko_mtime = EXCEL_KO.stat().st_mtime if EXCEL_KO.exists() else 0
-    excel_ja_mtime = EXCEL_JA.stat().st_mtime if EXCEL_JA.exists() else 0
+    if not AUTO_TRANSLATION_META.exists():
+        return True
+    
+    try:
+        with open(AUTO_TRANSLATION_META, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return True
     
-    # 엑셀이 auto_translation.json보다 최신이면 True
-    if excel_ko_mtime > auto_mtime or excel_ja_mtime > auto_mtime:
+    meta = meta or auto_translation_meta()
+    if saved.get("builder_version") != meta["builder_version"] or saved.get("sources") != meta["sources"]:
         return True
     
-    return False
+    # auto_translation.json이 직접 수정/교체된 경우도 재생성
+    return saved.get("output") != file_sha256(AUTO_TRANSLATION)
 
 # ======================
 # 엑셀에서 auto_translation.json 생성
 # ======================
-def build_auto_translation():
+# 엑셀 컬럼 매핑: (일본어 엑셀 컬럼, 한글 엑셀 컬럼)
+UNIT_COLUMNS = [('Unit_Name_0_ja', 'Unit_Name')]
+WEAPON_COLUMNS = [(f'Weapon_Name_ja_{w}', f'Weapons_{w}') for w in range(1, 8)]
+ABILITY_NAME_COLUMNS = [(f'Ability_Name_ja_{a}', f'Ability_Name_{a}') for a in range(1, 5)]
+ABILITY_DESC_COLUMNS = [(f'Ability_Description_ja_{a}', f'Ability_Description_{a}') for a in range(1, 5)]
+ALL_COLUMNS = UNIT_COLUMNS + WEAPON_COLUMNS + ABILITY_NAME_COLUMNS + ABILITY_DESC_COLUMNS
+
+def clean_columns(df):
+    """safe_str을 열 단위로 적용 (NaN → "", 문자열화 + strip)"""
+    return df.apply(lambda col: col.where(col.notna(), "").astype(str).str.strip())
+
+def column_pairs(ja_df, ko_df, columns):
+    """
+    (일본어, 한글) 컬럼 그룹을 한 번에 펼쳐서 둘 다 값이 있는 쌍만 반환
+    - 순서는 기존 행 단위 루프와 동일 (행 → 컬럼 순)
+    """
+    columns = [(ja, ko) for ja, ko in columns if ja in ja_df.columns and ko in ko_df.columns]
+    if not columns:
+        return [], []
+    
+    n = min(len(ko_df), len(ja_df))
+    ja_values = clean_columns(ja_df[[ja for ja, _ in columns]].iloc[:n]).to_numpy()
+    ko_values = clean_columns(ko_df[[ko for _, ko in columns]].iloc[:n]).to_numpy()
+    
+    # 2차원 불리언 인덱싱은 행 우선(row-major) 순서로 펼쳐짐
+    mask = (ja_values != "") & (ko_values != "")
+    return ja_values[mask].tolist(), ko_values[mask].tolist()
+
+def build_auto_translation(only_needed_columns=True):
     """
     엑셀 파일들을 읽어서 auto_translation.json 생성
+    - only_needed_columns: 번역에 쓰는 컬럼만 읽기 (usecols)
     """
     print("📖 엑셀 파일 로드 중...")
     
-    ko_df = pd.read_excel(EXCEL_KO)
-    ja_df = pd.read_excel(EXCEL_JA)
+    ja_usecols = ko_usecols = None
+    if only_needed_columns:
+        ja_needed = {ja for ja, _ in ALL_COLUMNS}
+        ko_needed = {ko for _, ko in ALL_COLUMNS}
+        ja_usecols = lambda col: col in ja_needed
+        ko_usecols = lambda col: col in ko_needed
+    
+    ko_df = pd.read_excel(EXCEL_KO, usecols=ko_usecols)
+    ja_df = pd.read_excel(EXCEL_JA, usecols=ja_usecols)
     
     print(f"   한글: {len(ko_df)}개 행")
     print(f"   일본어: {len(ja_df)}개 행")
     
-    auto_dict = {
-        "units": {},
-        "weapons": {},
-        "ability_terms": {}
-    }
-    
-    # 정규화된 이름으로도 검색 가능하도록
-    normalized_map = {
-        "units": {},
-        "weapons": {},
-        "ability_terms": {}
-    }
-    
     print("\n🔄 auto_translation.json 생성 중...")
     
-    for i in range(min(len(ko_df), len(ja_df))):
-        # 유닛명
-        ja_unit = safe_str(ja_df.iloc[i]['Unit_Name_0_ja'])
-        ko_unit = safe_str(ko_df.iloc[i]['Unit_Name'])
-        
-        if ja_unit and ko_unit:
-            auto_dict["units"][ja_unit] = ko_unit
-            normalized_map["units"][normalize_name(ja_unit)] = ko_unit
-        
-        # 무기명 (1~7)
-        for w in range(1, 8):
-            ja_col = f'Weapon_Name_ja_{w}'
-            ko_col = f'Weapons_{w}'
-            
-            if ja_col in ja_df.columns and ko_col in ko_df.columns:
-                ja_weapon = safe_str(ja_df.iloc[i][ja_col])
-                ko_weapon = safe_str(ko_df.iloc[i][ko_col])
-                
-                if ja_weapon and ko_weapon:
-                    auto_dict["weapons"][ja_weapon] = ko_weapon
-                    normalized_map["weapons"][normalize_name(ja_weapon)] = ko_weapon
-        
-        # 어빌리티명 (1~4) → ability_terms로 통합
-        for a in range(1, 5):
-            ja_col = f'Ability_Name_ja_{a}'
-            ko_col = f'Ability_Name_{a}'
-            
-            if ja_col in ja_df.columns and ko_col in ko_df.columns:
-                ja_ability = safe_str(ja_df.iloc[i][ja_col])
-                ko_ability = safe_str(ko_df.iloc[i][ko_col])
-                
-                if ja_ability and ko_ability:
-                    auto_dict["ability_terms"][ja_ability] = ko_ability
-                    normalized_map["ability_terms"][normalize_name(ja_ability)] = ko_ability
-        
-        # 어빌리티 설명 (1~4) → ability_terms로 통합
-        for a in range(1, 5):
-            ja_col = f'Ability_Description_ja_{a}'
-            ko_col = f'Ability_Description_{a}'
-            
-            if ja_col in ja_df.columns and ko_col in ko_df.columns:
-                ja_desc = safe_str(ja_df.iloc[i][ja_col])
-                ko_desc = safe_str(ko_df.iloc[i][ko_col])
-                
-                if ja_desc and ko_desc:
-                    auto_dict["ability_terms"][ja_desc] = ko_desc
+    # 유닛명 / 무기명 (1~7) / 어빌리티명 (1~4) + 설명 (1~4) → ability_terms로 통합
+    unit_ja, unit_ko = column_pairs(ja_df, ko_df, UNIT_COLUMNS)
+    weapon_ja, weapon_ko = column_pairs(ja_df, ko_df, WEAPON_COLUMNS)
+    ability_ja, ability_ko = column_pairs(ja_df, ko_df, ABILITY_NAME_COLUMNS + ABILITY_DESC_COLUMNS)
+    
+    auto_dict = {
+        "units": dict(zip(unit_ja, unit_ko)),
+        "weapons": dict(zip(weapon_ja, weapon_ko)),
+        "ability_terms": dict(zip(ability_ja, ability_ko))
+    }
     
     print(f"   유닛: {len(auto_dict['units'])}개")
     print(f"   무기: {len(auto_dict['weapons'])}개")
     print(f"   어빌리티 용어: {len(auto_dict['ability_terms'])}개")
     
-    return auto_dict, normalized_map
+    return auto_dict
 
 # ======================
 # 번역 사전 로드
 # ======================
+def load_json_dict(path, empty):
+    """번역 사전 JSON 로드 (없으면 빈 사전으로 생성)"""
+    if path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        print(f"   ✅ {path} 로드됨")
+    else:
+        data = empty
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        print(f"   📝 {path} 생성됨 (빈 파일)")
+    return data
+
+def build_normalized_map(auto_dict):
+    """auto_translation의 모든 항목을 정규화 이름으로도 찾을 수 있게"""
+    normalized_map = {
+        "units": {},
+        "weapons": {},
+        "ability_terms": {}
+    }
+    for unit_ja, unit_ko in auto_dict.get("units", {}).items():
+        normalized_map["units"][normalize_name(unit_ja)] = unit_ko
+    for weapon_ja, weapon_ko in auto_dict.get("weapons", {}).items():
+        normalized_map["weapons"][normalize_name(weapon_ja)] = weapon_ko
+    for term_ja, term_ko in auto_dict.get("ability_terms", {}).items():
+        normalized_map["ability_terms"][normalize_name(term_ja)] = term_ko
+    return normalized_map
+
+def compiled_dicts_key():
+    """컴파일 사전 캐시 키: 사전 JSON 3개 + 정규화 / 치환기 코드 + 버전의 내용 해시"""
+    h = hashlib.sha256(f"v{COMPILED_DICTS_VERSION}".encode("utf-8"))
+    for path in (AUTO_TRANSLATION, MANUAL_TRANSLATION, ERROR_CORRECTION) + COMPILED_DICTS_SOURCES:
+        h.update(path.name.encode("utf-8"))
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
 def load_translation_dicts():
     """
     번역 사전 파일들 로드 (없으면 빈 딕셔너리)
+    - 입력 파일 내용이 이전과 같으면 compiled_dicts.pkl (정규화 맵 + 치환기 포함)을 그대로 로드
+    - 반환: auto_dict, manual_dict, error_dict, normalized_map, replacer
     """
     print("\n📚 번역 사전 로드 중...")
     
     TRANSLATION_DIR.mkdir(parents=True, exist_ok=True)
     
     # 엑셀 파일 변경 확인
-    excel_modified = check_excel_modified()
+    excel_meta = auto_translation_meta()
+    excel_modified = check_excel_modified(excel_meta)
     
     if excel_modified:
         print("   🔄 엑셀 파일 변경 감지 → auto_translation.json 재생성")
         # auto_translation.json 생성
-        auto_dict, normalized_map = build_auto_translation()
+        auto_dict = build_auto_translation()
         
         # auto_translation.json 저장
         with open(AUTO_TRANSLATION, 'w', encoding='utf-8') as f:
             json.dump(auto_dict, f, ensure_ascii=False, indent=2)
         print(f"   ✅ {AUTO_TRANSLATION} 생성됨")
+        save_auto_translation_meta(excel_meta)
     else:
         print("   ⚡ 엑셀 파일 변경 없음 → 기존 auto_translation.json 사용")
-        # 기존 auto_translation.json 로드
-        with open(AUTO_TRANSLATION, 'r', encoding='utf-8') as f:
-            auto_dict = json.load(f)
-        
-        # normalized_map 재생성 (필요시)
-        normalized_map = {
-            "units": {},
-            "weapons": {},
-            "ability_terms": {}
-        }
-        for unit_ja, unit_ko in auto_dict.get("units", {}).items():
-            normalized_map["units"][normalize_name(unit_ja)] = unit_ko
-        for weapon_ja, weapon_ko in auto_dict.get("weapons", {}).items():
-            normalized_map["weapons"][normalize_name(weapon_ja)] = weapon_ko
-        for term_ja, term_ko in auto_dict.get("ability_terms", {}).items():
-            normalized_map["ability_terms"][normalize_name(term_ja)] = term_ko
-        
-        print(f"   ✅ {AUTO_TRANSLATION} 로드됨")
     
-    # manual_translation.json 로드 (없으면 빈 딕셔너리)
-    if MANUAL_TRANSLATION.exists():
-        with open(MANUAL_TRANSLATION, 'r', encoding='utf-8') as f:
-            manual_dict = json.load(f)
-        print(f"   ✅ {MANUAL_TRANSLATION} 로드됨")
-    else:
-        manual_dict = {"units": {}, "weapons": {}, "ability_terms": {}}
-        with open(MANUAL_TRANSLATION, 'w', encoding='utf-8') as f:
-            json.dump(manual_dict, f, ensure_ascii=False, indent=2)
-        print(f"   📝 {MANUAL_TRANSLATION} 생성됨 (빈 파일)")
-    
-    # error_correction.json 로드 (없으면 빈 딕셔너리)
-    if ERROR_CORRECTION.exists():
-        with open(ERROR_CORRECTION, 'r', encoding='utf-8') as f:
-            error_dict = json.load(f)
-        print(f"   ✅ {ERROR_CORRECTION} 로드됨")
-    else:
-        error_dict = {"units": {}, "weapons": {}}
-        with open(ERROR_CORRECTION, 'w', encoding='utf-8') as f:
-            json.dump(error_dict, f, ensure_ascii=False, indent=2)
-        print(f"   📝 {ERROR_CORRECTION} 생성됨 (빈 파일)")
+    # manual / error_correction 이 없으면 빈 파일 생성 (캐시 키 계산 전에)
+    for path, empty in (
+        (MANUAL_TRANSLATION, {"units": {}, "weapons": {}, "ability_terms": {}}),
+        (ERROR_CORRECTION, {"units": {}, "weapons": {}})
+    ):
+        if not path.exists():
+            load_json_dict(path, empty)
+    
+    # 컴파일된 사전 캐시 확인
+    key = compiled_dicts_key()
+    if COMPILED_DICTS.exists():
+        try:
+            with open(COMPILED_DICTS, 'rb') as f:
+                compiled = pickle.load(f)
+            if compiled.get("key") == key:
+                print(f"   ⚡ 사전 변경 없음 → {COMPILED_DICTS.name} 사용")
+                return (compiled["auto"], compiled["manual"], compiled["error"],
+                        compiled["normalized_map"], compiled["replacer"])
+        except Exception as e:
+            print(f"   ⚠️ {COMPILED_DICTS.name} 로드 실패 ({e}) → 다시 생성")
+    
+    # 사전 로드 + 정규화 맵 / 치환기 생성
+    auto_dict = load_json_dict(AUTO_TRANSLATION, {"units": {}, "weapons": {}, "ability_terms": {}})
+    manual_dict = load_json_dict(MANUAL_TRANSLATION, {"units": {}, "weapons": {}, "ability_terms": {}})
+    error_dict = load_json_dict(ERROR_CORRECTION, {"units": {}, "weapons": {}})
+    normalized_map = build_normalized_map(auto_dict)
+    replacer = build_term_replacer(
+        auto_dict.get('ability_terms', {}),
+        manual_dict.get('ability_terms', {})
+    )
     
-    return auto_dict, manual_dict, error_dict, normalized_map
+    with open(COMPILED_DICTS, 'wb') as f:
+        pickle.dump({
+            "key": key,
+            "auto": auto_dict,
+            "manual": manual_dict,
+            "error": error_dict,
+            "normalized_map": normalized_map,
+            "replacer": replacer
+        }, f, protocol=pickle.HIGHEST_PROTOCOL)
+    print(f"   ✅ {COMPILED_DICTS} 생성됨")
+    
+    return auto_dict, manual_dict, error_dict, normalized_map, replacer
 
 # ======================
 # 치환 번역 함수
 # ======================
-def translate_text(text, auto_dict, manual_dict):
+def build_term_replacer(auto_dict, manual_dict):
+    """
+    어빌리티 용어 치환기 생성 (실행당 1회)
+    - 통합 딕셔너리 (manual이 auto보다 우선)
+    - 긴 것부터 치환 (중요!)
+    """
+    combined_terms = {**auto_dict, **manual_dict}
+    return TermReplacer(combined_terms)
+
+def translate_text(text, replacer):
     """
     텍스트를 치환 방식으로 번역
-    1. manual 우선 적용
-    2. auto 적용
+    - replacer: build_term_replacer()로 미리 만든 치환기
     """
     if not text or pd.isna(text):
         return text, False
@@ -248,18 +316,7 @@ def translate_text(text, auto_dict, manual_dict):
     text = str(text)
     original_text = text
     
-    # 통합 딕셔너리 생성 (manual이 auto보다 우선)
-    combined_terms = {**auto_dict, **manual_dict}
-    
-    # 긴 것부터 치환 (중요!)
-    sorted_terms = sorted(
-        combined_terms.items(),
-        key=lambda x: len(x[0]),
-        reverse=True
-    )
-    
-    for ja_term, ko_term in sorted_terms:
-        text = text.replace(ja_term, ko_term)
+    text = replacer.replace(text)
     
     # 번역 성공 여부 (원문과 다르면 성공)
     translated = (text != original_text)
@@ -269,14 +326,23 @@ def translate_text(text, auto_dict, manual_dict):
 # ======================
 # 유닛 번역
 # ======================
-def translate_units(auto_dict, manual_dict, error_dict, normalized_map):
+def translate_units(auto_dict, manual_dict, error_dict, normalized_map, replacer=None, units=None):
     """
     units_with_ids.json → units_kr.json
+    - units: 이미 메모리에 있는 유닛 목록 (None이면 units_with_ids.json 로드, 원본은 수정하지 않음)
     """
     print("\n📝 유닛 데이터 번역 중...")
     
-    with open(UNITS_JSON, 'r', encoding='utf-8') as f:
-        units = json.load(f)
+    # 어빌리티 용어 치환기 (모든 유닛에 재사용)
+    if replacer is None:
+        replacer = build_term_replacer(
+            auto_dict.get('ability_terms', {}),
+            manual_dict.get('ability_terms', {})
+        )
+    
+    if units is None:
+        with open(UNITS_JSON, 'r', encoding='utf-8') as f:
+            units = json.load(f)
     
     translated_units = []
     untranslated_list = []
@@ -331,7 +397,12 @@ def translate_units(auto_dict, manual_dict, error_dict, normalized_map):
         
         # 4️⃣ 어빌리티 번역 (치환 방식)
         if 'abilities' in translated_unit:
-            abilities = translated_unit['abilities']
+            # 어빌리티는 항목을 직접 바꾸므로 복사본에서 작업 (원본 유닛 보존)
+            abilities = {
+                key: [dict(ability) for ability in value] if isinstance(value, list) else value
+                for key, value in translated_unit['abilities'].items()
+            }
+            translated_unit['abilities'] = abilities
             
             # before_ssp
             if 'before_ssp' in abilities and abilities['before_ssp']:
@@ -340,19 +411,11 @@ def translate_units(auto_dict, manual_dict, error_dict, normalized_map):
                     original_desc = ability.get('description', '')
                     
                     # 이름 번역
-                    translated_name, name_success = translate_text(
-                        original_name,
-                        auto_dict.get('ability_terms', {}),
-                        manual_dict.get('ability_terms', {})
-                    )
+                    translated_name, name_success = translate_text(original_name, replacer)
                     ability['name'] = translated_name
                     
                     # 설명 번역
-                    translated_desc, desc_success = translate_text(
-                        original_desc,
-                        auto_dict.get('ability_terms', {}),
-                        manual_dict.get('ability_terms', {})
-                    )
+                    translated_desc, desc_success = translate_text(original_desc, replacer)
                     ability['description'] = translated_desc
                     
                     if name_success or desc_success:
@@ -371,19 +434,11 @@ def translate_units(auto_dict, manual_dict, error_dict, normalized_map):
                     original_desc = ability.get('description', '')
                     
                     # 이름 번역
-                    translated_name, name_success = translate_text(
-                        original_name,
-                        auto_dict.get('ability_terms', {}),
-                        manual_dict.get('ability_terms', {})
-                    )
+                    translated_name, name_success = translate_text(original_name, replacer)
                     ability['name'] = translated_name
                     
                     # 설명 번역
-                    translated_desc, desc_success = translate_text(
-                        original_desc,
-                        auto_dict.get('ability_terms', {}),
-                        manual_dict.get('ability_terms', {})
-                    )
+                    translated_desc, desc_success = translate_text(original_desc, replacer)
                     ability['description'] = translated_desc
                     
                     if name_success or desc_success:
@@ -417,14 +472,16 @@ def translate_units(auto_dict, manual_dict, error_dict, normalized_map):
 # ======================
 # 무기 번역
 # ======================
-def translate_weapons(auto_dict, manual_dict, error_dict, normalized_map):
+def translate_weapons(auto_dict, manual_dict, error_dict, normalized_map, weapons=None):
     """
     weapons.json → weapons_kr.json
+    - weapons: 이미 메모리에 있는 무기 목록 (None이면 weapons.json 로드)
     """
     print("\n🔫 무기 데이터 번역 중...")
     
-    with open(WEAPONS_JSON, 'r', encoding='utf-8') as f:
-        weapons = json.load(f)
+    if weapons is None:
+        with open(WEAPONS_JSON, 'r', encoding='utf-8') as f:
+            weapons = json.load(f)
     
     translated_weapons = []
     untranslated_list = []
@@ -477,27 +534,9 @@ def translate_weapons(auto_dict, manual_dict, error_dict, normalized_map):
     return translated_weapons, untranslated_list
 
 # ======================
-# 메인 실행
+# 저장
 # ======================
-def main():
-    print("="*70)
-    print("🌐 한글화 작업 시작")
-    print("="*70)
-    
-    # 1. 번역 사전 로드
-    auto_dict, manual_dict, error_dict, normalized_map = load_translation_dicts()
-    
-    # 2. 유닛 번역
-    units_kr, untranslated_units = translate_units(
-        auto_dict, manual_dict, error_dict, normalized_map
-    )
-    
-    # 3. 무기 번역
-    weapons_kr, untranslated_weapons = translate_weapons(
-        auto_dict, manual_dict, error_dict, normalized_map
-    )
-    
-    # 4. 저장
+def save_translations(units_kr, untranslated_units, weapons_kr, untranslated_weapons):
     print("\n💾 저장 중...")
     
     PROCESSED_DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -520,6 +559,40 @@ def main():
     with open(UNTRANSLATED_WEAPONS, 'w', encoding='utf-8') as f:
         json.dump(untranslated_weapons, f, ensure_ascii=False, indent=2)
     print(f"   ✅ {UNTRANSLATED_WEAPONS} ({len(untranslated_weapons)}개)")
+
+# ======================
+# 메인 실행
+# ======================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="units_with_ids.json / weapons.json → 한글화")
+    parser.add_argument("--build-dicts-only", action="store_true",
+                        help="번역 사전 (auto_translation.json + 컴파일 캐시)만 만들고 종료")
+    args = parser.parse_args(argv)
+    
+    if args.build_dicts_only:
+        replacer = load_translation_dicts()[-1]
+        print(f"\n✅ 번역 사전 준비 완료 (어빌리티 용어 {len(replacer)}개)")
+        return
+    
+    print("="*70)
+    print("🌐 한글화 작업 시작")
+    print("="*70)
+    
+    # 1. 번역 사전 로드
+    auto_dict, manual_dict, error_dict, normalized_map, replacer = load_translation_dicts()
+    
+    # 2. 유닛 번역
+    units_kr, untranslated_units = translate_units(
+        auto_dict, manual_dict, error_dict, normalized_map, replacer
+    )
+    
+    # 3. 무기 번역
+    weapons_kr, untranslated_weapons = translate_weapons(
+        auto_dict, manual_dict, error_dict, normalized_map
+    )
+    
+    # 4. 저장
+    save_translations(units_kr, untranslated_units, weapons_kr, untranslated_weapons)
     
     print("\n" + "="*70)
     print("✅ 한글화 완료!")
@@ -1,3 +1,6 @@
+import os
+import time
+import tracemalloc
 import requests
 from bs4 import BeautifulSoup
 from parsers.weapons import extract_weapons, has_map_weapon   # ← has_map_weapon 추가
@@ -5,45 +8,100 @@ from parsers.movement import parse_movement
 from parsers.terrain import parse_terrain
 from parsers.abilities import parse_abilities
 from parsers.mechanism import parse_mechanism
+from parsers.block_index import BlockIndex, ScanIndex
+from parsers.block_extract import extract_target_block, target_matches
 
-def parse_unit(url, unit_name, rarity, unit_type, obtain_method, base_terrain):
-    print(f"[INFO] {unit_name} ({rarity}/{obtain_method}/{unit_type}) 파싱 시작...")
 
-    res = requests.get(url)
+def empty_unit(base_terrain):
+    """페이지 요청 실패 / 블록 미발견 시 사용하는 빈 유닛 데이터"""
+    return {
+        "weapons": [],
+        "ssp": None,
+        "movement": {"before": None, "after": None},
+        "terrain": {"before": base_terrain, "after": base_terrain},
+        "abilities": {"before_ssp": [], "after_ssp": []},
+        "mechanism": None,
+        "map_weapon": {"before": False, "after": False}
+    }
+
+
+def fetch_unit_page(url, unit_name="", cache=None, session=None):
+    """
+    유닛 상세 페이지 HTML 요청
+    - session(fetcher.HttpClient)이 주어지면 공유 커넥션 풀 + 재시도로 요청
+      (재시도 소진 시 FetchError 발생)
+    - cache(PageCache)가 주어지면 디스크 캐시 + 조건부 재검증을 거침
+    - 성공: HTML 문자열 / 실패: None
+    """
+    http_get = session.get if session is not None else requests.get
+
+    if cache is not None:
+        html = cache.get(url, http_get)
+        if html is None:
+            print(f"[ERROR] {unit_name} 페이지 요청 실패 (캐시)")
+        return html
+
+    res = http_get(url)
     if res.status_code != 200:
         print(f"[ERROR] {unit_name} 페이지 요청 실패: {res.status_code}")
-        return {
-            "weapons": [],
-            "ssp": None,
-            "movement": {"before": None, "after": None},
-            "terrain": {"before": base_terrain, "after": base_terrain},
-            "abilities": {"before_ssp": [], "after_ssp": []},
-            "mechanism": None,
-            "map_weapon": {"before": False, "after": False}
-        }
+        return None
+    return res.text
 
-    soup = BeautifulSoup(res.text, "html.parser")
 
-    target_block = None
+def parse_unit(url, unit_name, rarity, unit_type, obtain_method, base_terrain, session=None, cache=None):
+    print(f"[INFO] {unit_name} ({rarity}/{obtain_method}/{unit_type}) 파싱 시작...")
+
+    html = fetch_unit_page(url, unit_name, cache, session)
+    if html is None:
+        return empty_unit(base_terrain)
+
+    return parse_unit_html(html, unit_name, rarity, unit_type, obtain_method, base_terrain)
+
+
+def find_target_block(soup, rarity, unit_type, obtain_method):
+    """페이지에서 레어도/타입/입수방법이 맞는 div.same_unit_table (없으면 None)"""
     for div in soup.select("div.same_unit_table"):
-        target = div.get("data-target", "")
-        if rarity in target and unit_type in target and obtain_method in target:
-            target_block = div
-            break
+        if target_matches(div.get("data-target", ""), rarity, unit_type, obtain_method):
+            return div
+    return None
+
+
+def parse_unit_html(html, unit_name, rarity, unit_type, obtain_method, base_terrain, targeted=True):
+    """
+    이미 받아온 유닛 페이지 HTML에서 해당 유닛 블록을 파싱
+    - targeted=True: 맞는 블록의 HTML 조각만 트리로 만듦 (parsers.block_extract)
+    - targeted=False: 페이지 전체를 트리로 만든 뒤 블록 검색 (기존 방식)
+    """
+    if targeted:
+        target_block = extract_target_block(html, rarity, unit_type, obtain_method)
+    else:
+        target_block = find_target_block(BeautifulSoup(html, "html.parser"), rarity, unit_type, obtain_method)
 
     if not target_block:
         print(f"[WARN] {unit_name} → 해당 블록을 찾지 못함")
-        return {
-            "weapons": [],
-            "ssp": None,
-            "movement": {"before": None, "after": None},
-            "terrain": {"before": base_terrain, "after": base_terrain},
-            "abilities": {"before_ssp": [], "after_ssp": []},
-            "mechanism": None,
-            "map_weapon": {"before": False, "after": False}
-        }
+        return empty_unit(base_terrain)
+
+    return parse_target_block(BlockIndex(target_block), rarity, base_terrain)
 
-    ssp_section = target_block.select_one("table.custom_core_table")
+
+def parse_unit_page(html, unit_name, rarity, unit_type, obtain_method, base_terrain, targeted=True):
+    """
+    프로세스 풀 작업 단위: parse_unit_html 결과를 (결과, 오류 메시지)로 반환
+    - 예외는 워커 안에서 잡아 문자열로 돌려주므로, 한 페이지가 실패해도 다른 페이지 결과는 유지됨
+    """
+    try:
+        return parse_unit_html(html, unit_name, rarity, unit_type, obtain_method, base_terrain, targeted), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e} (파싱 워커 pid {os.getpid()})"
+
+
+def parse_target_block(index, rarity, base_terrain):
+    """
+    유닛 블록 파싱
+    - index: 블록을 한 번 순회해 만든 BlockIndex (모든 파서가 공유)
+    """
+    target_block = index.block
+    ssp_section = index.custom_core_table
     custom_core = []
     if ssp_section:
         for row in ssp_section.select("tr")[1:]:
@@ -54,11 +112,11 @@ def parse_unit(url, unit_name, rarity, unit_type, obtain_method, base_terrain):
                 custom_core.extend(lines)
 
     if rarity == "UR" or not ssp_section:
-        weapons = extract_weapons(target_block)
-        movement = parse_movement(target_block, [])
+        weapons = extract_weapons(target_block, index)
+        movement = parse_movement(index, [])
         terrain = {"before": base_terrain, "after": base_terrain}
-        abilities = parse_abilities(target_block, has_ssp=False)
-        mechanism = parse_mechanism(target_block)
+        abilities = parse_abilities(index, has_ssp=False)
+        mechanism = parse_mechanism(index)
         return {
             "weapons": weapons,
             "ssp": None,
@@ -72,12 +130,12 @@ def parse_unit(url, unit_name, rarity, unit_type, obtain_method, base_terrain):
             }
         }
     else:
-        before_ssp = extract_weapons(target_block.select_one("div.ssp_weapon_table[data-ssp='0']"))
-        after_ssp  = extract_weapons(target_block.select_one("div.ssp_weapon_table[data-ssp='1']"))
-        movement   = parse_movement(target_block, custom_core)
+        before_ssp = extract_weapons(index.ssp_block("0"), index)
+        after_ssp  = extract_weapons(index.ssp_block("1"), index)
+        movement   = parse_movement(index, custom_core)
         terrain    = parse_terrain(base_terrain, custom_core)
-        abilities  = parse_abilities(target_block, has_ssp=True)
-        mechanism  = parse_mechanism(target_block)
+        abilities  = parse_abilities(index, has_ssp=True)
+        mechanism  = parse_mechanism(index)
 
         return {
             "weapons": {"before_ssp": before_ssp, "after_ssp": after_ssp},
@@ -90,4 +148,73 @@ def parse_unit(url, unit_name, rarity, unit_type, obtain_method, base_terrain):
                 "before": has_map_weapon(before_ssp),
                 "after": has_map_weapon(after_ssp)
             }
-        }
\ No newline at end of file
+        }
+
+
+def benchmark_block_parsing(pages, repeat=3):
+    """
+    저장된 유닛 페이지로 블록 파싱 시간 비교 (페이지 HTML 파싱 시간은 제외)
+    - BlockIndex: 블록을 한 번 순회해 모든 파서가 공유
+    - ScanIndex: 파서마다 블록 전체를 find_all / select (기존 방식)
+    - pages: [(html, rarity, unit_type, obtain_method, base_terrain)]
+    """
+    blocks = []
+    for html, rarity, unit_type, obtain_method, base_terrain in pages:
+        block = find_target_block(BeautifulSoup(html, "html.parser"), rarity, unit_type, obtain_method)
+        if block:
+            blocks.append((block, rarity, base_terrain))
+
+    results = {}
+    outputs = {}
+    for name, index_class in (("ScanIndex", ScanIndex), ("BlockIndex", BlockIndex)):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            parsed = [parse_target_block(index_class(block), rarity, base_terrain)
+                      for block, rarity, base_terrain in blocks]
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results[name] = best
+        outputs[name] = parsed
+
+    print(f"⏱️ 블록 파싱 벤치마크: 블록 {len(blocks)}개, {repeat}회 중 최소")
+    for name, elapsed in results.items():
+        per_block = elapsed / len(blocks) * 1000 if blocks else 0
+        print(f"   {name:>10}: {elapsed:.3f}초 (블록당 {per_block:.2f} ms)")
+    print(f"   결과 일치: {outputs['ScanIndex'] == outputs['BlockIndex']}")
+    return results
+
+
+def benchmark_block_extraction(pages):
+    """
+    저장된 유닛 페이지로 블록 추출 시간 / 최대 메모리 비교
+    - full: 페이지 전체 BeautifulSoup 후 select (기존 방식)
+    - targeted: div 태그 스캔 후 맞는 블록 조각만 BeautifulSoup
+    - pages: [(html, rarity, unit_type, obtain_method, base_terrain)]
+    """
+    def full(html, rarity, unit_type, obtain_method):
+        return find_target_block(BeautifulSoup(html, "html.parser"), rarity, unit_type, obtain_method)
+
+    results = {}
+    blocks = {}
+    for name, extract in (("full", full), ("targeted", extract_target_block)):
+        tracemalloc.start()
+        start = time.perf_counter()
+        found = []
+        peak = 0
+        for html, rarity, unit_type, obtain_method, _ in pages:
+            block = extract(html, rarity, unit_type, obtain_method)
+            found.append(str(block) if block else None)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            del block
+        elapsed = time.perf_counter() - start
+        tracemalloc.stop()
+        results[name] = (elapsed, peak)
+        blocks[name] = found
+
+    print(f"⏱️ 블록 추출 벤치마크: 페이지 {len(pages)}개 (tracemalloc 측정 중이라 시간은 상대 비교용)")
+    for name, (elapsed, peak) in results.items():
+        print(f"   {name:>10}: {elapsed:.3f}초, 페이지당 최대 메모리 {peak / 1024:.0f} KB")
+    print(f"   결과 일치: {blocks['full'] == blocks['targeted']}")
+    return results
\ No newline at end of file
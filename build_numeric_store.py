@@ -0,0 +1,178 @@
+import argparse
+import json
+import os
+import struct
+import sys
+import time
+
+import numpy as np
+
+from convert_json_to_js import write_asset
+
+# 프로젝트 루트 경로 (이 스크립트가 있는 곳)
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(BASE_DIR, '04_processed_data')
+UNITS_JSON = os.path.join(SRC_DIR, 'units_with_ids.json')
+WEAPONS_JSON = os.path.join(SRC_DIR, 'weapons.json')
+
+# 출력: 브라우저용 packed binary / 로더 (Python 에서는 load_numeric_store 로 JSON 에서 바로 생성)
+NUMERIC_STORE_BIN = os.path.join(BASE_DIR, '05_web', 'assets', 'numeric_store.bin')
+NUMERIC_STORE_JS = os.path.join(BASE_DIR, '05_web', 'assets', 'numeric_store.js')
+
+MISSING = -1            # 값이 없거나 숫자가 아닌 스탯
+BIN_MAGIC = b"GGNS"     # packed binary 시작 표시
+BIN_VERSION = 1
+BIN_ALIGN = 8           # 열 데이터 시작 위치 정렬 (typed array 뷰는 요소 크기 배수 위치여야 함)
+
+# 유닛 스탯: (unit_data 필드, 열 이름 접두사) × (스탯 키, 열 이름)
+STAT_SOURCES = [("ステータス", ""), ("アビ込みステータス", "ability_")]
+STAT_KEYS = [("HP", "hp"), ("攻撃力", "attack"), ("機動力", "mobility"), ("防御力", "defense")]
+
+# numpy dtype → JS typed array (모두 little-endian)
+JS_ARRAYS = {"int32": "Int32Array", "int16": "Int16Array", "uint8": "Uint8Array"}
+
+# 브라우저 로더: loadNumericStore(url) → {units: {ids, hp: Int32Array, ...}, weapons: {unit: Int32Array, ...}}
+LOADER_JS = (
+    "const NUMERIC_STORE_MISSING=%d;"
+    "const NUMERIC_STORE_ARRAYS={Int32Array,Int16Array,Uint8Array};"
+    "function parseNumericStore(buf){"
+    "const view=new DataView(buf),magic=String.fromCharCode(...new Uint8Array(buf,0,4));"
+    "if(magic!=='GGNS')throw new Error('numeric_store: bad magic');"
+    "const headerLength=view.getUint32(8,true);"
+    "const header=JSON.parse(new TextDecoder().decode(new Uint8Array(buf,12,headerLength)));"
+    "const store={};for(const table in header.tables){const t=header.tables[table];"
+    "store[table]={length:t.length};if(t.ids)store[table].ids=t.ids;"
+    "for(const c of t.columns){store[table][c.name]=new NUMERIC_STORE_ARRAYS[c.type](buf,c.offset,t.length);}}"
+    "return store;}"
+    "function loadNumericStore(url){return fetch(url).then(r=>r.arrayBuffer()).then(parseNumericStore);}"
+) % MISSING
+
+def parse_stat(value):
+    """'151,599' 같은 스탯 문자열 → int (없거나 숫자가 아니면 MISSING)"""
+    if value is None:
+        return MISSING
+    if isinstance(value, (int, float)):
+        return int(value)
+    text = str(value).replace(",", "").strip()
+    return int(text) if text.isdigit() else MISSING
+
+def build_numeric_store(units, weapons):
+    """
+    유닛 스탯 / 무기 수치 → 열 단위 배열
+    - units: id + 스탯 8열 (int32), 행 순서는 units_with_ids.json 과 같음
+    - weapons: unit(유닛 행 번호, 모르면 MISSING) / power / range_min / range_max /
+               max_effect_percent / is_map, 행 순서는 weapons.json 과 같음
+    - 반환: {"units": {열: ndarray}, "weapons": {열: ndarray}}
+    """
+    unit_ids = [unit.get("id") or "" for unit in units]
+    unit_columns = {"id": np.array(unit_ids, dtype=str)}
+    for source, prefix in STAT_SOURCES:
+        for key, name in STAT_KEYS:
+            unit_columns[prefix + name] = np.array(
+                [parse_stat((unit.get(source) or {}).get(key)) for unit in units], dtype=np.int32
+            )
+
+    row_of = {}
+    for row, unit_id in enumerate(unit_ids):
+        if unit_id:
+            row_of.setdefault(unit_id, row)
+
+    def weapon_range(weapon, key):
+        value = (weapon.get("range") or {}).get(key)
+        return value if isinstance(value, int) else MISSING
+
+    weapon_columns = {
+        "unit": np.array([row_of.get(w.get("unit_id"), MISSING) for w in weapons], dtype=np.int32),
+        "power": np.array([parse_stat(w.get("power")) for w in weapons], dtype=np.int32),
+        "range_min": np.array([weapon_range(w, "min") for w in weapons], dtype=np.int16),
+        "range_max": np.array([weapon_range(w, "max") for w in weapons], dtype=np.int16),
+        "max_effect_percent": np.array([parse_stat(w.get("max_effect_percent")) for w in weapons], dtype=np.int16),
+        "is_map": np.array([bool(w.get("is_map")) for w in weapons], dtype=np.uint8),
+    }
+    return {"units": unit_columns, "weapons": weapon_columns}
+
+def load_numeric_store(units_path=UNITS_JSON, weapons_path=WEAPONS_JSON):
+    """
+    Python 분석용: units_with_ids.json / weapons.json → {"units": {열: ndarray}, "weapons": {열: ndarray}}
+    - 1초도 안 걸리므로 별도 파일(npz)로 저장하지 않고 매번 JSON 에서 생성
+    """
+    with open(units_path, 'r', encoding='utf-8') as f:
+        units = json.load(f)
+    with open(weapons_path, 'r', encoding='utf-8') as f:
+        weapons = json.load(f)
+    return build_numeric_store(units, weapons)
+
+def pack_binary(store):
+    """
+    브라우저용 packed binary
+    - [GGNS][version u32][header 길이 u32][JSON header][열 데이터 ...]
+    - header: {"missing": -1, "tables": {표: {"length", "ids", "columns": [{name, type, offset}]}}}
+    - 열 데이터는 little-endian, 시작 위치는 BIN_ALIGN 배수
+    """
+    tables = {}
+    chunks = []
+    for table, columns in store.items():
+        numeric = {name: column for name, column in columns.items() if column.dtype.kind in "iu"}
+        length = len(next(iter(columns.values()))) if columns else 0
+        tables[table] = {"length": length, "columns": []}
+        if "id" in columns:
+            tables[table]["ids"] = columns["id"].tolist()
+        for name, column in numeric.items():
+            tables[table]["columns"].append({"name": name, "type": JS_ARRAYS[column.dtype.name]})
+            chunks.append(column.astype(column.dtype.newbyteorder("<"), copy=False).tobytes())
+
+    def header_bytes():
+        return json.dumps({"missing": MISSING, "tables": tables}, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    # offset 자릿수가 바뀌면 header 길이도 바뀌므로 값이 고정될 때까지 다시 계산
+    offsets = None
+    while True:
+        header = header_bytes()
+        position = 12 + len(header)
+        new_offsets = []
+        for chunk in chunks:
+            position += -position % BIN_ALIGN
+            new_offsets.append(position)
+            position += len(chunk)
+        if new_offsets == offsets:
+            break
+        offsets = new_offsets
+        columns = [column for table in tables.values() for column in table["columns"]]
+        for column, offset in zip(columns, offsets):
+            column["offset"] = offset
+
+    body = bytearray(struct.pack("<4sII", BIN_MAGIC, BIN_VERSION, len(header)) + header)
+    for chunk, offset in zip(chunks, offsets):
+        body.extend(b"\0" * (offset - len(body)))
+        body.extend(chunk)
+    return bytes(body)
+
+def save_numeric_store(store, compress=False):
+    """packed binary + JS 로더 저장, 반환: packed binary 바이트 수"""
+    os.makedirs(os.path.dirname(NUMERIC_STORE_BIN), exist_ok=True)
+    packed = pack_binary(store)
+    write_asset(NUMERIC_STORE_BIN, packed, compress)
+    write_asset(NUMERIC_STORE_JS, LOADER_JS.encode("utf-8"), compress)
+    return len(packed)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="유닛 스탯 / 무기 수치 → 열 단위 숫자 배열 (브라우저용 binary + JS 로더)")
+    parser.add_argument("--compress", action="store_true", help=".gz / .br 사전 압축본도 저장")
+    args = parser.parse_args(argv)
+
+    for path in (UNITS_JSON, WEAPONS_JSON):
+        if not os.path.exists(path):
+            print(f"❌ 입력 파일을 찾을 수 없습니다: {path}")
+            sys.exit(1)
+
+    start = time.perf_counter()
+    store = load_numeric_store()
+    size = save_numeric_store(store, compress=args.compress)
+    missing = int((store["units"]["hp"] == MISSING).sum())
+    print(f"✅ 숫자 열 저장: 유닛 {len(store['units']['id'])}개 (스탯 없음 {missing}개), "
+          f"무기 {len(store['weapons']['unit'])}개")
+    print(f"   {NUMERIC_STORE_BIN} ({size:,} bytes) + {os.path.basename(NUMERIC_STORE_JS)} "
+          f"({time.perf_counter() - start:.2f}초)")
+
+if __name__ == "__main__":
+    main()
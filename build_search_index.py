@@ -0,0 +1,140 @@
+import argparse
+import json
+import os
+import re
+import sys
+import time
+import unicodedata
+
+from convert_json_to_js import MINIFIED_JSON, write_asset
+
+# 프로젝트 루트 경로 (이 스크립트가 있는 곳)
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(BASE_DIR, '04_processed_data')
+DEST_DIR = os.path.join(BASE_DIR, '05_web', 'assets')
+SEARCH_INDEX_JS = os.path.join(DEST_DIR, 'search_index.js')
+
+# normalize_name (번역 / ID 매칭용 이름 정규화, 의존성 없는 모듈)을 검색에도 그대로 사용
+sys.path.insert(0, os.path.join(BASE_DIR, '03_parsers'))
+from names import normalize_name
+
+# 검색어 / 색인 공통 정규화: 전각→반각(NFKC), 소문자, 공백 / 가운뎃점 제거, 가타카나→히라가나
+_FOLD_REMOVE = re.compile(r'[\s・･]+')
+_KATAKANA = re.compile(r'[ァ-ヶ]')
+
+# 브라우저 검색 함수 (fold_text 와 같은 정규화 → 2-gram 목록 교집합 → 부분 문자열 확인)
+SEARCH_JS = (
+    "function foldText(s){return s.normalize('NFKC').toLowerCase().replace(/[\\s・･]+/g,'')"
+    ".replace(/[\\u30a1-\\u30f6]/g,c=>String.fromCharCode(c.charCodeAt(0)-0x60));}"
+    "function searchUnits(query,limit=50){"
+    "const q=foldText(query),ix=searchIndex;if(!q)return [];"
+    "let docs=null;"
+    "if(q.length>1){for(let i=0;i<q.length-1;i++){const p=ix.grams[q.slice(i,i+2)];if(!p)return [];"
+    "if(docs===null){docs=p;}else{const s=new Set(p);docs=docs.filter(d=>s.has(d));}if(!docs.length)return [];}}"
+    "const out=[];for(const d of (docs||ix.text.keys())){"
+    "if(ix.text[d].includes(q)){out.push(ix.ids[d]);if(out.length>=limit)break;}}"
+    "return out;}"
+)
+
+def fold_text(text):
+    """검색용 정규화 (SEARCH_JS 의 foldText 와 동일)"""
+    text = unicodedata.normalize('NFKC', text).lower()
+    text = _FOLD_REMOVE.sub('', text)
+    return _KATAKANA.sub(lambda m: chr(ord(m.group(0)) - 0x60), text)
+
+def search_keys(name):
+    """이름 1개 → 검색 키 (원래 이름 / normalize_name 결과를 각각 fold_text)"""
+    if not name:
+        return []
+    keys = [fold_text(str(name)), fold_text(normalize_name(name))]
+    return [key for key in dict.fromkeys(keys) if key]
+
+def build_search_index(units, weapons, units_kr, weapons_kr):
+    """
+    유닛 / 무기 이름 (일본어 + 한글) → 검색 인덱스
+    - 문서 1개 = 유닛 1개 (무기 이름으로 찾아도 그 무기를 가진 유닛이 결과)
+    - ids: 문서 번호 → unit id
+    - text: 문서별 검색 키를 줄바꿈으로 이은 문자열 (최종 부분 문자열 확인용)
+    - grams: 2-gram → 문서 번호 목록 (오름차순, 키 경계를 넘는 2-gram은 만들지 않음)
+    """
+    weapon_names = {}
+    for weapon_list in (weapons, weapons_kr):
+        for weapon in weapon_list:
+            weapon_names.setdefault(weapon.get("unit_id") or "", []).append(weapon.get("name"))
+
+    ids = []
+    text = []
+    grams = {}
+    for doc, (unit, unit_kr) in enumerate(zip(units, units_kr)):
+        unit_id = unit.get("id")
+        names = [unit.get("unit_name"), unit_kr.get("unit_name")]
+        if unit_id:
+            names.extend(weapon_names.get(unit_id, []))
+
+        keys = list(dict.fromkeys(key for name in names for key in search_keys(name)))
+        ids.append(unit_id)
+        text.append("\n".join(keys))
+
+        # 문서 안에서는 처음 나온 순서 (set 순회 순서는 실행마다 달라 출력 파일이 매번 바뀜)
+        doc_grams = dict.fromkeys(key[i:i + 2] for key in keys for i in range(len(key) - 1))
+        for gram in doc_grams:
+            grams.setdefault(gram, []).append(doc)
+
+    return {"ids": ids, "text": text, "grams": grams}
+
+def search(index, query, limit=50):
+    """SEARCH_JS 의 searchUnits 와 같은 검색 (확인 / 벤치마크용)"""
+    q = fold_text(query)
+    if not q:
+        return []
+    docs = None
+    for i in range(len(q) - 1):
+        postings = index["grams"].get(q[i:i + 2])
+        if not postings:
+            return []
+        if docs is None:
+            docs = postings
+        else:
+            postings = set(postings)
+            docs = [d for d in docs if d in postings]
+        if not docs:
+            return []
+    results = []
+    for doc in (docs if docs is not None else range(len(index["text"]))):
+        if q in index["text"][doc]:
+            results.append(index["ids"][doc])
+            if len(results) >= limit:
+                break
+    return results
+
+def write_search_index(index, path=SEARCH_INDEX_JS, compress=False):
+    """searchIndex + 검색 함수 JS 저장, 반환: 바이트 수"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    js_bytes = (f"const searchIndex = {json.dumps(index, **MINIFIED_JSON)};\n" + SEARCH_JS).encode('utf-8')
+    write_asset(path, js_bytes, compress)
+    return len(js_bytes)
+
+def load_json(name):
+    with open(os.path.join(SRC_DIR, name), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="유닛 / 무기 이름 검색 인덱스 (05_web/assets/search_index.js) 생성")
+    parser.add_argument("--compress", action="store_true", help=".gz / .br 사전 압축본도 저장")
+    args = parser.parse_args(argv)
+
+    sources = ['units_with_ids.json', 'weapons.json', 'units_kr.json', 'weapons_kr.json']
+    missing = [name for name in sources if not os.path.exists(os.path.join(SRC_DIR, name))]
+    if missing:
+        print(f"❌ 입력 파일을 찾을 수 없습니다: {', '.join(missing)}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    index = build_search_index(*(load_json(name) for name in sources))
+    size = write_search_index(index, compress=args.compress)
+    print(f"✅ 검색 인덱스 생성: {SEARCH_INDEX_JS}")
+    print(f"   유닛 {len(index['ids'])}개, 2-gram {len(index['grams']):,}개, {size:,} bytes "
+          f"({time.perf_counter() - start:.2f}초)")
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,272 @@
+import argparse
+import gzip
+import hashlib
 import json
 import os
+import shutil
+import zlib
 
-def convert_json_to_js():
+try:
+    import brotli   # 선택 사항: pip install brotli (.br 출력)
+except ImportError:
+    brotli = None
+
+# JSON 직렬화 옵션
+# ensure_ascii=False를 해야 한글/일어가 깨지지 않고 그대로 보입니다.
+PRETTY_JSON = {"ensure_ascii": False, "indent": 2}
+MINIFIED_JSON = {"ensure_ascii": False, "separators": (",", ":")}
+
+# 열 단위 데이터({"keys": [...], "rows": [[...]]})를 브라우저에서 원래 객체 배열로 복원하는 함수
+COLUMNAR_DECODER = "(t=>t.rows.map(r=>Object.fromEntries(t.keys.map((k,i)=>[k,r[i]]))))"
+
+COMPRESSED_SUFFIXES = (".gz", ".br")
+
+# 무기 조회 인덱스: (무기 JSON, 인덱스 JS) - 인덱스 값은 같은 JSON으로 만든 rawWeapons 배열의 위치
+WEAPON_INDEX_TASKS = [
+    ('weapons.json', 'weapons_jp_index.js'),
+    ('weapons_kr.json', 'weapons_kr_index.js'),
+]
+
+# 인덱스 JS에 함께 들어가는 조회 함수 (rawWeapons 와 같은 페이지에서 사용)
+WEAPON_INDEX_HELPERS = (
+    "function weaponsAt(ids){return (ids||[]).map(i=>rawWeapons[i]);}"
+    "function weaponsOf(unitId){return weaponsAt(weaponIndex.by_unit[unitId]);}"
+)
+
+# 분할(shard) 출력: (언어, 유닛 JSON, 무기 JSON) → 05_web/assets/shards/<언어>/
+SHARD_SOURCES = [
+    ('jp', 'units_with_ids.json', 'weapons.json'),
+    ('kr', 'units_kr.json', 'weapons_kr.json'),
+]
+INDEX_FIELDS = ("id", "unit_name", "rarity", "type", "obtain_method", "icon")
+
+# index.js 에 함께 들어가는 상세 데이터 로더 (units_NN.<해시>.json 파일명은 shardManifest.files, 처음 필요할 때 한 번만 요청)
+SHARD_LOADER = (
+    "const shardBase=document.currentScript?new URL('.',document.currentScript.src).href:'';"
+    "const shardCache={};"
+    "function loadShard(i){return shardCache[i]||(shardCache[i]="
+    "fetch(shardBase+shardManifest.files[i]).then(r=>r.json()));}"
+    "function loadUnitDetail(id){const i=shardManifest.units[id];"
+    "return i===undefined?Promise.resolve(null):loadShard(i).then(s=>s[id]||null);}"
+)
+
+def to_columnar(content):
+    """
+    [{키: 값}, ...] → {"keys": [키, ...], "rows": [[값, ...], ...]}
+    - 반복되는 키("effect_text", "max_effect_percent" 등)를 헤더 한 번만 기록
+    - 모든 항목의 키 순서가 같을 때만 변환 (아니면 None)
+    """
+    if not isinstance(content, list) or not content or not all(isinstance(item, dict) for item in content):
+        return None
+    keys = list(content[0])
+    if any(list(item) != keys for item in content):
+        return None
+    return {"keys": keys, "rows": [[item[key] for key in keys] for item in content]}
+
+def render_js(var_name, content, minify=False, columnar=False):
+    """
+    JS 내용 작성 (const 변수명 = 데이터;)
+    - minify: 공백 없는 JSON
+    - columnar: 키 헤더 + 값 배열로 쓰고 로드 시 객체 배열로 복원 (변환할 수 없는 데이터면 그대로)
+    """
+    options = MINIFIED_JSON if minify else PRETTY_JSON
+    if columnar:
+        table = to_columnar(content)
+        if table is not None:
+            return f"const {var_name} = {COLUMNAR_DECODER}({json.dumps(table, **options)});"
+    return f"const {var_name} = {json.dumps(content, **options)};"
+
+def compress_variants(raw):
+    """JS bytes → {확장자: 압축 bytes} (.br 은 brotli 설치 시에만)"""
+    variants = {".gz": gzip.compress(raw, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(raw, quality=11)
+    return variants
+
+def size_report(var_name, content):
+    """출력 방식별 크기 비교 (원본 / gzip / brotli, 바이트)"""
+    rows = []
+    for label, minify, columnar in (("pretty", False, False), ("minified", True, False), ("columnar", True, True)):
+        if columnar and to_columnar(content) is None:
+            continue
+        raw = render_js(var_name, content, minify, columnar).encode("utf-8")
+        compressed = compress_variants(raw)
+        rows.append((label, len(raw), len(compressed[".gz"]),
+                     len(compressed[".br"]) if ".br" in compressed else None))
+    return rows
+
+def print_size_report(js_file, rows):
+    print(f"📏 {js_file}")
+    print(f"   {'format':<10}{'raw':>12}{'gzip':>12}{'brotli':>12}")
+    for label, raw, gz, br in rows:
+        br_text = f"{br:,}" if br is not None else "-"
+        print(f"   {label:<10}{raw:>12,}{gz:>12,}{br_text:>12}")
+
+def write_asset(path, body, compress=False):
+    """
+    bytes 저장 + 사전 압축본(.gz / .br) 처리
+    - compress가 아니면 이전 압축본이 남지 않도록 삭제
+    - 반환: {확장자: 압축 bytes}
+    """
+    with open(path, 'wb') as f:
+        f.write(body)
+    
+    compressed = compress_variants(body) if compress else {}
+    for suffix in COMPRESSED_SUFFIXES:
+        sibling = path + suffix
+        if suffix in compressed:
+            with open(sibling, 'wb') as f:
+                f.write(compressed[suffix])
+        elif os.path.exists(sibling):
+            os.remove(sibling)
+    return compressed
+
+def load_source(json_file, src_dir, data):
+    """소스 JSON (메모리에 있으면 그대로 사용, 파일이 없으면 None)"""
+    if json_file in data:
+        return data[json_file]
+    json_path = os.path.join(src_dir, json_file)
+    if not os.path.exists(json_path):
+        return None
+    with open(json_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def build_weapon_index(weapons):
+    """
+    무기 목록 → 조회 인덱스 (값은 모두 무기 배열 위치 목록, 오름차순)
+    - by_unit: unit_id → 무기 (유닛마다 전체 배열을 거르지 않도록)
+    - by_element / by_effect_tag / by_map_type: 속성 / 효과 태그 / MAP 형태별
+    - map: MAP 무기
+    - range_max_at_least / range_min_at_most: 사거리 조건별 누적 목록
+      ("N칸 이상 닿는 무기" = range_max_at_least[N], 키 여러 개를 합칠 필요 없음)
+      N은 데이터에 있는 사거리 값만 (그 사이 값은 range_max_at_least 는 다음 큰 키, range_min_at_most 는 이전 작은 키와 같음)
+      거리 N에서 쓸 수 있는 무기 = range_min_at_most[N] ∩ range_max_at_least[N]
+    """
+    index = {
+        "by_unit": {},
+        "by_element": {},
+        "by_effect_tag": {},
+        "by_map_type": {},
+        "map": [],
+        "range_max_at_least": {},
+        "range_min_at_most": {},
+    }
+    
+    def add(name, key, position):
+        if key is None or key == "":
+            return
+        index[name].setdefault(str(key), []).append(position)
+    
+    range_min = {}
+    range_max = {}
+    for position, weapon in enumerate(weapons):
+        add("by_unit", weapon.get("unit_id"), position)
+        for element in dict.fromkeys(weapon.get("elements") or []):
+            add("by_element", element, position)
+        for tag in dict.fromkeys(weapon.get("effect_tags") or []):
+            add("by_effect_tag", tag, position)
+        add("by_map_type", weapon.get("map_type"), position)
+        if weapon.get("is_map"):
+            index["map"].append(position)
+        weapon_range = weapon.get("range") or {}
+        if isinstance(weapon_range.get("min"), int):
+            range_min[position] = weapon_range["min"]
+        if isinstance(weapon_range.get("max"), int):
+            range_max[position] = weapon_range["max"]
+    
+    for value in sorted(set(range_max.values())):
+        index["range_max_at_least"][str(value)] = [p for p, v in range_max.items() if v >= value]
+    for value in sorted(set(range_min.values())):
+        index["range_min_at_most"][str(value)] = [p for p, v in range_min.items() if v <= value]
+    return index
+
+def write_weapon_index(weapons, js_path, compress=False):
+    """
+    weaponIndex + 조회 함수(weaponsOf / weaponsAt) JS 저장, 반환: 바이트 수
+    - 숫자 목록뿐이라 읽을 일이 없으므로 항상 공백 없이 저장 (indent=2면 2배 이상 커짐)
+    """
+    js_bytes = (
+        f"const weaponIndex = {json.dumps(build_weapon_index(weapons), **MINIFIED_JSON)};\n"
+        + WEAPON_INDEX_HELPERS
+    ).encode('utf-8')
+    write_asset(js_path, js_bytes, compress)
+    return len(js_bytes)
+
+def shard_of(unit_id, shard_count):
+    """unit_id → shard 번호 (crc32 해시 버킷, 실행마다 같은 값)"""
+    return zlib.crc32(unit_id.encode('utf-8')) % shard_count
+
+def build_shards(units, weapons, shard_count):
+    """
+    유닛 / 무기 목록 → (목차, shard 목록, unit_id → shard 번호)
+    - 목차: 첫 화면에 필요한 필드(INDEX_FIELDS)만
+    - shard: {unit_id: {"unit": 유닛 상세, "weapons": [무기, ...]}}
+    - id가 없는 유닛은 목차에만 들어가고, 유닛이 없는 unit_id의 무기는 "weapons"만 가진 항목이 됨
+    """
+    index = [{field: unit.get(field) for field in INDEX_FIELDS} for unit in units]
+    
+    details = {}
+    for unit in units:
+        if unit.get("id"):
+            details.setdefault(unit["id"], {"unit": None, "weapons": []})["unit"] = unit
+    for weapon in weapons:
+        unit_id = weapon.get("unit_id") or ""
+        details.setdefault(unit_id, {"unit": None, "weapons": []})["weapons"].append(weapon)
+    
+    shards = [{} for _ in range(shard_count)]
+    unit_shards = {}
+    for unit_id, detail in details.items():
+        number = shard_of(unit_id, shard_count)
+        shards[number][unit_id] = detail
+        unit_shards[unit_id] = number
+    return index, shards, unit_shards
+
+def write_shards(lang, units, weapons, dest_dir, shard_count, minify=False, compress=False):
+    """
+    05_web/assets/shards/<lang>/ 에 목차 + 상세 shard 저장
+    - index.js: unitIndex(목차) + shardManifest(unit_id → shard) + loadUnitDetail(id) 로더
+    - units_NN.<해시>.json: shard별 유닛 상세 + 그 유닛의 무기 (파일명에 내용 해시 → 브라우저 캐시 안전)
+    """
+    shard_dir = os.path.join(dest_dir, 'shards', lang)
+    # 이전 실행의 shard 파일(해시가 다른 이름)이 남지 않도록 폴더째 새로 만듦
+    if os.path.exists(shard_dir):
+        shutil.rmtree(shard_dir)
+    os.makedirs(shard_dir)
+    
+    options = MINIFIED_JSON if minify else PRETTY_JSON
+    index, shards, unit_shards = build_shards(units, weapons, shard_count)
+    
+    files = []
+    shard_sizes = []
+    for number, shard in enumerate(shards):
+        body = json.dumps(shard, **options).encode('utf-8')
+        name = f"units_{number:02d}.{hashlib.sha1(body).hexdigest()[:8]}.json"
+        write_asset(os.path.join(shard_dir, name), body, compress)
+        files.append(name)
+        shard_sizes.append(len(body))
+    
+    manifest = {"shard_count": shard_count, "files": files, "units": unit_shards}
+    index_js = (
+        render_js('unitIndex', index, minify, columnar=minify) + "\n"
+        + f"const shardManifest = {json.dumps(manifest, **options)};\n"
+        + SHARD_LOADER
+    ).encode('utf-8')
+    write_asset(os.path.join(shard_dir, 'index.js'), index_js, compress)
+    
+    print(f"✅ 분할 완료: shards/{lang}/index.js ({len(index)}개 유닛, {len(index_js):,} bytes) + "
+          f"shard {shard_count}개 (평균 {sum(shard_sizes) // shard_count:,} / 최대 {max(shard_sizes):,} bytes)")
+
+def convert_json_to_js(data=None, minify=False, columnar=False, compress=False, report=False, shards=0):
+    """
+    04_processed_data의 JSON → 05_web/assets의 JS
+    - data: {소스 JSON 파일명: 데이터} 로 넘기면 파일을 다시 읽지 않고 그대로 사용
+    - minify / columnar: 배포용 압축 형식 (render_js 참고)
+    - compress: 같은 폴더에 .gz / .br 사전 압축본도 저장 (아니면 이전 압축본 삭제)
+    - report: 방식별(pretty / minified / columnar × 원본 / gzip / brotli) 크기 출력
+    - shards: 1 이상이면 목차 + unit_id 기준 shard 파일도 저장 (write_shards 참고)
+    """
+    data = data or {}
+    
     # 경로 설정
     base_dir = os.path.dirname(os.path.abspath(__file__))
     src_dir = os.path.join(base_dir, '04_processed_data')
@@ -31,29 +296,76 @@ def convert_json_to_js():
         js_path = os.path.join(dest_dir, js_file)
         
         # 소스 파일이 존재하는지 확인
-        if not os.path.exists(json_path):
+        if json_file not in data and not os.path.exists(json_path):
             print(f"⚠️ 경고: {json_file} 파일을 찾을 수 없어 건너뜁니다.")
             continue
         
         try:
-            # JSON 읽기
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # JSON 읽기 (메모리에 있으면 그대로 사용)
+            content = load_source(json_file, src_dir, data)
             
             # JS 내용 작성 (const 변수명 = 데이터;)
-            # ensure_ascii=False를 해야 한글/일어가 깨지지 않고 그대로 보입니다.
-            js_content = f"const {var_name} = {json.dumps(data, ensure_ascii=False, indent=2)};"
+            js_bytes = render_js(var_name, content, minify, columnar).encode('utf-8')
+            
+            # JS 쓰기 (+ 사전 압축본)
+            compressed = write_asset(js_path, js_bytes, compress)
             
-            # JS 쓰기
-            with open(js_path, 'w', encoding='utf-8') as f:
-                f.write(js_content)
+            sizes = ", ".join(f"{suffix} {len(body):,}" for suffix, body in compressed.items())
+            print(f"✅ 변환 완료: {json_file} -> {js_file} ({var_name}, {len(js_bytes):,} bytes{', ' + sizes if sizes else ''})")
             
-            print(f"✅ 변환 완료: {json_file} -> {js_file} ({var_name})")
+            if report:
+                print_size_report(js_file, size_report(var_name, content))
         
         except Exception as e:
             print(f"❌ 오류 발생 ({json_file}): {e}")
     
+    # 무기 조회 인덱스
+    for json_file, js_file in WEAPON_INDEX_TASKS:
+        try:
+            weapons = load_source(json_file, src_dir, data)
+            if weapons is None:
+                continue
+            size = write_weapon_index(weapons, os.path.join(dest_dir, js_file), compress)
+            print(f"✅ 인덱스 생성: {json_file} -> {js_file} (weaponIndex, {size:,} bytes)")
+        except Exception as e:
+            print(f"❌ 오류 발생 ({js_file}): {e}")
+    
+    # 목차 + shard 분할 출력
+    if shards > 0:
+        for lang, units_file, weapons_file in SHARD_SOURCES:
+            try:
+                units = load_source(units_file, src_dir, data)
+                weapons = load_source(weapons_file, src_dir, data)
+                if units is None or weapons is None:
+                    print(f"⚠️ 경고: {units_file} / {weapons_file} 가 없어 {lang} 분할을 건너뜁니다.")
+                    continue
+                write_shards(lang, units, weapons, dest_dir, shards, minify, compress)
+            except Exception as e:
+                print(f"❌ 오류 발생 (shards/{lang}): {e}")
+    
+    if compress and brotli is None:
+        print("ℹ️ brotli 미설치: .br 파일은 만들지 않았습니다 (pip install brotli)")
     print("🎉 모든 변환 작업이 완료되었습니다.")
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="04_processed_data JSON → 05_web/assets JS 변환")
+    parser.add_argument("--minify", action="store_true", help="공백 없는 JSON으로 출력")
+    parser.add_argument("--columnar", action="store_true",
+                        help="객체 배열을 키 헤더 + 값 배열로 출력 (브라우저에서 원래 형태로 복원)")
+    parser.add_argument("--compress", action="store_true", help=".gz / .br 사전 압축본도 저장")
+    parser.add_argument("--prod", action="store_true", help="배포용: --minify --compress 와 같음")
+    parser.add_argument("--report", action="store_true", help="출력 방식별 크기 비교표 출력")
+    parser.add_argument("--shards", type=int, default=0,
+                        help="목차(index.js) + unit_id 해시 기준 N개 상세 파일로도 분할 저장 (기본 0: 안 함)")
+    args = parser.parse_args(argv)
+
+    convert_json_to_js(
+        minify=args.minify or args.prod or args.columnar,
+        columnar=args.columnar,
+        compress=args.compress or args.prod,
+        report=args.report,
+        shards=max(args.shards, 0)
+    )
+
 if __name__ == "__main__":
-    convert_json_to_js()
+    main()
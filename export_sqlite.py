@@ -0,0 +1,306 @@
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+
+# 프로젝트 루트 경로 (이 스크립트가 있는 곳)
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(BASE_DIR, '04_processed_data')
+SOURCES = ['units_with_ids.json', 'weapons.json', 'units_kr.json', 'weapons_kr.json']
+SQLITE_DB = os.path.join(SRC_DIR, 'units.db')
+
+# 스탯: (unit_data 필드, 열 이름 접두사) × (스탯 키, 열 이름) - build_numeric_store.py 와 같은 열 이름
+STAT_SOURCES = [("ステータス", ""), ("アビ込みステータス", "ability_")]
+STAT_KEYS = [("HP", "hp"), ("攻撃力", "attack"), ("機動力", "mobility"), ("防御力", "defense")]
+STAT_COLUMNS = [prefix + name for _, prefix in STAT_SOURCES for _, name in STAT_KEYS]
+
+# ======================
+# 스키마
+# ======================
+# - units.row_id / weapons.row_id 는 JSON 배열 위치 (0부터), 하위 표는 이 번호로 연결
+# - 전문 검색 대상 표(FTS_TABLES)는 모두 row_id INTEGER PRIMARY KEY 를 두고 content_rowid 로 사용
+#   (암시적 rowid 는 VACUUM 때 번호가 바뀔 수 있어 외부 content 색인이 엉뚱한 행을 가리킬 수 있음)
+# - *_kr 열: units_kr.json / weapons_kr.json 의 같은 위치 값
+SCHEMA = f"""
+CREATE TABLE units (
+    row_id INTEGER PRIMARY KEY,
+    id TEXT,
+    unit_name TEXT,
+    unit_name_kr TEXT,
+    rarity TEXT,
+    type TEXT,
+    obtain_method TEXT,
+    icon TEXT,
+    url TEXT,
+    movement_before INTEGER,
+    movement_after INTEGER,
+    has_ssp INTEGER NOT NULL,
+    map_weapon_before INTEGER NOT NULL,
+    map_weapon_after INTEGER NOT NULL,
+    {", ".join(f"{column} INTEGER" for column in STAT_COLUMNS)}
+);
+CREATE TABLE unit_terrain (
+    unit_row INTEGER NOT NULL REFERENCES units(row_id),
+    phase TEXT NOT NULL,
+    terrain TEXT NOT NULL,
+    grade TEXT
+);
+CREATE TABLE unit_tags (
+    unit_row INTEGER NOT NULL REFERENCES units(row_id),
+    tag TEXT NOT NULL
+);
+CREATE TABLE unit_works (
+    unit_row INTEGER NOT NULL REFERENCES units(row_id),
+    work TEXT NOT NULL
+);
+CREATE TABLE abilities (
+    row_id INTEGER PRIMARY KEY,
+    unit_row INTEGER NOT NULL REFERENCES units(row_id),
+    phase TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT,
+    desc TEXT,
+    name_kr TEXT,
+    desc_kr TEXT
+);
+CREATE TABLE mechanisms (
+    row_id INTEGER PRIMARY KEY,
+    unit_row INTEGER NOT NULL REFERENCES units(row_id),
+    position INTEGER NOT NULL,
+    name TEXT,
+    desc TEXT,
+    name_kr TEXT,
+    desc_kr TEXT
+);
+CREATE TABLE custom_cores (
+    row_id INTEGER PRIMARY KEY,
+    unit_row INTEGER NOT NULL REFERENCES units(row_id),
+    position INTEGER NOT NULL,
+    text TEXT
+);
+CREATE TABLE weapons (
+    row_id INTEGER PRIMARY KEY,
+    unit_id TEXT,
+    name TEXT,
+    name_kr TEXT,
+    power INTEGER,
+    range_min INTEGER,
+    range_max INTEGER,
+    range_text TEXT,
+    is_map INTEGER NOT NULL,
+    map_type TEXT,
+    ssp TEXT,
+    is_ssp INTEGER NOT NULL,
+    effect_text TEXT,
+    effect_text_kr TEXT,
+    max_effect_percent INTEGER
+);
+CREATE TABLE weapon_elements (
+    weapon_row INTEGER NOT NULL REFERENCES weapons(row_id),
+    element TEXT NOT NULL
+);
+CREATE TABLE weapon_effect_tags (
+    weapon_row INTEGER NOT NULL REFERENCES weapons(row_id),
+    tag TEXT NOT NULL
+);
+"""
+
+INDEXES = [
+    "CREATE INDEX idx_units_id ON units(id)",
+    "CREATE INDEX idx_units_rarity ON units(rarity)",
+    "CREATE INDEX idx_units_type ON units(type)",
+    "CREATE INDEX idx_units_obtain_method ON units(obtain_method)",
+    "CREATE INDEX idx_unit_terrain_unit ON unit_terrain(unit_row)",
+    "CREATE INDEX idx_unit_tags_tag ON unit_tags(tag, unit_row)",
+    "CREATE INDEX idx_unit_works_work ON unit_works(work, unit_row)",
+    "CREATE INDEX idx_abilities_unit ON abilities(unit_row)",
+    "CREATE INDEX idx_mechanisms_unit ON mechanisms(unit_row)",
+    "CREATE INDEX idx_custom_cores_unit ON custom_cores(unit_row)",
+    "CREATE INDEX idx_weapons_unit_id ON weapons(unit_id)",
+    "CREATE INDEX idx_weapon_elements_element ON weapon_elements(element, weapon_row)",
+    "CREATE INDEX idx_weapon_effect_tags_tag ON weapon_effect_tags(tag, weapon_row)",
+]
+
+# 전문 검색: 일본어 / 한글은 공백으로 단어가 나뉘지 않으므로 trigram (3글자 이상 부분 문자열 검색)
+FTS_TABLES = [
+    ("units_fts", "units", ["unit_name", "unit_name_kr"]),
+    ("weapons_fts", "weapons", ["name", "name_kr", "effect_text", "effect_text_kr"]),
+    ("abilities_fts", "abilities", ["name", "desc", "name_kr", "desc_kr"]),
+]
+
+def to_int(value):
+    """'151,599' / 5 / None → int 또는 None"""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    text = str(value).replace(",", "").strip()
+    return int(text) if text.lstrip("-").isdigit() else None
+
+def kr_at(items, position):
+    """한글 목록의 같은 위치 항목 (없으면 빈 dict)"""
+    return items[position] if items and position < len(items) and isinstance(items[position], dict) else {}
+
+def unit_rows(units, units_kr):
+    """유닛 1개 → units 행 + 하위 표 행들 (표 이름 → 행 목록)"""
+    rows = {"units": [], "unit_terrain": [], "unit_tags": [], "unit_works": [],
+            "abilities": [], "mechanisms": [], "custom_cores": []}
+    for row_id, unit in enumerate(units):
+        unit_kr = units_kr[row_id] if row_id < len(units_kr) else {}
+        movement = unit.get("movement") or {}
+        map_weapon = unit.get("map_weapon") or {}
+        stats = [to_int((unit.get(source) or {}).get(key)) for source, _ in STAT_SOURCES for key, _ in STAT_KEYS]
+        rows["units"].append((
+            row_id, unit.get("id"), unit.get("unit_name"), unit_kr.get("unit_name"),
+            unit.get("rarity"), unit.get("type"), unit.get("obtain_method"), unit.get("icon"), unit.get("url"),
+            to_int(movement.get("before")), to_int(movement.get("after")),
+            int(bool(unit.get("ssp"))), int(bool(map_weapon.get("before"))), int(bool(map_weapon.get("after"))),
+            *stats
+        ))
+
+        for phase, terrain in (unit.get("terrain") or {}).items():
+            for name, grade in (terrain or {}).items():
+                rows["unit_terrain"].append((row_id, phase, name, grade))
+        rows["unit_tags"].extend((row_id, tag) for tag in unit.get("タグ") or [])
+        rows["unit_works"].extend((row_id, work) for work in unit.get("作品") or [])
+
+        abilities_kr = unit_kr.get("abilities") or {}
+        for phase, abilities in (unit.get("abilities") or {}).items():
+            for position, ability in enumerate(abilities or []):
+                ability_kr = kr_at(abilities_kr.get(phase), position)
+                rows["abilities"].append((
+                    len(rows["abilities"]), row_id, phase, position, ability.get("name"), ability.get("desc"),
+                    ability_kr.get("name"), ability_kr.get("description") or ability_kr.get("desc")
+                ))
+
+        for position, mechanism in enumerate(unit.get("mechanism") or []):
+            mechanism_kr = kr_at(unit_kr.get("mechanism"), position)
+            rows["mechanisms"].append((
+                len(rows["mechanisms"]), row_id, position, mechanism.get("name"), mechanism.get("desc"),
+                mechanism_kr.get("name"), mechanism_kr.get("description") or mechanism_kr.get("desc")
+            ))
+
+        for position, text in enumerate((unit.get("ssp") or {}).get("custom_core") or []):
+            rows["custom_cores"].append((len(rows["custom_cores"]), row_id, position, text))
+    return rows
+
+def weapon_rows(weapons, weapons_kr):
+    """무기 목록 → weapons / weapon_elements / weapon_effect_tags 행"""
+    rows = {"weapons": [], "weapon_elements": [], "weapon_effect_tags": []}
+    for row_id, weapon in enumerate(weapons):
+        weapon_kr = kr_at(weapons_kr, row_id)
+        weapon_range = weapon.get("range") or {}
+        rows["weapons"].append((
+            row_id, weapon.get("unit_id"), weapon.get("name"), weapon_kr.get("name"),
+            to_int(weapon.get("power")), to_int(weapon_range.get("min")), to_int(weapon_range.get("max")),
+            weapon_range.get("text"), int(bool(weapon.get("is_map"))), weapon.get("map_type"),
+            weapon.get("ssp"), int(bool(weapon.get("is_ssp"))),
+            weapon.get("effect_text"), weapon_kr.get("effect_text"), to_int(weapon.get("max_effect_percent"))
+        ))
+        rows["weapon_elements"].extend((row_id, element) for element in dict.fromkeys(weapon.get("elements") or []))
+        rows["weapon_effect_tags"].extend((row_id, tag) for tag in dict.fromkeys(weapon.get("effect_tags") or []))
+    return rows
+
+def create_fts(conn):
+    """FTS_TABLES 생성 + 원본 표 내용으로 채움 (trigram 미지원 SQLite면 unicode61)"""
+    tokenizer = "trigram"
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp.fts_probe USING fts5(x, tokenize='trigram')")
+        conn.execute("DROP TABLE temp.fts_probe")
+    except sqlite3.OperationalError:
+        tokenizer = "unicode61"
+        print("ℹ️ 이 SQLite는 trigram 토크나이저를 지원하지 않아 unicode61로 생성합니다 (일본어 부분 검색 제한)")
+
+    for fts, table, columns in FTS_TABLES:
+        column_list = ", ".join(columns)
+        conn.execute(
+            f"CREATE VIRTUAL TABLE {fts} USING fts5({column_list}, content='{table}', content_rowid='row_id', "
+            f"tokenize='{tokenizer}')"
+        )
+        conn.execute(f"INSERT INTO {fts}(rowid, {column_list}) SELECT row_id, {column_list} FROM {table}")
+    return tokenizer
+
+def export_sqlite(units, weapons, units_kr, weapons_kr, path=SQLITE_DB):
+    """
+    가공 데이터 → 정규화된 SQLite 파일
+    - 임시 파일에 만든 뒤 교체하므로 읽는 쪽이 만들다 만 DB를 보지 않음
+    - 반환: {표 이름: 행 수}
+    """
+    tmp_path = path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    rows = unit_rows(units, units_kr)
+    rows.update(weapon_rows(weapons, weapons_kr))
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        # 새 파일을 한 번에 쓰는 용도라 저널 / 동기화 생략
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.executescript(SCHEMA)
+        for table, table_rows in rows.items():
+            if table_rows:
+                placeholders = ", ".join("?" * len(table_rows[0]))
+                conn.executemany(f"INSERT INTO {table} VALUES ({placeholders})", table_rows)
+        for statement in INDEXES:
+            conn.execute(statement)
+        create_fts(conn)
+        conn.commit()
+        conn.execute("ANALYZE")
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, path)
+    return {table: len(table_rows) for table, table_rows in rows.items()}
+
+def load_json(name):
+    with open(os.path.join(SRC_DIR, name), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def search(path, text, limit=20):
+    """유닛 이름 / 무기 이름·효과 전문 검색 → [(종류, unit_id, 이름)]"""
+    query = '"' + text.replace('"', '""') + '"'
+    conn = sqlite3.connect(path)
+    try:
+        units = conn.execute(
+            "SELECT 'unit', u.id, u.unit_name FROM units_fts JOIN units u ON u.row_id = units_fts.rowid "
+            "WHERE units_fts MATCH ? LIMIT ?", (query, limit)
+        ).fetchall()
+        weapons = conn.execute(
+            "SELECT 'weapon', w.unit_id, w.name FROM weapons_fts JOIN weapons w ON w.row_id = weapons_fts.rowid "
+            "WHERE weapons_fts MATCH ? LIMIT ?", (query, limit)
+        ).fetchall()
+    finally:
+        conn.close()
+    return units + weapons
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="04_processed_data JSON → SQLite (04_processed_data/units.db)")
+    parser.add_argument("--search", help="DB를 만들지 않고 기존 DB에서 전문 검색 (3글자 이상)")
+    args = parser.parse_args(argv)
+
+    if args.search:
+        if not os.path.exists(SQLITE_DB):
+            print(f"❌ DB가 없습니다: {SQLITE_DB} (먼저 python export_sqlite.py)")
+            sys.exit(1)
+        for kind, unit_id, name in search(SQLITE_DB, args.search):
+            print(f"{kind:<7} {unit_id or '-':<10} {name}")
+        return
+
+    missing = [name for name in SOURCES if not os.path.exists(os.path.join(SRC_DIR, name))]
+    if missing:
+        print(f"❌ 입력 파일을 찾을 수 없습니다: {', '.join(missing)}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    counts = export_sqlite(*(load_json(name) for name in SOURCES))
+    print(f"✅ SQLite 저장: {SQLITE_DB} ({os.path.getsize(SQLITE_DB):,} bytes, {time.perf_counter() - start:.2f}초)")
+    for table, count in counts.items():
+        print(f"   {table:<20} {count:>7,}행")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,342 @@
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 경로 (이 스크립트가 있는 곳)
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+UNITS_JSON = os.path.join(BASE_DIR, '04_processed_data', 'units_with_ids.json')
+WEAPONS_JSON = os.path.join(BASE_DIR, '04_processed_data', 'weapons.json')
+
+# 스탯: (unit_data 필드, 열 이름 접두사) × (스탯 키, 열 이름) - build_numeric_store.py 와 같은 열 이름
+STAT_SOURCES = [("ステータス", ""), ("アビ込みステータス", "ability_")]
+STAT_KEYS = [("HP", "hp"), ("攻撃力", "attack"), ("機動力", "mobility"), ("防御力", "defense")]
+
+# 지형 적성 → 순위 (비교 필터용, 큰 값이 좋음)
+TERRAINS = ["地上", "宇宙", "水上", "水中", "空中"]
+TERRAIN_RANK = {"◎": 3, "◯": 2, "○": 2, "△": 1, "✕": 0, "×": 0}
+TERRAIN_FILTER = re.compile(r"^(.+?)(>=|<=|=)(.+)$")
+
+# 결과 표에 항상 나오는 열
+SUMMARY_COLUMNS = ["id", "unit_name", "rarity", "type", "obtain_method"]
+
+# agg --func 로 쓸 수 있는 집계 함수
+AGG_FUNCS = ["count", "mean", "median", "max", "min", "sum", "std"]
+
+def parse_terrain_filter(text):
+    """'宇宙>=◯' → ('宇宙', '>=', 2)"""
+    match = TERRAIN_FILTER.match(text.strip())
+    if not match or match.group(1) not in TERRAINS or match.group(3) not in TERRAIN_RANK:
+        raise ValueError(f"지형 조건 형식: 지형(>=|<=|=)기호, 예: 宇宙>=◯ (입력: {text})")
+    return match.group(1), match.group(2), TERRAIN_RANK[match.group(3)]
+
+class UnitDB:
+    """
+    units_with_ids.json / weapons.json 을 한 번 읽어 pandas 표로 보관하고 필터 / 정렬 / 집계
+    - units: 유닛 1행 (스탯 int, 지형 순위 terrain_*, 이동력, SSP / MAP 여부)
+    - weapons: 무기 1행 (unit_id로 units.id 와 연결)
+    - tags / works / abilities / weapon_elements / weapon_effects: (행 번호, 값) 형태의 펼친 표
+    - 조건은 모두 units 행에 대한 boolean 배열로 계산 (행 반복 없음)
+    """
+
+    def __init__(self, units, weapons):
+        self.units = self._unit_frame(units)
+        self.weapons = self._weapon_frame(weapons)
+
+        self.tags = self._exploded(units, "タグ", "tag")
+        self.works = self._exploded(units, "作品", "work")
+        self.abilities = pd.DataFrame(
+            [(row, phase, ability.get("name", ""), ability.get("desc", ""))
+             for row, unit in enumerate(units)
+             for phase, abilities in (unit.get("abilities") or {}).items()
+             for ability in abilities or []],
+            columns=["unit", "phase", "name", "desc"]
+        )
+        self.weapon_elements = self.weapons[["unit_id", "elements"]].explode("elements").dropna()
+        self.weapon_effects = self.weapons[["unit_id", "effect_tags"]].explode("effect_tags").dropna()
+
+    @classmethod
+    def load(cls, units_path=UNITS_JSON, weapons_path=WEAPONS_JSON):
+        with open(units_path, 'r', encoding='utf-8') as f:
+            units = json.load(f)
+        with open(weapons_path, 'r', encoding='utf-8') as f:
+            weapons = json.load(f)
+        return cls(units, weapons)
+
+    @staticmethod
+    def _unit_frame(units):
+        frame = pd.DataFrame({
+            "id": [unit.get("id") for unit in units],
+            "unit_name": [unit.get("unit_name") for unit in units],
+            "rarity": [unit.get("rarity") for unit in units],
+            "type": [unit.get("type") for unit in units],
+            "obtain_method": [unit.get("obtain_method") for unit in units],
+            "has_ssp": [bool(unit.get("ssp")) for unit in units],
+            "map_weapon": [bool((unit.get("map_weapon") or {}).get("after")) for unit in units],
+        })
+        for source, prefix in STAT_SOURCES:
+            for key, name in STAT_KEYS:
+                raw = pd.Series([(unit.get(source) or {}).get(key) for unit in units], dtype="object")
+                frame[prefix + name] = pd.to_numeric(raw.astype(str).str.replace(",", "", regex=False),
+                                                     errors="coerce")
+        frame["movement"] = pd.to_numeric(
+            pd.Series([(unit.get("movement") or {}).get("after") for unit in units], dtype="object"),
+            errors="coerce"
+        )
+        # SSP 이후(최종) 지형 적성
+        for terrain in TERRAINS:
+            frame[f"terrain_{terrain}"] = pd.Series(
+                [TERRAIN_RANK.get((((unit.get("terrain") or {}).get("after")) or {}).get(terrain)) for unit in units],
+                dtype="float"
+            )
+        return frame
+
+    @staticmethod
+    def _weapon_frame(weapons):
+        return pd.DataFrame({
+            "unit_id": [w.get("unit_id") for w in weapons],
+            "name": [w.get("name") for w in weapons],
+            "power": pd.to_numeric(pd.Series([w.get("power") for w in weapons], dtype="object"), errors="coerce"),
+            "range_min": pd.to_numeric(pd.Series([(w.get("range") or {}).get("min") for w in weapons], dtype="object"),
+                                       errors="coerce"),
+            "range_max": pd.to_numeric(pd.Series([(w.get("range") or {}).get("max") for w in weapons], dtype="object"),
+                                       errors="coerce"),
+            "is_map": [bool(w.get("is_map")) for w in weapons],
+            "elements": [w.get("elements") or [] for w in weapons],
+            "effect_tags": [w.get("effect_tags") or [] for w in weapons],
+            "max_effect_percent": pd.to_numeric(pd.Series([w.get("max_effect_percent") for w in weapons],
+                                                          dtype="object"), errors="coerce"),
+        })
+
+    @staticmethod
+    def _exploded(units, field, column):
+        return pd.DataFrame(
+            [(row, value) for row, unit in enumerate(units) for value in unit.get(field) or []],
+            columns=["unit", column]
+        )
+
+    # ======================
+    # 조건
+    # ======================
+    def _has_weapon(self, weapon_mask):
+        """조건을 만족하는 무기가 하나라도 있는 유닛"""
+        return self.units["id"].isin(self.weapons.loc[weapon_mask, "unit_id"]).to_numpy()
+
+    def _in_rows(self, rows):
+        mask = np.zeros(len(self.units), dtype=bool)
+        mask[np.asarray(rows, dtype=int)] = True
+        return mask
+
+    def mask(self, rarity=None, unit_type=None, obtain_method=None, terrain=None, tag=None, work=None,
+             map_weapon=None, element=None, effect_tag=None, min_power=None, ability=None, name=None):
+        """
+        조건 → units 행 boolean 배열 (None인 조건은 무시)
+        - terrain: ['宇宙>=◯', ...] (SSP 이후 적성)
+        - map_weapon: True면 weapons.json 에 MAP 무기가 있는 유닛
+        - element / effect_tag / min_power: 해당 무기가 하나라도 있는 유닛
+        - ability / name: 어빌리티(이름+설명) / 유닛 이름 부분 문자열
+        """
+        units = self.units
+        mask = np.ones(len(units), dtype=bool)
+
+        for column, value in (("rarity", rarity), ("type", unit_type), ("obtain_method", obtain_method)):
+            if value is not None:
+                mask &= (units[column] == value).to_numpy()
+
+        for text in terrain or []:
+            terrain_name, op, rank = parse_terrain_filter(text)
+            values = units[f"terrain_{terrain_name}"].to_numpy()
+            if op == ">=":
+                mask &= values >= rank
+            elif op == "<=":
+                mask &= values <= rank
+            else:
+                mask &= values == rank
+
+        if tag is not None:
+            mask &= self._in_rows(self.tags.loc[self.tags["tag"] == tag, "unit"])
+        if work is not None:
+            mask &= self._in_rows(self.works.loc[self.works["work"] == work, "unit"])
+        if ability is not None:
+            hits = (self.abilities["name"].str.contains(ability, regex=False, na=False)
+                    | self.abilities["desc"].str.contains(ability, regex=False, na=False))
+            mask &= self._in_rows(self.abilities.loc[hits, "unit"])
+        if name is not None:
+            mask &= units["unit_name"].str.contains(name, regex=False, na=False).to_numpy()
+
+        if map_weapon:
+            mask &= self._has_weapon(self.weapons["is_map"])
+        if min_power is not None:
+            mask &= self._has_weapon(self.weapons["power"] >= min_power)
+        if element is not None:
+            mask &= self.units["id"].isin(
+                self.weapon_elements.loc[self.weapon_elements["elements"] == element, "unit_id"]
+            ).to_numpy()
+        if effect_tag is not None:
+            mask &= self.units["id"].isin(
+                self.weapon_effects.loc[self.weapon_effects["effect_tags"] == effect_tag, "unit_id"]
+            ).to_numpy()
+        return mask
+
+    # ======================
+    # 정렬 / 집계
+    # ======================
+    def top(self, by="hp", n=10, ascending=False, **conditions):
+        """조건에 맞는 유닛을 by 열 기준으로 정렬해 상위 n개 (같은 값은 원래 순서, 값 없음은 맨 뒤)"""
+        selected = self.units[self.mask(**conditions)]
+        ranked = selected.sort_values(by, ascending=ascending, kind="stable", na_position="last")
+        columns = SUMMARY_COLUMNS + [by] if by not in SUMMARY_COLUMNS else SUMMARY_COLUMNS
+        return ranked.head(n)[columns]
+
+    def aggregate(self, group="rarity", column="hp", func="mean", **conditions):
+        """조건에 맞는 유닛을 group 열로 묶어 column 집계 (func: AGG_FUNCS 중 하나)"""
+        if func not in AGG_FUNCS:
+            raise ValueError(f"집계 함수는 {' / '.join(AGG_FUNCS)} 중 하나 (입력: {func})")
+        selected = self.units[self.mask(**conditions)]
+        return selected.groupby(group, sort=True)[column].agg(["count", func] if func != "count" else ["count"])
+
+    def weapons_of(self, unit_id):
+        return self.weapons[self.weapons["unit_id"] == unit_id]
+
+# ======================
+# 벤치마크 (같은 질의를 행 반복으로)
+# ======================
+def naive_stat(value):
+    """'151,599' → 151599.0 (없거나 숫자가 아니면 None, UnitDB 의 pd.to_numeric(errors="coerce") 와 같은 기준)"""
+    if value is None:
+        return None
+    try:
+        return float(str(value).replace(",", ""))
+    except ValueError:
+        return None
+
+def naive_top(units, weapons, by="hp", n=10, terrain=None, map_weapon=False, rarity=None, element=None):
+    """JSON을 그대로 돌면서 필터 / 정렬하는 기존 방식 (UnitDB.top 과 결과 비교용)"""
+    source, key = next((source, key) for source, prefix in STAT_SOURCES for key, name in STAT_KEYS
+                       if prefix + name == by)
+    results = []
+    for unit in units:
+        if rarity is not None and unit.get("rarity") != rarity:
+            continue
+        ok = True
+        for text in terrain or []:
+            name, op, rank = parse_terrain_filter(text)
+            value = TERRAIN_RANK.get(((unit.get("terrain") or {}).get("after") or {}).get(name))
+            if value is None or not (value >= rank if op == ">=" else value <= rank if op == "<=" else value == rank):
+                ok = False
+        if map_weapon and not any(w.get("unit_id") == unit.get("id") and w.get("is_map") for w in weapons):
+            ok = False
+        if element is not None and not any(w.get("unit_id") == unit.get("id") and element in (w.get("elements") or [])
+                                           for w in weapons):
+            ok = False
+        if ok:
+            results.append(unit)
+    # UnitDB.top 과 같이 값 없음은 맨 뒤, 같은 값은 원래 순서
+    def sort_key(unit):
+        value = naive_stat((unit.get(source) or {}).get(key))
+        return (value is None, -value if value is not None else 0)
+    results.sort(key=sort_key)
+    return [unit.get("id") for unit in results[:n]]
+
+BENCHMARK_QUERIES = [
+    {"by": "hp", "terrain": ["宇宙>=◯"], "map_weapon": True},
+    {"by": "ability_attack", "rarity": "UR", "element": "ビーム"},
+    {"by": "mobility", "terrain": ["地上>=◯", "空中>=◯"]},
+]
+
+def run_benchmark(db, units, weapons, repeat=5):
+    print(f"⏱️ 질의 벤치마크 ({repeat}회 평균)")
+    for query in BENCHMARK_QUERIES:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fast = db.top(n=10, **query)["id"].tolist()
+        fast_ms = (time.perf_counter() - start) / repeat * 1000
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            slow = naive_top(units, weapons, n=10, **query)
+        slow_ms = (time.perf_counter() - start) / repeat * 1000
+
+        print(f"   {json.dumps(query, ensure_ascii=False)}")
+        print(f"      UnitDB {fast_ms:8.2f} ms / 반복문 {slow_ms:8.2f} ms  (결과 일치: {fast == slow})")
+
+# ======================
+# CLI
+# ======================
+def add_condition_args(parser):
+    parser.add_argument("--rarity", help="레어도 (UR / SSR / SR / R / N)")
+    parser.add_argument("--type", dest="unit_type", help="타입 (攻撃 / 支援 / 耐久)")
+    parser.add_argument("--obtain", dest="obtain_method", help="입수방법 (ガシャ 등)")
+    parser.add_argument("--terrain", action="append", help="지형 적성 조건, 반복 가능 (예: 宇宙>=◯)")
+    parser.add_argument("--tag", help="タグ")
+    parser.add_argument("--work", help="作品")
+    parser.add_argument("--map", dest="map_weapon", action="store_true", help="MAP 무기 보유")
+    parser.add_argument("--element", help="무기 속성 (ビーム / 格闘 ...)")
+    parser.add_argument("--effect-tag", help="무기 효과 태그")
+    parser.add_argument("--min-power", type=int, help="이 위력 이상 무기 보유")
+    parser.add_argument("--ability", help="어빌리티 이름 / 설명 부분 문자열")
+    parser.add_argument("--name", help="유닛 이름 부분 문자열")
+
+def conditions_from(args):
+    names = ["rarity", "unit_type", "obtain_method", "terrain", "tag", "work", "map_weapon",
+             "element", "effect_tag", "min_power", "ability", "name"]
+    return {name: getattr(args, name) for name in names}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="units_with_ids.json / weapons.json 필터 · 정렬 · 집계")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    top = sub.add_parser("top", help="조건에 맞는 유닛 상위 N개")
+    top.add_argument("--by", default="hp", help="정렬 열 (hp / attack / ability_hp / movement ...)")
+    top.add_argument("-n", type=int, default=10)
+    top.add_argument("--asc", action="store_true", help="오름차순")
+    add_condition_args(top)
+
+    agg = sub.add_parser("agg", help="조건에 맞는 유닛 그룹별 집계")
+    agg.add_argument("--group", default="rarity", help="묶을 열 (rarity / type / obtain_method ...)")
+    agg.add_argument("--column", default="hp", help="집계할 열")
+    agg.add_argument("--func", default="mean", choices=AGG_FUNCS, help="집계 함수 (기본 mean)")
+    add_condition_args(agg)
+
+    sub.add_parser("benchmark", help="UnitDB 와 반복문 방식 질의 시간 비교")
+    args = parser.parse_args(argv)
+
+    for path in (UNITS_JSON, WEAPONS_JSON):
+        if not os.path.exists(path):
+            print(f"❌ 입력 파일을 찾을 수 없습니다: {path}")
+            sys.exit(1)
+
+    start = time.perf_counter()
+    with open(UNITS_JSON, 'r', encoding='utf-8') as f:
+        units = json.load(f)
+    with open(WEAPONS_JSON, 'r', encoding='utf-8') as f:
+        weapons = json.load(f)
+    db = UnitDB(units, weapons)
+    print(f"📖 로드: 유닛 {len(db.units)}개, 무기 {len(db.weapons)}개 ({time.perf_counter() - start:.2f}초)\n")
+
+    if args.command == "benchmark":
+        run_benchmark(db, units, weapons)
+        return
+
+    start = time.perf_counter()
+    try:
+        if args.command == "top":
+            result = db.top(by=args.by, n=args.n, ascending=args.asc, **conditions_from(args))
+        else:
+            result = db.aggregate(group=args.group, column=args.column, func=args.func, **conditions_from(args))
+    except (KeyError, ValueError) as e:
+        print(f"❌ 질의 오류: {e}")
+        sys.exit(1)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    with pd.option_context("display.max_rows", None, "display.width", 200):
+        print(result.to_string())
+    print(f"\n⏱️ 질의 {elapsed:.1f} ms")
+
+if __name__ == "__main__":
+    main()
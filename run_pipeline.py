@@ -1,71 +1,528 @@
+import argparse
+import hashlib
+import json
 import subprocess
 import sys
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+# 프로젝트 루트 경로 (이 스크립트가 있는 곳)
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 단계별 입력/출력 해시 기록 (다음 실행 때 건너뛰기 판단용)
+STATE_FILE = os.path.join(BASE_DIR, "04_processed_data", "pipeline_state.json")
+
+# ======================
+# 파이프라인 단계 정의
+# ======================
+# - deps: 먼저 끝나야 하는 단계
+# - inputs / outputs: BASE_DIR 기준 경로 (스크립트 자신은 자동으로 입력에 포함, 스크립트가 import 하는 로컬 모듈은 직접 적어야 함)
+#   입력이면서 출력인 파일 (match_resolutions.json 등)은 실행 후 내용으로 기록
+# - always: 네트워크에서 받아오는 단계는 입력 해시로 판단할 수 없으므로 항상 실행
+PIPELINE_STAGES = [
+    # 1. 크롤링 (브라우저 1개로 unit_data + 무기 테이블)
+    {
+        "name": "crawl",
+        "script": "01_crawlers/crawl_all.py",
+        "deps": [],
+        "inputs": [],
+        "outputs": [
+            "02_raw_data/unit_data.json",
+            "02_raw_data/unit_data.js",
+            "02_raw_data/weapons_raw.html"
+        ],
+        "always": True
+    },
+
+    # 번역 사전 (엑셀 → auto_translation.json), HTML 파싱과 무관
+    {
+        "name": "build_dicts",
+        "script": "03_parsers/translate_to_korean.py",
+        "args": ["--build-dicts-only"],
+        "deps": [],
+        "inputs": [
+            "02_raw_data/soshage_units_ko.xlsx",
+            "02_raw_data/soshage_units_ja.xlsx",
+            "03_parsers/names.py",
+            "03_parsers/term_replacer.py",
+            "03_parsers/translation_dicts/manual_translation.json",
+            "03_parsers/translation_dicts/error_correction.json"
+        ],
+        "outputs": [
+            "03_parsers/translation_dicts/auto_translation.json",
+            "03_parsers/translation_dicts/auto_translation.meta.json"
+        ]
+    },
+
+    # 2. 파싱 (기본) - 유닛 페이지를 받아오므로 항상 실행 (자체 캐시/증분 파싱 사용)
+    {
+        "name": "parse_units",
+        "script": "03_parsers/main.py",
+        "deps": ["crawl"],
+        "inputs": ["02_raw_data/unit_data.json"],
+        "outputs": ["04_processed_data/units.json"],
+        "always": True
+    },
+
+    # 3. ID 매칭
+    {
+        "name": "match_ids",
+        "script": "03_parsers/match_weapon_ids.py",
+        "deps": ["parse_units", "crawl"],
+        "inputs": [
+            "04_processed_data/units.json",
+            "02_raw_data/weapons_raw.html",
+            "03_parsers/match_resolutions.json",
+            "03_parsers/names.py"
+        ],
+        "outputs": [
+            "04_processed_data/units_with_ids.json",
+            "04_processed_data/weapons_with_ids.html",
+            "03_parsers/match_resolutions.json"
+        ]
+    },
+
+    # 4. 무기 JSON화
+    {
+        "name": "parse_weapons",
+        "script": "03_parsers/parse_weapons_to_json.py",
+        "deps": ["match_ids"],
+        "inputs": ["04_processed_data/weapons_with_ids.html"],
+        "outputs": ["04_processed_data/weapons.json"]
+    },
+
+    # 5. 한글화
+    {
+        "name": "translate",
+        "script": "03_parsers/translate_to_korean.py",
+        "deps": ["build_dicts", "match_ids", "parse_weapons"],
+        "inputs": [
+            "04_processed_data/units_with_ids.json",
+            "04_processed_data/weapons.json",
+            "03_parsers/names.py",
+            "03_parsers/term_replacer.py",
+            "03_parsers/translation_dicts/auto_translation.json",
+            "03_parsers/translation_dicts/manual_translation.json",
+            "03_parsers/translation_dicts/error_correction.json"
+        ],
+        "outputs": [
+            "04_processed_data/units_kr.json",
+            "04_processed_data/weapons_kr.json",
+            "03_parsers/translation_dicts/untranslated_units.json",
+            "03_parsers/translation_dicts/untranslated_weapons.json"
+        ]
+    },
+
+    # 6. JS 변환 (최종)
+    {
+        "name": "convert_js",
+        "script": "convert_json_to_js.py",
+        "deps": ["match_ids", "parse_weapons", "translate"],
+        "inputs": [
+            "04_processed_data/units_with_ids.json",
+            "04_processed_data/weapons.json",
+            "04_processed_data/units_kr.json",
+            "04_processed_data/weapons_kr.json"
+        ],
+        "outputs": [
+            "05_web/assets/units_jp.js",
+            "05_web/assets/weapons_jp.js",
+            "05_web/assets/units_kr.js",
+            "05_web/assets/weapons_kr.js",
+            "05_web/assets/weapons_jp_index.js",
+            "05_web/assets/weapons_kr_index.js"
+        ]
+    },
+
+    # 7. 검색 인덱스 (유닛 / 무기 이름, 일본어 + 한글)
+    {
+        "name": "search_index",
+        "script": "build_search_index.py",
+        "deps": ["match_ids", "parse_weapons", "translate"],
+        "inputs": [
+            "04_processed_data/units_with_ids.json",
+            "04_processed_data/weapons.json",
+            "04_processed_data/units_kr.json",
+            "04_processed_data/weapons_kr.json",
+            "03_parsers/names.py",
+            "convert_json_to_js.py"
+        ],
+        "outputs": [
+            "05_web/assets/search_index.js"
+        ]
+    },
+
+    # 8. 숫자 열 저장 (유닛 스탯 / 무기 수치 → 브라우저용 binary)
+    {
+        "name": "numeric_store",
+        "script": "build_numeric_store.py",
+        "deps": ["match_ids", "parse_weapons"],
+        "inputs": [
+            "04_processed_data/units_with_ids.json",
+            "04_processed_data/weapons.json",
+            "convert_json_to_js.py"
+        ],
+        "outputs": [
+            "05_web/assets/numeric_store.bin",
+            "05_web/assets/numeric_store.js"
+        ]
+    },
+
+    # 9. SQLite 내보내기 (색인 + 전문 검색)
+    {
+        "name": "export_sqlite",
+        "script": "export_sqlite.py",
+        "deps": ["match_ids", "parse_weapons", "translate"],
+        "inputs": [
+            "04_processed_data/units_with_ids.json",
+            "04_processed_data/weapons.json",
+            "04_processed_data/units_kr.json",
+            "04_processed_data/weapons_kr.json"
+        ],
+        "outputs": [
+            "04_processed_data/units.db"
+        ]
+    }
+]
+
+# ======================
+# 해시 / 상태 파일
+# ======================
+def file_hash(rel_path):
+    """파일 내용 해시 (없으면 None)"""
+    path = os.path.join(BASE_DIR, rel_path)
+    if not os.path.exists(path):
+        return None
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def stage_inputs(stage):
+    return [stage["script"]] + stage["inputs"]
+
+def hash_files(paths):
+    return {path: file_hash(path) for path in paths}
+
+def load_state():
+    if not os.path.exists(STATE_FILE):
+        return {}
+    try:
+        with open(STATE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_state(state):
+    os.makedirs(os.path.dirname(STATE_FILE), exist_ok=True)
+    with open(STATE_FILE, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+
+def is_up_to_date(stage, previous, input_hashes):
+    """
+    이전 실행과 입력 해시 / 인자가 같고, 출력 파일도 그때 만든 그대로면 True
+    """
+    if stage.get("always") or not previous:
+        return False
+    if previous.get("args") != stage.get("args", []) or previous.get("inputs") != input_hashes:
+        return False
+    outputs = hash_files(stage["outputs"])
+    return None not in outputs.values() and previous.get("outputs") == outputs
+
+# ======================
+# 실행
+# ======================
+def run_script(stage):
+    """
+    단계 스크립트를 실행하고 (성공 여부, 출력, 소요 시간)을 반환합니다.
+    - 병렬 실행 시 로그가 섞이지 않도록 출력은 모아서 반환
+    """
+    script_path = os.path.join(BASE_DIR, stage["script"])
+    start = time.perf_counter()
 
-def run_script(script_path):
-    """파이썬 스크립트를 실행하고 성공 여부를 반환합니다."""
-    print(f"\n🚀 실행 중: {script_path}")
-    
     # 현재 실행 중인 파이썬 인터프리터(sys.executable)를 사용하여 스크립트 실행
-    result = subprocess.run([sys.executable, script_path], capture_output=False)
-    
-    if result.returncode == 0:
-        print(f"✅ 성공: {script_path}")
-        return True
+    result = subprocess.run(
+        [sys.executable, script_path] + stage.get("args", []),
+        cwd=BASE_DIR,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        env=dict(os.environ, PYTHONIOENCODING="utf-8", PYTHONUNBUFFERED="1")
+    )
+    elapsed = time.perf_counter() - start
+    return result.returncode, result.stdout + result.stderr, elapsed
+
+def print_stage_log(stage, returncode, output):
+    print(f"\n🚀 [{stage['name']}] {stage['script']}")
+    if output.strip():
+        print(output.rstrip())
+    if returncode == 0:
+        print(f"✅ 성공: {stage['name']}")
     else:
-        print(f"❌ 실패: {script_path} (Exit Code: {result.returncode})")
-        return False
+        print(f"❌ 실패: {stage['name']} (Exit Code: {returncode})")
+
+def run_pipeline(stages, jobs, force=False):
+    """
+    의존성 그래프 순서대로 실행 (의존 단계가 모두 끝난 단계는 동시에 실행)
+    - 입력/출력 해시가 이전 실행과 같은 단계는 건너뜀 (force=True면 전부 실행)
+    - 반환: (성공 여부, 단계별 결과 {name: (상태, 소요 시간)})
+    """
+    previous = load_state()
+    state = {} if force else previous
+    new_state = dict(previous)
+    results = {}
+    pending = list(stages)
+    running = {}
+    failed = False
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        while pending or running:
+            # 의존 단계가 모두 끝난 단계 시작 (실패가 있으면 새 단계는 시작하지 않음)
+            for stage in list(pending):
+                if failed:
+                    break
+                if any(dep not in results for dep in stage["deps"]):
+                    continue
+                pending.remove(stage)
+
+                input_hashes = hash_files(stage_inputs(stage))
+                if is_up_to_date(stage, state.get(stage["name"]), input_hashes):
+                    print(f"\n⏭️ [{stage['name']}] 입력/출력 변경 없음 → 건너뜀")
+                    results[stage["name"]] = ("건너뜀", 0.0)
+                    continue
+
+                print(f"\n▶️ [{stage['name']}] 시작")
+                running[executor.submit(run_script, stage)] = (stage, input_hashes)
+
+            if not running:
+                if pending and not failed:
+                    # 남은 단계의 의존성이 정의에 없거나 순환하는 경우
+                    names = ", ".join(stage["name"] for stage in pending)
+                    print(f"\n⛔ 실행할 수 없는 단계: {names}")
+                    failed = True
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, input_hashes = running.pop(future)
+                returncode, output, elapsed = future.result()
+                print_stage_log(stage, returncode, output)
+
+                if returncode == 0:
+                    results[stage["name"]] = ("실행", elapsed)
+                    outputs = hash_files(stage["outputs"])
+                    new_state[stage["name"]] = {
+                        "args": stage.get("args", []),
+                        "inputs": {path: outputs.get(path, digest) for path, digest in input_hashes.items()},
+                        "outputs": outputs
+                    }
+                else:
+                    results[stage["name"]] = ("실패", elapsed)
+                    new_state.pop(stage["name"], None)
+                    failed = True
+
+    save_state(new_state)
 
-def main():
-    # 프로젝트 루트 경로 (이 스크립트가 있는 곳)
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-
-    # 실행 순서 정의
-    pipeline_steps = [
-        # 1. 크롤링
-        "01_crawlers/extract_unit_data.py",
-        "01_crawlers/extract_weapons_table.py",
-        
-        # 2. 파싱 (기본)
-        "03_parsers/main.py",
-        
-        # 3. ID 매칭
-        "03_parsers/match_weapon_ids.py",
-        
-        # 4. 무기 JSON화
-        "03_parsers/parse_weapons_to_json.py",
-        
-        # 5. 한글화
-        "03_parsers/translate_to_korean.py",
-        
-        # 6. JS 변환 (최종)
-        "convert_json_to_js.py"
-    ]
+    for stage in stages:
+        results.setdefault(stage["name"], ("미실행", 0.0))
+    return not failed, results
+
+# ======================
+# 한 프로세스 실행 (--in-process)
+# ======================
+def stage_by_name(name):
+    return next(stage for stage in PIPELINE_STAGES if stage["name"] == name)
+
+def record_stage_state(state, stage):
+    """파일로 저장된 입력/출력 기준으로 단계 상태 기록 (다음 일반 실행의 건너뛰기 판단용)"""
+    state[stage["name"]] = {
+        "args": stage.get("args", []),
+        "inputs": hash_files(stage_inputs(stage)),
+        "outputs": hash_files(stage["outputs"])
+    }
+
+def run_in_process(jobs, checkpoint=False):
+    """
+    크롤링만 별도 프로세스로 실행하고, 나머지 단계는 이 프로세스 안에서 함수로 이어서 실행
+    - 단계 사이 데이터는 메모리로 전달 (units.json → units_with_ids.json → units_kr.json 재로드 없음)
+    - 파일은 마지막에 한 번에 저장, checkpoint=True면 단계마다 바로 저장
+    - units.json은 증분 파싱 매니페스트와 짝이라 항상 파싱 직후 저장
+    - 해시 기반 건너뛰기는 하지 않음 (모든 단계 실행)
+    """
+    sys.path.insert(0, os.path.join(BASE_DIR, "03_parsers"))
+    import main as unit_main
+    import match_weapon_ids
+    import parse_weapons_to_json
+    import translate_to_korean
+    import convert_json_to_js
+    import build_search_index
+    import build_numeric_store
+    import export_sqlite
+
+    crawl_stages = [stage_by_name("crawl")]
+    results = {}
+    step_start = time.perf_counter()
+
+    def step(name):
+        nonlocal step_start
+        results[name] = ("실행", time.perf_counter() - step_start)
+        step_start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # 번역 사전은 크롤링과 동시에 준비
+        dicts_start = time.perf_counter()
+        dicts_future = executor.submit(
+            lambda: (translate_to_korean.load_translation_dicts(), time.perf_counter() - dicts_start)
+        )
+
+        success, crawl_results = run_pipeline(crawl_stages, jobs)
+        results.update(crawl_results)
+        if not success:
+            return False, results
+
+        try:
+            dicts, dicts_elapsed = dicts_future.result()
+            results["build_dicts"] = ("실행", dicts_elapsed)
+            step_start = time.perf_counter()
+
+            # 2. 파싱
+            print("\n▶️ [parse_units] 시작")
+            unit_args = unit_main.parse_args(stage_by_name("parse_units").get("args", []))
+            unit_data = unit_main.load_unit_data()
+            units, manifest = unit_main.parse_units(unit_data, unit_args)
+            unit_main.save_units(units, manifest)
+            if len(units) < len(unit_data):
+                raise RuntimeError(f"{len(unit_data) - len(units)}개 유닛이 오류로 units.json 에서 빠졌습니다")
+            step("parse_units")
+
+            # 3. ID 매칭 (units / soup 에 바로 ID 부여)
+            print("\n▶️ [match_ids] 시작")
+            soup = match_weapon_ids.load_weapons_soup()
+            match_weapon_ids.match_weapon_ids(units, soup)
+            weapons_html = str(soup)
+            if checkpoint:
+                match_weapon_ids.save_matched(units, weapons_html)
+            step("match_ids")
+
+            # 4. 무기 JSON화 (weapons_with_ids.html을 다시 읽지 않고 메모리에서 스트리밍 파싱)
+            print("\n▶️ [parse_weapons] 시작")
+            weapons = parse_weapons_to_json.weapons_from_html(weapons_html)
+            if checkpoint:
+                parse_weapons_to_json.save_weapons(weapons)
+            step("parse_weapons")
+
+            # 5. 한글화
+            print("\n▶️ [translate] 시작")
+            auto_dict, manual_dict, error_dict, normalized_map, replacer = dicts
+            units_kr, untranslated_units = translate_to_korean.translate_units(
+                auto_dict, manual_dict, error_dict, normalized_map, replacer, units=units
+            )
+            weapons_kr, untranslated_weapons = translate_to_korean.translate_weapons(
+                auto_dict, manual_dict, error_dict, normalized_map, weapons=weapons
+            )
+            if checkpoint:
+                translate_to_korean.save_translations(units_kr, untranslated_units, weapons_kr, untranslated_weapons)
+            step("translate")
+
+            # 6. JS 변환
+            print("\n▶️ [convert_js] 시작")
+            convert_json_to_js.convert_json_to_js({
+                "units_with_ids.json": units,
+                "weapons.json": weapons,
+                "units_kr.json": units_kr,
+                "weapons_kr.json": weapons_kr
+            })
+            step("convert_js")
+
+            # 7. 검색 인덱스
+            print("\n▶️ [search_index] 시작")
+            build_search_index.write_search_index(
+                build_search_index.build_search_index(units, weapons, units_kr, weapons_kr)
+            )
+            step("search_index")
+
+            # 8. 숫자 열 저장
+            print("\n▶️ [numeric_store] 시작")
+            build_numeric_store.save_numeric_store(build_numeric_store.build_numeric_store(units, weapons))
+            step("numeric_store")
+
+            # 9. SQLite 내보내기
+            print("\n▶️ [export_sqlite] 시작")
+            export_sqlite.export_sqlite(units, weapons, units_kr, weapons_kr)
+            step("export_sqlite")
+
+            # 중간 결과 저장
+            if not checkpoint:
+                print("\n💾 중간 결과 저장 중...")
+                match_weapon_ids.save_matched(units, weapons_html)
+                parse_weapons_to_json.save_weapons(weapons)
+                translate_to_korean.save_translations(units_kr, untranslated_units, weapons_kr, untranslated_weapons)
+                step("save")
+        except Exception as e:
+            print(f"\n❌ 실패: {e}")
+            for stage in PIPELINE_STAGES:
+                if stage["name"] not in results:
+                    results[stage["name"]] = ("실패", time.perf_counter() - step_start)
+                    break
+            return False, results
+
+    state = load_state()
+    for stage in PIPELINE_STAGES:
+        if stage not in crawl_stages:
+            record_stage_state(state, stage)
+    save_state(state)
+    return True, results
+
+def print_summary(stages, results, total):
+    print("\n⏱️ 단계별 소요 시간")
+    names = [stage["name"] for stage in stages] + [name for name in results if name not in {s["name"] for s in stages}]
+    for name in names:
+        status, elapsed = results.get(name, ("미실행", 0.0))
+        print(f"   {name:<14} {status:<4} {elapsed:7.2f}초")
+    print(f"   {'전체':<14} {total:12.2f}초")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="GGEN Eternal 데이터 파이프라인")
+    parser.add_argument("--jobs", type=int, default=3, help="동시에 실행할 최대 단계 수 (기본 3)")
+    parser.add_argument("--force", action="store_true", help="변경 여부와 관계없이 모든 단계 실행")
+    parser.add_argument("--in-process", action="store_true",
+                        help="크롤링 이후 단계를 한 프로세스에서 실행하고 데이터를 메모리로 전달")
+    parser.add_argument("--checkpoint", action="store_true",
+                        help="--in-process 에서 중간 결과를 단계마다 바로 저장 (기본은 마지막에 저장)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # 파일 존재 확인
+    for stage in PIPELINE_STAGES:
+        if not os.path.exists(os.path.join(BASE_DIR, stage["script"])):
+            print(f"⛔ 파일 없음: {stage['script']}")
+            print("파이프라인을 중단합니다.")
+            sys.exit(1)
 
     print("=========================================")
     print("🤖 GGEN Eternal Crawler Pipeline 시작")
     print("=========================================")
 
-    for step in pipeline_steps:
-        script_full_path = os.path.join(base_dir, step)
-        
-        # 파일 존재 확인
-        if not os.path.exists(script_full_path):
-            print(f"⛔ 파일 없음: {step}")
-            print("파이프라인을 중단합니다.")
-            sys.exit(1)
+    start = time.perf_counter()
+    if args.in_process:
+        success, results = run_in_process(max(1, args.jobs), checkpoint=args.checkpoint)
+    else:
+        success, results = run_pipeline(PIPELINE_STAGES, max(1, args.jobs), force=args.force)
+    print_summary(PIPELINE_STAGES, results, time.perf_counter() - start)
 
-        # 스크립트 실행
-        success = run_script(script_full_path)
-        
-        # 실패 시 파이프라인 중단
-        if not success:
-            print("\n⛔ 오류가 발생하여 파이프라인을 중단합니다.")
-            sys.exit(1)
+    # 실패 시 파이프라인 중단
+    if not success:
+        print("\n⛔ 오류가 발생하여 파이프라인을 중단합니다.")
+        sys.exit(1)
 
     print("\n=========================================")
     print("✨ 모든 작업이 성공적으로 완료되었습니다!")
     print("=========================================")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,148 @@
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "03_parsers"))
+
+import main as unit_main
+from fetcher import HostRateLimiter
+
+FIXTURE_PAGE = (Path(__file__).parent / "fixtures" / "unit_page.html").read_text(encoding="utf-8")
+UNIT_COUNT = 12
+RESPONSE_DELAY = 0.02
+
+
+class StandInServer:
+    """저장된 유닛 페이지를 돌려주는 로컬 HTTP 서버 (동시 요청 수 기록)"""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                unit_no = int(self.path.rstrip("/").rsplit("/", 1)[-1])
+                with server._lock:
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                try:
+                    # 앞 번호일수록 늦게 응답 → 완료 순서가 입력 순서와 달라짐
+                    time.sleep(RESPONSE_DELAY * (UNIT_COUNT - unit_no))
+                    body = FIXTURE_PAGE.replace("{unit_no}", str(unit_no)).encode("utf-8")
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/html; charset=utf-8")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def unit_rows(count=UNIT_COUNT):
+    return [
+        {
+            "name": f"テストユニット{no}",
+            "url": f"https://appmedia.jp/ggene_eternal/{no}",
+            "レアリティ": "UR",
+            "タイプ": "攻撃",
+            "入手タイプ": "ガシャ",
+            "地形適正": {"宇宙": "◯"}
+        }
+        for no in range(count)
+    ]
+
+
+def run_parse_units(units, base_url, *extra):
+    args = unit_main.parse_args(["--base-url", base_url, "--no-cache", "--full", "--retries", "0", *extra])
+    results, _ = unit_main.parse_units(units, args)
+    return results
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_concurrent_fetch_keeps_input_order(jobs):
+    units = unit_rows()
+    with StandInServer() as server:
+        results = run_parse_units(units, server.base_url, "--workers", "4", "--rate", "0", "--jobs", jobs)
+
+    assert [record["unit_name"] for record in results] == [unit["name"] for unit in units]
+    # 각 레코드는 자기 URL의 페이지를 파싱한 결과
+    assert [record["weapons"][0]["name"] for record in results] == [
+        f"{no}番機 ビーム・ライフル" for no in range(UNIT_COUNT)
+    ]
+    assert 1 < server.max_in_flight <= 4
+
+
+class RecordingRateLimiter(HostRateLimiter):
+    """wait 가 돌려준(= 요청을 보내도 된) 시각 기록"""
+
+    instances = []
+
+    def __init__(self, rate_per_sec):
+        super().__init__(rate_per_sec)
+        self.released = []
+        RecordingRateLimiter.instances.append(self)
+
+    def wait(self, url):
+        super().wait(url)
+        self.released.append(time.monotonic())
+
+
+def test_rate_limit_is_respected(monkeypatch):
+    rate = 20.0
+    RecordingRateLimiter.instances = []
+    monkeypatch.setattr(unit_main, "HostRateLimiter", RecordingRateLimiter)
+
+    with StandInServer() as server:
+        start = time.monotonic()
+        results = run_parse_units(unit_rows(), server.base_url, "--workers", "6", "--rate", str(rate))
+
+    assert len(results) == UNIT_COUNT
+    (limiter,) = RecordingRateLimiter.instances
+    released = sorted(limiter.released)
+    assert len(released) == UNIT_COUNT
+    # k번째 요청 슬롯은 첫 슬롯(start 이후) + k / rate 이므로, k번째로 풀린 시각도 그 이후
+    # (서버 도착 시각은 연결 / 스레드 지연이 섞이므로 비교하지 않음)
+    for k, released_at in enumerate(released):
+        assert released_at >= start + k / rate
+
+
+def test_host_rate_limiter_spaces_requests_per_host(monkeypatch):
+    import fetcher
+
+    sleeps = []
+    monkeypatch.setattr(fetcher.time, "sleep", sleeps.append)
+    limiter = HostRateLimiter(50)
+    for _ in range(5):
+        limiter.wait("http://a.example/1")
+    a_sleeps = list(sleeps)
+    # 다른 호스트는 따로 계산되므로 기다리지 않음
+    limiter.wait("http://b.example/1")
+
+    assert sleeps == a_sleeps
+    assert len(a_sleeps) == 4
+    # 실제로 자지 않으므로 대기 시간은 슬롯이 밀린 만큼 계속 늘어남 (k번째는 k / 50 이하)
+    assert a_sleeps == sorted(a_sleeps) and len(set(a_sleeps)) == 4
+    for k, delay in enumerate(a_sleeps, start=1):
+        assert 0 < delay <= k / 50
@@ -0,0 +1,82 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "01_crawlers"))
+
+import extract_unit_data
+from js_literal import extract_js_var, js_to_json, parse_js_literal
+
+FIXTURE_PAGE = Path(__file__).parent / "fixtures" / "unit_list_page.html"
+
+EXPECTED_UNITS = [
+    {
+        "name": "ガンダム",
+        "url": "https://appmedia.jp/ggene_eternal/78593888",
+        "list_name": "ガンダム(EX)",
+        "dom": '<a href="https://appmedia.jp/ggene_eternal/78593888">ガンダム(EX)</a>',
+        "レアリティ": "UR",
+        "タイプ": "耐久",
+        "アビ込みステータス": {"HP": "151599", "攻撃力": "9072"},
+        "地形適正": {"宇宙": "◯", "地上": "◎"},
+        "タグ": ["ビーム", "ガンダム"],
+        "MAP兵器": None,
+    },
+    {
+        "name": "Zeta's [改]",
+        "url": "https://appmedia.jp/ggene_eternal/78747254",
+        "list_name": 'It\'s a "test" A😀',
+        "dom": '<a href="https://appmedia.jp/ggene_eternal/78747254">\nZガンダム</a>',
+        "レアリティ": "UR",
+        "タイプ": "攻撃",
+        "memo": "閉じ括弧 ] } と // を含む文字列",
+        "path": "C:\\units\\zeta",
+        "MAP兵器": None,
+    },
+]
+
+
+@pytest.mark.parametrize("literal, expected", [
+    ('[{name:"Zeta\\\'s"}]', [{"name": "Zeta's"}]),
+    ("[{name:'Zeta\\'s'}]", [{"name": "Zeta's"}]),
+    ("['say \"hi\"']", ['say "hi"']),
+    ('["a\\`b", `c\\`d`]', ["a`b", "c`d"]),
+    ('["\\x41\\u0042\\u{43}"]', ["ABC"]),
+    ('["\\v\\0"]', ["\x0b\x00"]),
+    ('["line\\\ncontinued"]', ["linecontinued"]),
+    ('["back\\\\slash\\\\"]', ["back\\slash\\"]),
+    ('["tab\there"]', ["tab\there"]),
+    ("{a: [1, 2,], b: undefined, /* c */ d: true,}", {"a": [1, 2], "b": None, "d": True}),
+])
+def test_js_to_json_quote_and_escape_cases(literal, expected):
+    assert json.loads(js_to_json(literal)) == expected
+    assert parse_js_literal(literal) == expected
+
+
+def test_extract_js_var_from_saved_page():
+    page = FIXTURE_PAGE.read_text(encoding="utf-8")
+    # 주석 / 문자열 속 예시 코드는 건너뛰고 실제 unit_data 리터럴을 찾음
+    assert extract_js_var(page, "unit_data", validate=extract_unit_data.is_unit_data) == EXPECTED_UNITS
+
+
+def test_extract_js_var_missing_variable():
+    assert extract_js_var("<script>var other = [1];</script>", "unit_data") is None
+
+
+def test_crawl_unit_data_fast_offline(tmp_path, monkeypatch):
+    monkeypatch.setattr(extract_unit_data, "OUTPUT_DIR", str(tmp_path))
+
+    # --html 경로는 요청 / 브라우저를 사용하지 않음
+    def no_network(*args, **kwargs):
+        raise AssertionError("network used")
+    monkeypatch.setattr(extract_unit_data, "fetch_page_source", no_network)
+    monkeypatch.setattr(extract_unit_data, "create_driver", no_network)
+
+    extract_unit_data.main(["--html", str(FIXTURE_PAGE)])
+
+    with open(tmp_path / "unit_data.json", encoding="utf-8") as f:
+        assert json.load(f) == EXPECTED_UNITS
+    js_source = (tmp_path / "unit_data.js").read_text(encoding="utf-8")
+    assert extract_js_var(js_source, "unit_data") == EXPECTED_UNITS